@@ -0,0 +1,81 @@
+"""
+File Benchmark: `File` Read / Write / Copy and `JSON`, `CSV`, `BIN` Round-Trips at Several Sizes.
+
+    python benchmarks/bench_file.py [small medium large]
+"""
+
+# Import Modules
+import os, sys, tempfile
+import numpy as np
+import pandas as pd
+from utils.file import TXT, JSON, CSV, BIN
+import harness
+
+
+def frame(rows:int) -> pd.DataFrame:
+    """Synthetic Table of Mixed Columns
+
+    :param rows: Number of Rows
+    :type rows: int
+    :return: Table with Integer, Float and String Columns
+    :rtype: pd.DataFrame
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "id":np.arange(rows)
+        , "value":rng.normal(size=rows)
+        , "label":rng.choice(["alpha", "beta", "gamma"], size=rows)
+    })
+
+def sizeCases(size:str, directory:str):
+    """TXT Write, Read and Copy of a Numbered Text, then JSON, CSV and BIN Round-Trips of a Synthetic Table
+
+    JSON is Capped at 100,000 Records, and BIN is Timed Compressed and Raw; only the TXT Cases Report a Throughput.
+
+    :param size: Size Name of `harness.SIZES`, the Number of Lines and Rows
+    :type size: str
+    :param directory: Scratch Folder for the Files
+    :type directory: str
+    :return: `(name, function, setup, nbytes)` Tuples
+    :rtype: Iterator[tuple]
+    """
+
+    rows = harness.SIZES[size]
+    df = frame(rows)
+
+    # Plain Text Read, Write and Copy
+    text = "\n".join(f"line {i} of the benchmark" for i in range(rows))
+    txt = TXT(os.path.join(directory, f"{size}.txt"))
+    nbytes = len(text.encode())
+    yield f"TXT.write[{size}]", lambda: txt.write(text), None, nbytes
+    yield f"TXT.read[{size}]", txt.read, None, nbytes
+    yield f"TXT.copy[{size}]", lambda: txt.copy(os.path.join(directory, f"{size}-copy.txt")), None, nbytes
+
+    # JSON Round-Trip
+    records = {"records":df.head(min(rows, 100_000)).to_dict("records")}
+    jsonFile = JSON(os.path.join(directory, f"{size}.json"))
+    yield f"JSON.roundtrip[{size}]", lambda: (jsonFile.write(records), jsonFile.read()), None, None
+
+    # CSV Round-Trip
+    csv = CSV(os.path.join(directory, f"{size}.csv"))
+    yield f"CSV.roundtrip[{size}]", lambda: (csv.write(df), csv.read()), None, None
+
+    # BIN Round-Trip, Compressed and Raw
+    binFile = BIN(os.path.join(directory, f"{size}.bin"))
+    yield f"BIN.roundtrip[{size}]", lambda: (binFile.write(df), binFile.read()), None, None
+    yield f"BIN.roundtrip.raw[{size}]", lambda: (binFile.write(df, False), binFile.read()), None, None
+
+# Cases at every Size Asked for
+cases = harness.bySize(sizeCases)
+
+def main(sizes:list) -> None:
+    """Print the Time of each Case
+
+    :param sizes: Size Names of `harness.SIZES`
+    :type sizes: list
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        harness.run(cases(sizes, directory))
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["small", "medium"])
@@ -0,0 +1,79 @@
+"""
+Folder Benchmark: `Folder.copy` on Synthetic Trees, One File at a Time and with Threads.
+
+    python benchmarks/bench_folder.py [small medium large]
+"""
+
+# Import Modules
+import os, shutil, sys, tempfile
+from utils.folder import Folder
+import harness
+
+# Files per Tree, and Bytes per File, by Size Name
+TREES = {
+    "small":(100, 4 * 1024)
+    , "medium":(1_000, 16 * 1024)
+    , "large":(5_000, 64 * 1024)
+}
+
+def tree(directory:str, files:int, fileSize:int, width:int = 10) -> int:
+    """Build a Synthetic Tree of Nested Folders
+
+    :param directory: Root of the Tree
+    :type directory: str
+    :param files: Number of Files
+    :type files: int
+    :param fileSize: Bytes per File
+    :type fileSize: int
+    :param width: Files per Folder, defaults to 10
+    :type width: int, optional
+    :return: Total Bytes Written
+    :rtype: int
+    """
+    payload = os.urandom(fileSize)
+    for i in range(files):
+        # Folders Nest Two Levels Deep
+        folder = os.path.join(directory, f"d{i // (width * width)}", f"d{i // width}")
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"f{i}.bin"), "wb") as file:
+            file.write(payload)
+    return files * fileSize
+
+def sizeCases(size:str, directory:str):
+    """`Folder.copy` of a Synthetic Tree, One File at a Time and on 8 Threads
+
+    The Tree is Built once, Untimed, and each Repeat Copies into an Empty Destination.
+
+    :param size: Size Name of `TREES`, the Number of Files and their Size
+    :type size: str
+    :param directory: Scratch Folder for the Trees
+    :type directory: str
+    :return: `(name, function, setup, nbytes)` Tuples
+    :rtype: Iterator[tuple]
+    """
+
+    source = os.path.join(directory, size)
+    destination = os.path.join(directory, f"{size}-copy")
+    nbytes = tree(source, *TREES[size])
+    folder = Folder(source, False)
+
+    # Every Repeat Copies into an Empty Destination
+    clear = lambda: shutil.rmtree(destination, ignore_errors=True)
+
+    yield f"Folder.copy[{size}]", lambda: folder.copy(destination), clear, nbytes
+    yield f"Folder.copy.workers[{size}]", lambda: folder.copy(destination, workers=8), clear, nbytes
+
+# Cases at every Size Asked for
+cases = harness.bySize(sizeCases)
+
+def main(sizes:list) -> None:
+    """Print the Time of each Case
+
+    :param sizes: Size Names of `TREES`
+    :type sizes: list
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        harness.run(cases(sizes, directory))
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["small", "medium"])
@@ -0,0 +1,54 @@
+"""
+Import Benchmark: Startup Cost of `import utils` and its Submodules, each in a Fresh Interpreter.
+
+    python benchmarks/bench_import.py [budget in ms]
+
+Exits with `1` when `import utils` costs more than the budget over a bare interpreter.
+"""
+
+# Import Modules
+import subprocess, sys
+import harness
+
+# Statements Timed in a Fresh Interpreter
+STATEMENTS = {
+    "import.python":"pass"
+    , "import.utils":"import utils"
+    , "import.utils.functions":"import utils.functions"
+    , "import.utils.file":"import utils.file"
+    , "import.utils.math":"import utils.math"
+    , "import.utils.folder":"import utils.folder"
+}
+
+# Budget of `import utils` over a Bare Interpreter, in Milliseconds
+BUDGET = 50.0
+
+def cases(sizes:list = None, directory:str = None):
+    """Each Statement of `STATEMENTS` Run in a New Interpreter, so no Module is Cached; Sizes do not Apply
+
+    :param sizes: Unused, for the Signature of the Other Suites
+    :type sizes: list, optional
+    :param directory: Unused, for the Signature of the Other Suites
+    :type directory: str, optional
+    :return: `(name, function, setup, nbytes)` Tuples
+    :rtype: Iterator[tuple]
+    """
+    for name, statement in STATEMENTS.items():
+        command = [sys.executable, "-c", statement]
+        yield name, lambda command=command: subprocess.run(command, check=True), None, None
+
+def main(budget:float = BUDGET) -> int:
+    """Print the Time of each Import and Check `import utils` against the Budget
+
+    :param budget: Milliseconds Allowed over a Bare Interpreter, defaults to BUDGET
+    :type budget: float, optional
+    :return: Exit Code, `1` when over Budget
+    :rtype: int
+    """
+    results = harness.run(cases(), repeat=10)
+    cost = (results["import.utils"]["min"] - results["import.python"]["min"]) * 1e3
+    print(f"import utils costs {cost:.1f} ms over a bare interpreter (budget {budget:.0f} ms)")
+    return 1 if cost > budget else 0
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET))
@@ -0,0 +1,101 @@
+"""
+Math Kernel Benchmark: `utils.math` Kernels against the Naive Versions they Replace.
+
+    python benchmarks/bench_math.py [size]
+"""
+
+# Import Modules
+import math, sys, time
+from functools import partial
+import numpy as np
+from utils import math as kernels
+import harness
+
+
+def naiveSoftmax(x:list) -> list:
+    """Softmax in Pure Python
+
+    :param x: Values
+    :type x: list
+    :return: Softmax Values
+    :rtype: list
+    """
+    shift = max(x)
+    exps = [math.exp(v - shift) for v in x]
+    total = sum(exps)
+    return [v / total for v in exps]
+
+# Naive Versions, as Hand-Rolled in Projects
+NAIVE = {
+    "sigmoid": lambda x: [1 / (1 + math.exp(-v)) if v > -700 else 0.0 for v in x]
+    , "logSigmoid": lambda x: [-math.log1p(math.exp(-v)) if v > -700 else v for v in x]
+    , "tanh": lambda x: [math.tanh(v) for v in x]
+    , "relu": lambda x: [max(v, 0.0) for v in x]
+    , "softmax": naiveSoftmax
+    , "logSumExp": lambda x: math.log(sum(math.exp(v) for v in x))
+    , "movingAverage": lambda x: [sum(x[i:i + 50]) / 50 for i in range(len(x) - 49)]
+}
+
+# Kernels of `utils.math`
+KERNELS = {
+    "sigmoid": kernels.sigmoid
+    , "logSigmoid": kernels.logSigmoid
+    , "tanh": kernels.tanh
+    , "relu": kernels.relu
+    , "softmax": kernels.softmax
+    , "logSumExp": kernels.logSumExp
+    , "movingAverage": lambda x: kernels.movingAverage(x, 50)
+}
+
+def best(function, value, repeat:int = 5) -> float:
+    """Best Time of Several Runs
+
+    :param function: Function to Time
+    :type function: Callable
+    :param value: Argument of the Function
+    :type value: Any
+    :param repeat: Number of Runs, defaults to 5
+    :type repeat: int, optional
+    :return: Best Time in Seconds
+    :rtype: float
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(value)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def cases(sizes:list):
+    """Every Kernel of `KERNELS` on the Same Normal Sample, Throughput over the Input Bytes
+
+    :param sizes: Size Names of `harness.SIZES`, the Number of Elements
+    :type sizes: list
+    :return: `(name, function, setup, nbytes)` Tuples
+    :rtype: Iterator[tuple]
+    """
+    for size in sizes:
+        x = np.random.default_rng(0).normal(scale=10, size=harness.SIZES[size])
+        for name, kernel in KERNELS.items():
+            yield f"math.{name}[{size}]", partial(kernel, x), None, x.nbytes
+
+def main(size:int = 1_000_000) -> None:
+    """Print the Time of each Kernel against its Naive Version
+
+    :param size: Number of Values, defaults to 1_000_000
+    :type size: int, optional
+    """
+    
+    x = np.random.default_rng(0).normal(scale=10, size=size)
+    values = x.tolist()
+    
+    print(f"size={size} accelerator={kernels.ACCELERATOR}")
+    print(f"{'kernel':<15}{'naive (s)':>12}{'utils (s)':>12}{'speedup':>10}")
+    
+    for name, kernel in KERNELS.items():
+        naive = best(NAIVE[name], values, 1)
+        fast = best(kernel, x)
+        print(f"{name:<15}{naive:>12.4f}{fast:>12.4f}{naive / fast:>9.1f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,191 @@
+"""
+Benchmark Harness: Times Cases, Stores the Results as JSON and Compares two Runs.
+
+A case is a `(name, function, setup, nbytes)` tuple: `setup` runs untimed before every repeat, and `nbytes` turns the timings into a throughput.
+"""
+
+# Import Modules
+import json, os, platform, statistics, subprocess, sys, time
+from typing import Callable, Iterable
+
+__all__ = [
+    "RESULTS_DIRECTORY"
+    , "SIZES"
+    , "bySize"
+    , "measure"
+    , "run"
+    , "environment"
+    , "save"
+    , "load"
+    , "compare"
+]
+
+# Results are Stored Next to the Benchmarks
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Number of Rows / Elements by Size Name
+SIZES = {
+    "small":1_000
+    , "medium":100_000
+    , "large":1_000_000
+}
+
+def bySize(sizeCases:Callable) -> Callable:
+    """Cases of a Suite at Several Sizes, from its Cases at One Size
+
+    :param sizeCases: Called with a Size Name and a Scratch Folder, Returns the Cases at that Size
+    :type sizeCases: Callable
+    :return: Called with the Size Names and a Scratch Folder, Chains the Cases of every Size
+    :rtype: Callable
+    """
+
+    def cases(sizes:list, directory:str):
+        for size in sizes:
+            yield from sizeCases(size, directory)
+
+    return cases
+
+def measure(function:Callable, setup:Callable = None, repeat:int = 5) -> dict:
+    """Time a Function over Several Repeats
+
+    :param function: Function to Time, called without Arguments
+    :type function: Callable
+    :param setup: Untimed Function called before each Repeat, defaults to None
+    :type setup: Callable, optional
+    :param repeat: Number of Repeats, defaults to 5
+    :type repeat: int, optional
+    :return: `min`, `median`, `mean` and `stdev` in Seconds and the `repeat`
+    :rtype: dict
+    """
+
+    times = []
+    for _ in range(repeat):
+        if setup is not None: setup()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return {
+        "min":min(times)
+        , "median":statistics.median(times)
+        , "mean":statistics.fmean(times)
+        , "stdev":statistics.stdev(times) if len(times) > 1 else 0.0
+        , "repeat":repeat
+    }
+
+def run(cases:Iterable[tuple], repeat:int = 5, verbose:bool = True) -> dict:
+    """Time every Case
+
+    :param cases: `(name, function, setup, nbytes)` Tuples
+    :type cases: Iterable[tuple]
+    :param repeat: Number of Repeats per Case, defaults to 5
+    :type repeat: int, optional
+    :param verbose: Print each Case when Done, defaults to True
+    :type verbose: bool, optional
+    :return: Timings by Case Name
+    :rtype: dict
+    """
+
+    results = {}
+    for name, function, setup, nbytes in cases:
+        result = measure(function, setup, repeat)
+
+        # Throughput from the Best Run
+        if nbytes: result["MBps"] = nbytes / result["min"] / 1e6
+        results[name] = result
+
+        if verbose:
+            throughput = f"{result['MBps']:>10.1f} MB/s" if nbytes else ""
+            print(f"{name:<40}{result['min'] * 1e3:>12.3f} ms{throughput}")
+
+    return results
+
+def environment() -> dict:
+    """Describe the Machine and the Version being Benchmarked
+
+    :return: `python`, `platform`, `machine`, `cpus` and the git `commit` when available
+    :rtype: dict
+    """
+
+    # Commit of the Tree being Benchmarked
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"]
+            , capture_output=True, text=True, check=True
+            , cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "python":sys.version.split()[0]
+        , "platform":platform.platform()
+        , "machine":platform.machine()
+        , "cpus":os.cpu_count()
+        , "commit":commit
+    }
+
+def save(results:dict, directory:str = None) -> str:
+    """Store the Results of a Run with its Environment
+
+    :param results: Timings by Case Name
+    :type results: dict
+    :param directory: Location of the JSON File, defaults to `results/<commit>-<timestamp>.json`
+    :type directory: str, optional
+    :return: Directory of the JSON File
+    :rtype: str
+    """
+
+    env = environment()
+    if directory is None:
+        os.makedirs(RESULTS_DIRECTORY, exist_ok=True)
+        name = f"{env['commit'] or 'local'}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        directory = os.path.join(RESULTS_DIRECTORY, name)
+
+    with open(directory, "w") as file:
+        json.dump({"environment":env, "time":time.time(), "results":results}, file, indent=2)
+
+    return directory
+
+def load(directory:str) -> dict:
+    """Load a Stored Run
+
+    :param directory: Location of the JSON File
+    :type directory: str
+    :return: `environment`, `time` and `results`
+    :rtype: dict
+    """
+    with open(directory) as file:
+        return json.load(file)
+
+def compare(old:dict, new:dict, threshold:float = 0.10, verbose:bool = True) -> dict:
+    """Compare the Best Times of two Runs
+
+    :param old: Baseline Run, as returned by `load`
+    :type old: dict
+    :param new: Candidate Run, as returned by `load`
+    :type new: dict
+    :param threshold: Relative Change Flagged as a Regression or an Improvement, defaults to 0.10
+    :type threshold: float, optional
+    :param verbose: Print the Comparison, defaults to True
+    :type verbose: bool, optional
+    :return: Ratio `new / old` by Case, and the `regressions` and `improvements` Case Names
+    :rtype: dict
+    """
+
+    ratios = {}
+    for name in old["results"].keys() & new["results"].keys():
+        ratios[name] = new["results"][name]["min"] / old["results"][name]["min"]
+
+    summary = {
+        "ratios":ratios
+        , "regressions":sorted(name for name, ratio in ratios.items() if ratio > 1 + threshold)
+        , "improvements":sorted(name for name, ratio in ratios.items() if ratio < 1 - threshold)
+    }
+
+    if verbose:
+        for name in sorted(ratios):
+            flag = "regression" if name in summary["regressions"] else "improvement" if name in summary["improvements"] else ""
+            print(f"{name:<40}{ratios[name]:>8.2f}x  {flag}")
+
+    return summary
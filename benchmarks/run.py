@@ -0,0 +1,61 @@
+"""
+Benchmark Runner: Runs the Suites, Stores the Results and Compares Runs.
+
+    python benchmarks/run.py                        # small and medium sizes of every suite
+    python benchmarks/run.py --suite file math --size large
+    python benchmarks/run.py --compare results/OLD.json results/NEW.json
+    python benchmarks/run.py --compare results/OLD.json   # against a fresh run
+"""
+
+# Import Modules
+import argparse, sys, tempfile
+import harness, bench_file, bench_folder, bench_import, bench_math
+
+# Cases of each Suite, from the Size Names and a Scratch Folder
+SUITES = {
+    "file":bench_file.cases
+    , "folder":bench_folder.cases
+    , "math":lambda sizes, directory: bench_math.cases(sizes)
+    , "import":bench_import.cases
+}
+
+def main(argv:list = None) -> int:
+    """Run the Benchmarks from the Command Line
+
+    :param argv: Command Line Arguments, defaults to `sys.argv[1:]`
+    :type argv: list, optional
+    :return: Exit Code, `1` when a Comparison finds Regressions
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the utils package")
+    parser.add_argument("--suite", nargs="+", choices=list(SUITES), default=list(SUITES))
+    parser.add_argument("--size", nargs="+", choices=list(harness.SIZES), default=["small", "medium"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON file of the results, defaults to results/<commit>-<timestamp>.json")
+    parser.add_argument("--compare", nargs="+", metavar="RESULTS", help="Baseline, and optionally a candidate, to compare")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change flagged, defaults to 0.10")
+    args = parser.parse_args(argv)
+
+    # Compare two Stored Runs without Benchmarking
+    if args.compare and len(args.compare) > 1:
+        summary = harness.compare(harness.load(args.compare[0]), harness.load(args.compare[1]), args.threshold)
+        return 1 if summary["regressions"] else 0
+
+    # Run the Suites
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for suite in args.suite:
+            results.update(harness.run(SUITES[suite](args.size, directory), args.repeat))
+
+    print(f"Saved {harness.save(results, args.output)}")
+
+    # Compare the Fresh Run against a Baseline
+    if args.compare:
+        summary = harness.compare(harness.load(args.compare[0]), {"results":results}, args.threshold)
+        return 1 if summary["regressions"] else 0
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+from unittest import TestCase
+import unittest
+from utils import batch
+import os
+
+class TestBatch(TestCase):
+
+    def test_many(self):
+
+        data = {f"batch{i}.json":{"i":i} for i in range(10)}
+        data["batch.txt"] = "text"
+
+        # Write Many Files, Creating them
+        summary = batch.writeMany(data, workers=3)
+        self.assertEqual(summary["errors"], {})
+        self.assertEqual(len(summary["results"]), 11)
+
+        # Read in Order, Errors Collected by File
+        paths = list(data) + ["missing.json"]
+        summary = batch.readMany(paths, workers=3)
+        self.assertEqual(summary["results"][:-1], list(data.values()))
+        self.assertIsNone(summary["results"][-1])
+        self.assertEqual(list(summary["errors"]), ["missing.json"])
+
+        # Read on Processes
+        summary = batch.readMany(paths[:10], workers=2, processes=True)
+        self.assertEqual(summary["results"], [{"i":i} for i in range(10)])
+
+        # Delete Many Files
+        summary = batch.deleteMany(paths)
+        self.assertEqual(list(summary["errors"]), ["missing.json"])
+        self.assertFalse(any(os.path.exists(path) for path in data))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -70,6 +70,62 @@ class TestCSV(TestCase):
         # Deletes File
         os.remove(f.directory)    
    
+
+    def test_iterChunks(self):
+        
+        # Create Test File & Creates the File
+        f = file.CSV()
+        
+        # Empty Files give a Single Empty Chunk
+        chunks = list(f.iterChunks())
+        self.assertEqual(len(chunks), 1)
+        self.assertTrue(chunks[0].empty)
+        
+        # Write to File
+        df = pandas.DataFrame({"a":range(10), "b":range(10, 20)})
+        f.write(df)
+        
+        # Read the File in Chunks of Selected Columns
+        chunks = list(f.iterChunks(chunkSize=4, usecols=["b"], dtype={"b":"float64"}))
+        self.assertEqual([len(c) for c in chunks], [4, 4, 2])
+        pandas.testing.assert_frame_equal(pandas.concat(chunks), df[["b"]].astype("float64"))
+        
+        # Deletes File
+        os.remove(f.directory)
+
+    def test_append(self):
+        
+        # Create Test File & Creates the File
+        f = file.CSV()
+        
+        # Append to the Empty File then Append Rows
+        f.append(pandas.DataFrame({"a":[1, 2]}))
+        f.append(pandas.DataFrame({"a":[3]}, index=[2]))
+        
+        # Read File
+        pandas.testing.assert_frame_equal(f.read(), pandas.DataFrame({"a":[1, 2, 3]}))
+        
+        # Columns must Match the Header
+        with self.assertRaises(ValueError):
+            f.append(pandas.DataFrame({"b":[4]}))
+        
+        # Deletes File
+        os.remove(f.directory)
+
+    def test_compression(self):
+        
+        # Create Compressed Test File & Creates the File
+        f = file.CSV("new.csv.gz")
+        self.assertEqual(f.compression, "gzip")
+        self.assertTrue(f.read().empty)
+        
+        # Write and Append through the Codec
+        f.write(pandas.DataFrame({"a":[1]}))
+        f.append(pandas.DataFrame({"a":[2]}, index=[1]))
+        pandas.testing.assert_frame_equal(f.read(), pandas.DataFrame({"a":[1, 2]}))
+        
+        # Deletes File
+        os.remove(f.directory)
         
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,115 @@
+from unittest import TestCase, mock
+import unittest
+from utils import dataset
+import os
+import shutil
+import pandas
+
+class TestDataset(TestCase):
+
+    def setUp(self):
+        self.df = pandas.DataFrame({
+            "year":[2022, 2022, 2023, 2023, 2024]
+            , "region":["eu", "us", "eu", "us", "eu"]
+            , "value":[1.0, 2.0, 3.0, 4.0, 5.0]
+        })
+
+    def check(self, format):
+        # Partitioned Write, Split by Keys and Shard Size
+        d = dataset.Dataset("dataset", format)
+        paths = d.write(self.df, partitionBy=["year", "region"], maxRows=1)
+        self.assertEqual(len(paths), 5)
+        self.assertTrue(os.path.isdir(f"{d.directory}/year=2023/region=us"))
+
+        # Full Read, Partition Keys as Columns
+        data = d.read(workers=2).sort_values("value", ignore_index=True)
+        pandas.testing.assert_frame_equal(data[["year", "region", "value"]], self.df)
+
+        # Partition Pruning and Column Selection
+        self.assertEqual(len(d.shards([("year", ">=", 2023), ("region", "==", "eu")])), 2)
+        data = d.read(columns=["value", "year"], filters=[("region", "in", ["us"])])
+        self.assertEqual(list(data.columns), ["value", "year"])
+        self.assertEqual(sorted(data["value"]), [2.0, 4.0])
+
+        # Lazy Chunks
+        chunks = list(d.iterChunks(chunkSize=1, filters=[("year", "==", 2022)]))
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(set(pandas.concat(chunks)["region"]), {"eu", "us"})
+
+        # Overwrite Replaces every Shard
+        d.write(self.df.head(2), mode="overwrite")
+        self.assertEqual(len(d), 1)
+        self.assertEqual(len(d.read()), 2)
+        self.assertFalse(os.path.exists(f"{d.directory}/year=2022"))
+
+        # Deletes Folder
+        shutil.rmtree(d.directory)
+
+    def test_csv(self):
+        self.check("csv")
+
+    def test_parquet(self):
+        self.check("parquet")
+
+    def test_partitions(self):
+        # Null Partitions and Hidden Folders
+        d = dataset.Dataset("dataset")
+        df = pandas.DataFrame({"year":[2023, None, 2024], "region":["nan", "1e3", "007"], "value":[1.0, 2.0, 3.0]})
+        d.write(df, partitionBy=["year", "region"])
+        os.makedirs(f"{d.directory}/_temporary/year=2024")
+        os.makedirs(f"{d.directory}/.hidden")
+        for folder in ("_temporary/year=2024", ".hidden"):
+            self.df.to_csv(f"{d.directory}/{folder}/part.csv", index=False)
+        self.assertEqual(len(d), 3)
+
+        # Numeric Looking Strings and Leading Zeros Stay Strings
+        self.assertEqual(sorted(d.read()["region"]), ["007", "1e3", "nan"])
+        self.assertEqual(len(d.shards([("region", "==", "007")])), 1)
+
+        # Null Partitions Fail Range Filters
+        data = d.read(filters=[("year", ">=", 2023)])
+        self.assertEqual(sorted(data["value"]), [1.0, 3.0])
+        self.assertEqual(len(d.shards([("year", "==", None)])), 1)
+
+        # Filters on Stored Columns are Rejected
+        with self.assertRaises(ValueError):
+            d.read(filters=[("value", ">", 1.0)])
+
+        # Overwrites Remove the Folders of the Old Shards, not Other Empty Folders
+        os.makedirs(f"{d.directory}/_staging")
+        d.write(df.head(1), mode="overwrite")
+        self.assertTrue(os.path.isdir(f"{d.directory}/_staging"))
+        self.assertFalse(os.path.exists(f"{d.directory}/year=2024"))
+
+        # Deletes Folder
+        shutil.rmtree(d.directory)
+
+    def test_failed_overwrite(self):
+        # A Failed Overwrite Keeps the Previous Shards and Removes the New Ones
+        d = dataset.Dataset("dataset")
+        d.write(self.df, partitionBy="year")
+        write = dataset.CSV.write
+        calls = []
+        def failing(self, *args, **kwargs):
+            calls.append(self.directory)
+            if len(calls) == 2: raise OSError(28, "No space left on device")
+            return write(self, *args, **kwargs)
+        with mock.patch.object(dataset.CSV, "write", failing):
+            with self.assertRaises(OSError):
+                d.write(self.df, partitionBy="region", mode="overwrite", workers=1)
+        self.assertEqual(len(d), 3)
+        self.assertFalse(os.path.exists(f"{d.directory}/region=eu"))
+        pandas.testing.assert_frame_equal(d.read().sort_values("value", ignore_index=True)[["year", "region", "value"]], self.df)
+
+        # Deletes Folder
+        shutil.rmtree(d.directory)
+
+    def test_compressed(self):
+        d = dataset.Dataset("dataset", compression="gzip")
+        paths = d.write(self.df, partitionBy="region")
+        self.assertTrue(all(path.endswith(".csv.gz") for path in paths))
+        self.assertEqual(sorted(d.read()["value"]), list(self.df["value"]))
+        shutil.rmtree(d.directory)
+
+if __name__ == '__main__':
+    unittest.main()
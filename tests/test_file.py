@@ -1,7 +1,8 @@
 from unittest import TestCase
 import unittest
 from utils import file
-import os
+import os, shutil
+import numpy
 
 
 
@@ -81,6 +82,82 @@ class TestFile(TestCase):
         # Deletes File
         os.remove(f.directory)
         
+    def test_mmap(self):
+        
+        # Create Test File & Creates the File
+        f = file.File()
+        
+        # Empty Files Map to an Empty View
+        self.assertEqual(bytes(f.read("mmap")), b"")
+        
+        # Map the Written Data
+        f.write("Hello World")
+        with f.mmap() as data:
+            self.assertEqual(data[:5], b"Hello")
+        self.assertEqual(f.read("bytes"), b"Hello World")
+        
+        # Deletes File
+        os.remove(f.directory)
+        
+    def test_bin_mmap(self):
+        
+        # Create Test File & Creates the File
+        f = file.BIN()
+        
+        # Arrays in Uncompressed Files are Memory Mapped
+        f.write({"array": numpy.arange(1000)}, compress=False)
+        data = f.read(mmapMode="r")
+        self.assertIsInstance(data["array"], numpy.memmap)
+        self.assertEqual(int(data["array"].sum()), 499500)
+        
+        # Deletes File
+        del data
+        os.remove(f.directory)
+        
+    def test_iterLines(self):
+        
+        # Create Test File & Creates the File
+        f = file.TXT()
+        
+        # Read Lines of the File
+        f.write("first\nsecond\nthird")
+        self.assertEqual(list(f.iterLines()), ["first", "second", "third"])
+        self.assertEqual(next(f.iterLines(True)), "first\n")
+        
+        # Append Lines after a Last Line without Ending
+        f.append(["fourth", "fifth\n"])
+        f.append("sixth")
+        self.assertEqual(list(f.iterLines())[2:], ["third", "fourth", "fifth", "sixth"])
+        
+        # Deletes File
+        os.remove(f.directory)
+        
+    def test_compression(self):
+        
+        for suffix in ("gz", "bz2", "xz"):
+            
+            # Create Compressed Test File & Creates the File
+            f = file.TXT(f"new.txt.{suffix}")
+            self.assertEqual(f.extension, "txt")
+            self.assertEqual(f.read(), "")
+            
+            # Write and Append through the Codec
+            f.write("first\n")
+            f.append(["second", "third"])
+            self.assertEqual(list(f.iterLines()), ["first", "second", "third"])
+            
+            # Append Lines after a Last Line without Ending
+            f.write("first")
+            f.append("second")
+            self.assertEqual(list(f.iterLines()), ["first", "second"])
+            
+            # Content is Compressed on Disk
+            with open(f.directory, "rb") as handle:
+                self.assertNotEqual(handle.read(), b"first\nsecond\n")
+            
+            # Deletes File
+            os.remove(f.directory)
+        
     def test_write(self):
         
         # Create Test File & Creates the File
@@ -126,6 +203,56 @@ class TestFile(TestCase):
         
         # Deletes File
         os.remove(f.directory)
+
+    def test_copy(self):
+        
+        # Create Test File with Binary Data
+        f = file.File()
+        data = bytes(range(256)) * 4096
+        with open(f.directory, "wb") as handle:
+            handle.write(data)
+        
+        # Copy File
+        os.utime(f.directory, (1000000000, 1000000000))
+        f.copy("copy.txt", metadata=True)
+        
+        # Check Copy is Identical
+        with open("copy.txt", "rb") as handle:
+            self.assertEqual(handle.read(), data)
+        self.assertEqual(os.stat("copy.txt").st_mtime, 1000000000)
+        
+        # Copying onto Itself or a Hardlink Keeps the Data
+        os.link("copy.txt", "link.txt")
+        for source, target in ((f.directory, f.directory), ("copy.txt", "link.txt")):
+            with self.assertRaises(shutil.SameFileError):
+                file.File(source, creation=False).copy(target)
+            with open(source, "rb") as handle:
+                self.assertEqual(handle.read(), data)
+        
+        # Deletes Files
+        os.remove(f.directory)
+        os.remove("copy.txt")
+        os.remove("link.txt")
          
+    def test_async(self):
+        import asyncio
+
+        async def roundtrip():
+            # Write, Read, Copy and Delete without Blocking the Loop
+            j = file.JSON("async.json")
+            await j.awrite({"a":[1, 2, 3]})
+            data = await j.aread()
+            await j.acopy("asyncCopy.json")
+            copied = await file.JSON("asyncCopy.json", False).aread()
+            await j.adelete()
+            await file.JSON("asyncCopy.json", False).adelete()
+            return data, copied
+
+        data, copied = asyncio.run(roundtrip())
+        self.assertEqual(data, {"a":[1, 2, 3]})
+        self.assertEqual(copied, data)
+        self.assertFalse(os.path.exists("async.json"))
+        self.assertFalse(os.path.exists("asyncCopy.json"))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
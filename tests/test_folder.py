@@ -1,5 +1,6 @@
 import unittest
-from utils import  folder
+from unittest import mock
+from utils import  folder, functions
 import os
 import shutil
 
@@ -94,6 +95,18 @@ class TestFolder(unittest.TestCase):
         # Deletes Folder
         shutil.rmtree(f.directory)
  
+    def test_move_timed(self):
+        # Create Test Folder & Creates the Folder
+        f = folder.Folder("new")
+        
+        # Each Move is Timed Once
+        functions.resetTimings()
+        f.move("testFolder")
+        self.assertEqual(functions.timings("Folder.move")["count"], 1)
+        
+        # Deletes Folder
+        shutil.rmtree(f.directory)
+ 
     def test_fileExist(self):
         # Create Test Folder & Creates the Folder
         f = folder.Folder("new")
@@ -106,6 +119,304 @@ class TestFolder(unittest.TestCase):
         
         # Deletes Folder
         shutil.rmtree(f.directory)
+
+    def test_copy(self):
+        # Create Test Folder with Nested Content
+        f = folder.Folder("new")
+        os.makedirs(f.directory + "/sub")
+        with open(f.directory + "/data.bin", "wb") as handle:
+            handle.write(b"\x00\xff" * 1000)
+        with open(f.directory + "/sub/Makefile", "w") as handle:
+            handle.write("all:")
+        
+        # Copy Folder
+        summary = f.copy("copyFolder")
+        
+        # Check the Content was Copied
+        with open("copyFolder/data.bin", "rb") as handle:
+            self.assertEqual(handle.read(), b"\x00\xff" * 1000)
+        self.assertTrue(os.path.isfile("copyFolder/sub/Makefile"))
+        self.assertEqual(summary["files"], 2)
+        self.assertEqual(summary["bytes"], 2004)
+        
+        # Copy Folder with Threads
+        summary = f.copy("copyThreads", workers=4)
+        
+        # Check the Content was Copied
+        self.assertTrue(os.path.isfile("copyThreads/sub/Makefile"))
+        self.assertEqual(summary["files"], 2)
+        self.assertEqual(summary["errors"], {})
+        
+        # Links to Parent Folders are Copied as Links, not Walked
+        os.symlink("..", f.directory + "/sub/parent")
+        
+        # Every Link is Recreated, even a Dangling One
+        os.symlink("missing", f.directory + "/dangling")
+        summary = f.copy("copyLinks")
+        self.assertEqual(os.readlink("copyLinks/sub/parent"), "..")
+        self.assertEqual(os.readlink("copyLinks/dangling"), "missing")
+        self.assertEqual(summary["files"], 4)
+        self.assertEqual(summary["errors"], {})
+        
+        # Failures Raise on Both Paths, or are Collected when Ignored
+        def failing(source, destination, *args):
+            raise OSError(5, "Input/output error", source)
+        with mock.patch.object(folder, "copyFile", failing):
+            for workers in (None, 2):
+                with self.assertRaises(shutil.Error):
+                    f.copy("copyErrors", workers=workers)
+                shutil.rmtree("copyErrors")
+                summary = f.copy("copyErrors", workers=workers, ignoreErrors=True)
+                self.assertEqual(len(summary["errors"]), 2)
+                shutil.rmtree("copyErrors")
+        
+        # Deletes Folders
+        shutil.rmtree(f.directory)
+        for name in ("copyFolder", "copyThreads", "copyLinks"): shutil.rmtree(name)
+
+    def test_walk(self):
+        # Create Test Folder with Nested Content
+        f = folder.Folder("new")
+        os.makedirs(f.directory + "/sub/deep")
+        for name in ("a.csv", "b.txt", "sub/c.csv", "sub/deep/d.csv"):
+            open(f"{f.directory}/{name}", "w").close()
+        
+        # Walk Everything
+        names = sorted(x.name for x in f.walk(folders=False))
+        self.assertEqual(names, ["a", "b", "c", "d"])
+        
+        # Walk with Filters and a Depth Limit
+        names = sorted(x.name for x in f.walk(extensions=[".csv"], maxDepth=1))
+        self.assertEqual(names, ["a", "c"])
+        
+        # Sub Folders that cannot be Read are Skipped, but not the Folder Itself
+        scandir = os.scandir
+        def denied(directory):
+            if directory.endswith(("/sub", "/missing")): raise PermissionError(13, "Permission denied", directory)
+            return scandir(directory)
+        with mock.patch.object(folder.os, "scandir", denied):
+            names = sorted(x.name for x in f.walk(folders=False))
+            self.assertEqual(names, ["a", "b"])
+            with self.assertRaises(PermissionError):
+                list(folder.Folder(f.directory + "/missing").walk())
+        os.rmdir(f.directory + "/missing")
+        
+        # Content without Recursion
+        items = list(f.iterContent(pattern="*.csv"))
+        self.assertEqual(len(items), 1)
+        self.assertEqual(type(items[0]).__name__, "CSV")
+        self.assertEqual(items[0].stat().st_size, 0)
+        
+        # Later Status Calls see Changes made after the Walk
+        item = next(iter(f.walk(pattern="b.txt")))
+        with open(item.directory, "w") as handle:
+            handle.write("changed")
+        item.stat()
+        self.assertEqual(item.stat().st_size, 7)
+        
+        # Writes Drop the Status Cached by the Walk
+        item = next(iter(f.walk(pattern="b.txt")))
+        item.write("written again")
+        self.assertEqual(item.stat().st_size, 13)
         
+        # Deletes Folder
+        shutil.rmtree(f.directory)
+        
+    def test_async(self):
+        import asyncio
+
+        # Create Test Folder with Nested Content
+        f = folder.Folder("new")
+        os.makedirs(f.directory + "/sub")
+        for i in range(20):
+            with open(f"{f.directory}/sub/{i}.txt", "w") as handle:
+                handle.write("x" * i)
+
+        async def walkAndCopy():
+            names = [item.name async for item in f.awalk(folders=False, batchSize=7)]
+            summary = await f.acopy("copyAsync", concurrency=4)
+            return names, summary
+
+        names, summary = asyncio.run(walkAndCopy())
+        self.assertEqual(sorted(names, key=int), [str(i) for i in range(20)])
+        self.assertEqual(summary["files"], 20)
+        self.assertEqual(summary["bytes"], sum(range(20)))
+        self.assertEqual(summary["errors"], {})
+        self.assertTrue(os.path.isfile("copyAsync/sub/19.txt"))
+
+        # Deletes Folders
+        shutil.rmtree(f.directory)
+        shutil.rmtree("copyAsync")
+
+    def test_sync(self):
+        # Create Test Folder with Nested Content
+        f = folder.Folder("new")
+        os.makedirs(f.directory + "/sub")
+        for name in ("a.txt", "sub/b.txt", "sub/c.txt"):
+            with open(f"{f.directory}/{name}", "w") as handle:
+                handle.write(name)
+
+        # First Sync Copies Everything
+        summary = f.sync("mirror")
+        self.assertEqual((summary["copied"], summary["unchanged"]), (3, 0))
+        self.assertEqual(sorted(f.manifest()), ["a.txt", "sub/b.txt", "sub/c.txt"])
+
+        # Second Sync Copies Nothing
+        summary = f.sync("mirror", workers=2)
+        self.assertEqual((summary["copied"], summary["unchanged"]), (0, 3))
+
+        # Only the Changed File is Copied, Orphans are Deleted on Request
+        with open(f"{f.directory}/sub/b.txt", "w") as handle:
+            handle.write("changed")
+        os.makedirs("mirror/old")
+        with open("mirror/old/orphan.txt", "w") as handle:
+            handle.write("orphan")
+        summary = f.sync("mirror", deleteOrphans=True)
+        self.assertEqual((summary["copied"], summary["unchanged"], summary["deleted"]), (1, 2, 1))
+        with open("mirror/sub/b.txt") as handle:
+            self.assertEqual(handle.read(), "changed")
+        self.assertFalse(os.path.exists("mirror/old"))
+
+        # Dangling Links are Left Out of the Manifest
+        os.symlink("missing.txt", f"{f.directory}/dangling.txt")
+        self.assertEqual(f.sync("mirror")["unchanged"], 3)
+        self.assertNotIn("dangling.txt", f.manifest())
+        os.remove(f"{f.directory}/dangling.txt")
+
+        # The Manifest is Written with the JSON Backend Chosen at Call Time
+        from utils import file
+        calls = []
+        encode, decode = file.JSON_BACKENDS["json"]
+        fake = (lambda data, compact: calls.append("encode") or encode(data, compact), lambda raw: calls.append("decode") or decode(raw))
+        with mock.patch.dict(file.JSON_BACKENDS, {"fake":fake}), mock.patch.object(file, "JSON_BACKEND", "fake"):
+            with open(f"{f.directory}/a.txt", "a") as handle:
+                handle.write("changed")
+            f.manifest()
+        self.assertEqual(calls, ["decode", "encode"])
+
+        # The Manifest is not User Data
+        self.assertTrue(os.path.isfile(f"{f.directory}/{folder.MANIFEST_NAME}"))
+        self.assertEqual(sorted(item.name for item in f.walk(folders=False)), ["a", "b", "c"])
+        self.assertEqual(f.stats()["files"], 3)
+        self.assertEqual(f.copy("copyFolder")["files"], 3)
+        self.assertFalse(os.path.exists(f"copyFolder/{folder.MANIFEST_NAME}"))
+
+        # Deletes Folders
+        shutil.rmtree(f.directory)
+        shutil.rmtree("mirror")
+        shutil.rmtree("copyFolder")
+
+    def test_stats(self):
+        # Create Test Folder with Nested Content and a Hardlink
+        f = folder.Folder("new")
+        os.makedirs(f.directory + "/sub/deep")
+        for name, size in (("a.csv", 10), ("b.txt", 300), ("sub/c.csv", 20), ("sub/deep/d", 5)):
+            with open(f"{f.directory}/{name}", "w") as handle:
+                handle.write("x" * size)
+        os.link(f"{f.directory}/b.txt", f"{f.directory}/sub/link.txt")
+
+        # Totals, Hardlink Counted Once
+        stats = f.stats(top=2, workers=2)
+        self.assertEqual((stats["files"], stats["folders"], stats["bytes"]), (4, 2, 335))
+        self.assertEqual(stats["byExtension"]["csv"], {"files":2, "bytes":30})
+        self.assertEqual(stats["byExtension"][""], {"files":1, "bytes":5})
+        self.assertEqual(stats["byDepth"][2], {"files":1, "bytes":5})
+        self.assertEqual([size for _, size in stats["largest"]], [300, 20])
+        self.assertEqual(f.du(apparent=True), 335)
+
+        # Files Resized in Place are Seen without the Cache
+        with open(f"{f.directory}/a.csv", "a") as handle:
+            handle.write("x" * 10)
+        self.assertEqual(f.stats()["bytes"], 345)
+
+        # Cached Folders are Rescanned once their Content Changes
+        self.assertEqual(f.stats(cache=True)["bytes"], 345)
+        with open(f"{f.directory}/sub/deep/e.txt", "w") as handle:
+            handle.write("y" * 7)
+        self.assertEqual(f.stats(cache=True)["bytes"], 352)
+
+        # Deletes Folder
+        shutil.rmtree(f.directory)
+
+    def test_bulk_delete(self):
+        # Create Test Folder with a Wide Tree
+        f = folder.Folder("new")
+        for i in range(5):
+            os.makedirs(f"{f.directory}/sub{i}/deep")
+            for j in range(100):
+                open(f"{f.directory}/sub{i}/deep/{j}.txt", "w").close()
+
+        # Dry Run Deletes Nothing
+        summary = f.delete(dryRun=True)
+        self.assertEqual((summary["files"], summary["folders"]), (500, 11))
+        self.assertTrue(os.path.isdir(f.directory))
+
+        # Parallel Delete with Progress
+        calls = []
+        summary = f.delete(workers=4, progress=lambda done, total: calls.append((done, total)))
+        self.assertEqual((summary["files"], summary["folders"], summary["errors"]), (500, 11, {}))
+        self.assertEqual(calls[-1], (511, 511))
+        self.assertFalse(os.path.exists("new"))
+
+    def test_delete_errors(self):
+        # Create Test Folder with a File that cannot be Deleted
+        f = folder.Folder("new")
+        for name in ("a.txt", "b.txt"):
+            open(f"{f.directory}/{name}", "w").close()
+        unlink = os.unlink
+        def failing(path, *args, **kwargs):
+            if path.endswith("b.txt"): raise PermissionError(13, "Permission denied", path)
+            return unlink(path, *args, **kwargs)
+
+        # Failures Raise by Default, or are Collected when Ignored
+        with mock.patch("os.unlink", failing):
+            with self.assertRaises(shutil.Error):
+                f.delete()
+            summary = f.delete(ignoreErrors=True)
+        self.assertIn(f"{f.directory}/b.txt", summary["errors"])
+        self.assertTrue(os.path.isfile(f"{f.directory}/b.txt"))
+
+        # Deletes Folder
+        shutil.rmtree(f.directory)
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) and os.stat("/dev/shm").st_dev != os.stat(".").st_dev, "No Second Device")
+    def test_move_cross_device(self):
+        # Create Test Folder with Content and a Link
+        f = folder.Folder("new")
+        os.makedirs(f.directory + "/sub")
+        with open(f.directory + "/sub/a.bin", "wb") as handle:
+            handle.write(os.urandom(10000))
+        os.symlink("sub/a.bin", f.directory + "/link")
+        destination = "/dev/shm/utils-move-test"
+
+        # Dry Run Reports the Copy
+        summary = f.move(destination, dryRun=True)
+        self.assertTrue(summary["crossDevice"])
+        self.assertEqual(summary["files"], 2)
+        self.assertFalse(os.path.exists(destination))
+
+        # Move Streams, Checks then Deletes
+        calls = []
+        summary = f.move(destination, verify="hash", progress=lambda done, total: calls.append(done))
+        self.assertEqual(summary["errors"], {})
+        self.assertEqual(summary["files"], 2)
+        self.assertFalse(os.path.exists("new"))
+        self.assertEqual(os.path.getsize(destination + "/sub/a.bin"), 10000)
+        self.assertTrue(os.path.islink(destination + "/link"))
+        self.assertEqual(f.directory, destination)
+
+        # Failed Copy Keeps the Folder and Removes the Partial Copy
+        def failing(source, destination, *args):
+            raise OSError(5, "Input/output error", source)
+        with mock.patch.object(folder, "copyFile", failing):
+            with self.assertRaises(shutil.Error):
+                f.move(os.path.abspath("moved"))
+        self.assertFalse(os.path.exists("moved"))
+        self.assertTrue(os.path.isfile(destination + "/sub/a.bin"))
+        self.assertEqual(f.directory, destination)
+
+        # Deletes Folder
+        shutil.rmtree(destination)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
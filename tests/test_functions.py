@@ -19,5 +19,73 @@ class TestFunctions(TestCase):
         sleep(5)
         d.end()
         
+    def test_duration_profiler(self):
+        
+        functions.resetTimings()
+        
+        # Nested Context Managers with a Lap
+        with functions.Duration("outer") as outer:
+            with functions.Duration("inner"):
+                sleep(0.01)
+            outer.lap("first")
+        
+        # Decorated Function
+        @functions.Duration("work")
+        def work():
+            return 1
+        
+        for _ in range(5): work()
+        
+        # Aggregates by Label
+        stats = functions.timings()
+        self.assertEqual(set(stats), {"outer", "outer/inner", "outer/first", "work"})
+        self.assertEqual(stats["work"]["count"], 5)
+        self.assertGreaterEqual(stats["outer/inner"]["min"], 0.01)
+        
+        # Ending Again Returns the Stored Result without Recording Twice
+        result = outer.end()
+        self.assertIs(result, outer.end())
+        self.assertEqual(functions.timings("outer")["count"], 1)
+        
+        # Milliseconds are the Remainder after the Seconds
+        self.assertLess(result["milliseconds"], 1000)
+
+    def test_registry(self):
+
+        import os, json
+        from utils.file import TXT
+
+        functions.resetTimings()
+
+        # File Operations are Recorded by Class and Method
+        file = TXT("registry.txt")
+        file.write("Hello")
+        file.read()
+        file.delete()
+        stats = functions.timings()
+        self.assertEqual(stats["TXT.write"]["count"], 1)
+        self.assertEqual(stats["TXT.read"]["buckets"]["+Inf"], 1)
+
+        # Prometheus Histogram
+        text = functions.REGISTRY.toPrometheus()
+        self.assertIn('utils_duration_seconds_count{op="TXT.write"} 1', text)
+        self.assertIn('le="+Inf"', text)
+
+        # JSON Export
+        functions.REGISTRY.export("registry.json")
+        with open("registry.json") as file:
+            self.assertIn("TXT.read", json.load(file)["timings"])
+        os.remove("registry.json")
+
+        # Concurrent Exports to One File do not Share a Temporary File
+        import threading
+        threads = [threading.Thread(target=functions.REGISTRY.export, args=("registry.json",)) for _ in range(8)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        with open("registry.json") as file:
+            self.assertIn("TXT.read", json.load(file)["timings"])
+        self.assertFalse([name for name in os.listdir(".") if name.startswith("registry.json.")])
+        os.remove("registry.json")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
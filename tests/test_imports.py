@@ -0,0 +1,31 @@
+from unittest import TestCase
+import unittest
+import os, subprocess, sys
+
+# Root of the Repository, so the Fresh Interpreter Finds `utils`
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loaded(statement:str, modules:list) -> list:
+    """Modules Loaded after Running a Statement in a Fresh Interpreter"""
+    script = f"import sys\n{statement}\nprint(','.join(m for m in {modules!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=ROOT).stdout
+    return [m for m in output.strip().split(",") if m]
+
+class TestImports(TestCase):
+
+    def test_lazy_imports(self):
+
+        heavy = ["pandas", "numpy", "joblib", "numexpr", "orjson", "utils.file", "utils.math"]
+
+        # Importing the Package Loads no Submodule and no Heavy Dependency
+        self.assertEqual(loaded("import utils", heavy), [])
+
+        # Importing the Submodules Defers the Third Party Imports
+        self.assertEqual(loaded("import utils.file, utils.folder, utils.math, utils.functions", heavy[:5]), [])
+
+        # First Use Imports the Dependency
+        self.assertEqual(loaded("import utils; utils.math.sigmoid([0.5])", ["numpy", "pandas"]), ["numpy"])
+        self.assertEqual(loaded("from utils import functions; functions.printSyntax('x', False)", heavy), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 from unittest import TestCase
 import unittest
 from utils import file
-import os
+import os, json
 
 
 class TestJSON(TestCase):
@@ -73,6 +73,89 @@ class TestJSON(TestCase):
         # Deletes File
         os.remove(f.directory)    
    
+
+    def test_atomic_write(self):
+        
+        # Create Test File & Creates the File
+        f = file.JSON()
+        f.durability = "dir"
+        f.write({"key":"value"})
+        
+        # Failed Write Leaves the File Untouched
+        with self.assertRaises(TypeError):
+            f.write({"key":object()})
+        self.assertEqual(f.read(), {"key":"value"})
+        
+        # No Temporary File is Left Behind
+        folder = os.path.dirname(f.directory)
+        self.assertFalse([x for x in os.listdir(folder) if x.endswith(".tmp")])
+        
+        # Writes Through a Symbolic Link Replace the Target and Keep the Link
+        os.symlink(f.directory, "link.json")
+        link = file.JSON("link.json")
+        link.durability = "dir"
+        link.write({"key":"linked"})
+        self.assertTrue(os.path.islink("link.json"))
+        self.assertEqual(f.read(), {"key":"linked"})
+        os.remove("link.json")
+        
+        # Deletes File
+        os.remove(f.directory)
+
+    def test_backend(self):
+        
+        # Every Installed Backend Reads what it Writes
+        for backend in file.JSON_BACKENDS:
+            f = file.JSON(backend=backend, compact=True)
+            self.assertEqual(f.backend, backend)
+            f.write({"key":[1, 2.5, "value"]})
+            self.assertEqual(f.read(), {"key":[1, 2.5, "value"]})
+            self.assertNotIn(b"\n", f.readBytes())
+            os.remove(f.directory)
+        
+        # Unknown Backend
+        with self.assertRaises(ValueError):
+            file.JSON(backend="unknown", creation=False)
+
+    def test_default_backend(self):
+
+        # The Standard Library is the Default, Keeping NaN, Infinity, Big Integers and Indentation
+        f = file.JSON()
+        self.assertEqual(f.backend, "json")
+        data = {"nan":float("nan"), "inf":float("inf"), "big":2 ** 70}
+        f.write(data)
+        self.assertEqual(f.readBytes(), json.dumps(data, indent=6).encode())
+        read = f.read()
+        self.assertNotEqual(read["nan"], read["nan"])
+        self.assertEqual(read["inf"], float("inf"))
+        self.assertEqual(read["big"], 2 ** 70)
+
+        # Deletes File
+        os.remove(f.directory)
+
+    def test_read_cache(self):
+        
+        # Create Test File & Creates the File
+        f = file.JSON()
+        f.write({"key":["value"]})
+        file.READ_CACHE.configure(enabled=True)
+        
+        try:
+            # Second Read is a Hit and Returns a Copy
+            f.read()["key"].append("changed")
+            self.assertEqual(f.read(), {"key":["value"]})
+            self.assertEqual(file.READ_CACHE.stats["hits"], 1)
+            
+            # Writes Invalidate the Cache
+            f.write({"key":"new"})
+            self.assertEqual(f.read(), {"key":"new"})
+            
+        finally:
+            file.READ_CACHE.configure(enabled=False)
+            file.READ_CACHE.clear()
+        
+        # Deletes File
+        os.remove(f.directory)
         
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,40 @@
+from unittest import TestCase
+import unittest
+from utils import file
+import os
+
+
+class TestJSONL(TestCase):
+    
+    def test_read(self):
+        
+        # Create Test File & Creates the File
+        f = file.JSONL()
+        
+        # Read File
+        data = f.read()
+        
+        # If File is Empty
+        self.assertEqual(data,[])
+        
+        # Deletes File
+        os.remove(f.directory)
+        
+    def test_append(self):
+        
+        # Create Test File & Creates the File
+        f = file.JSONL()
+        
+        # Write then Append Records
+        f.write([{"id":1}, {"id":2}])
+        f.append({"id":3})
+        
+        # Read Records Lazily
+        self.assertEqual([r["id"] for r in f.iterRecords()], [1, 2, 3])
+        
+        # Deletes File
+        os.remove(f.directory)
+   
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+from unittest import TestCase
+import unittest
+from utils import math
+import numpy
+import pandas
+
+
+class TestMath(TestCase):
+    
+    def test_sigmoid(self):
+        
+        # Scalars
+        self.assertEqual(math.sigmoid(0), 0.5)
+        self.assertEqual(math.sigmoid(-1000), 0.0)
+        
+        # Arrays and Lists do not Overflow
+        values = math.sigmoid(numpy.array([-1000.0, 0.0, 1000.0]))
+        numpy.testing.assert_array_equal(values, [0.0, 0.5, 1.0])
+        numpy.testing.assert_allclose(math.sigmoid([1, 2]), [0.7310585786, 0.8807970780])
+        
+        # Pandas Keeps its Index
+        series = math.sigmoid(pandas.Series([0.0], index=["a"]))
+        self.assertEqual(series["a"], 0.5)
+        
+        # In Place and in Chunks
+        x = numpy.linspace(-5, 5, 11)
+        expected = math.sigmoid(x)
+        math.sigmoid(x, out=x, chunkSize=4)
+        numpy.testing.assert_allclose(x, expected)
+        
+    def test_kernels(self):
+        
+        x = numpy.array([-1000.0, -1.0, 0.0, 1.0, 1000.0])
+        
+        # Stable Element-Wise Kernels
+        numpy.testing.assert_allclose(math.logSigmoid(x[1:4]), numpy.log(math.sigmoid(x[1:4])))
+        self.assertEqual(math.logSigmoid(-1000.0), -1000.0)
+        numpy.testing.assert_array_equal(math.relu(x), [0.0, 0.0, 0.0, 1.0, 1000.0])
+        
+        # NaN Passes through Relu on the NumPy and the Accelerated Paths
+        for size in (4, math.ACCELERATOR_THRESHOLD):
+            values = numpy.resize([numpy.nan, -1.0, 2.0, 0.0], size)
+            numpy.testing.assert_array_equal(math.relu(values)[:4], [numpy.nan, 0.0, 2.0, 0.0])
+        numpy.testing.assert_allclose(math.tanh([0.5]), numpy.tanh([0.5]))
+        
+        # Softmax and Log Sum Exp do not Overflow
+        numpy.testing.assert_allclose(math.softmax([1000.0, 1000.0]), [0.5, 0.5])
+        self.assertAlmostEqual(math.logSumExp([1000.0, 1000.0]), 1000.0 + numpy.log(2))
+        
+        # Moving Average and Normalization in Place
+        numpy.testing.assert_array_equal(math.movingAverage([1, 2, 3, 4], 2), [1.5, 2.5, 3.5])
+        y = numpy.array([1.0, 2.0, 3.0])
+        math.normalize(y, "minmax", out=y)
+        numpy.testing.assert_array_equal(y, [0.0, 0.5, 1.0])
+        
+    def test_average(self):
+        
+        # Plain List
+        self.assertEqual(math.average([1, 2, 3]), 2.0)
+        
+        # Weights and Missing Values
+        self.assertEqual(math.average([1, numpy.nan, 3], weights=[1, 1, 3], skipna=True), 2.5)
+        
+        # Chunked Average Matches the Full Average
+        x = numpy.arange(20.0).reshape(10, 2)
+        numpy.testing.assert_allclose(math.average(x, axis=0, chunkSize=3), math.average(x, axis=0))
+        self.assertAlmostEqual(math.average(x, chunkSize=3), 9.5)
+
+    def test_runningStats(self):
+        
+        x = numpy.random.default_rng(0).normal(size=20000)
+        
+        # Accumulate Batches and Scalars in Two Accumulators then Merge
+        first = math.RunningStats()
+        for chunk in numpy.array_split(x[:10000], 10): first.update(chunk)
+        second = math.RunningStats()
+        for value in x[10000:10100]: second.update(value)
+        second.update(x[10100:])
+        first.merge(second)
+        
+        # Exact Statistics
+        self.assertEqual(first.count, 20000)
+        self.assertAlmostEqual(first.mean, x.mean())
+        self.assertAlmostEqual(first.variance, x.var())
+        self.assertEqual(first.max, x.max())
+        
+        # Approximate Quantiles
+        self.assertAlmostEqual(first.quantile(0.5), numpy.median(x), delta=0.02)
+        self.assertAlmostEqual(first.summary()["p95"], numpy.quantile(x, 0.95), delta=0.05)
+   
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+from unittest import TestCase
+import unittest
+from utils import file
+import os
+import pandas
+
+
+class TestParquet(TestCase):
+    
+    def test_read(self):
+        
+        # Create Test File & Creates the File
+        f = file.Parquet()
+        
+        # Read File
+        data = f.read()
+        
+        # If File is Empty
+        self.assertTrue(data.empty)
+        
+        # Deletes File
+        os.remove(f.directory)
+        
+    def test_write(self):
+        
+        # Create Test File & Creates the File
+        f = file.Parquet()
+        
+        # Write to File
+        df = pandas.DataFrame({"year":[2020, 2021, 2022, 2023], "value":[1.0, 2.0, 3.0, 4.0]}, index=[5, 6, 7, 8])
+        f.write(df, rowGroupSize=2)
+        
+        # Read File
+        pandas.testing.assert_frame_equal(f.read(), df)
+        
+        # Read Selected Columns and Rows
+        data = f.read(columns=["value"], filters=[("year", ">=", 2022)])
+        self.assertEqual(list(data.columns), ["value"])
+        self.assertEqual(list(data["value"]), [3.0, 4.0])
+        
+        # Deletes File
+        os.remove(f.directory)
+        
+    def test_convert(self):
+        
+        # Create Test File & Creates the File
+        f = file.CSV()
+        df = pandas.DataFrame([10,20,30],columns=['Numbers'])
+        f.write(df)
+        
+        # Convert the CSV File
+        parquet = f.toParquet()
+        feather = f.convert(file.Feather)
+        
+        # Check
+        self.assertEqual(parquet.extension, "parquet")
+        pandas.testing.assert_frame_equal(parquet.read(), df)
+        pandas.testing.assert_frame_equal(feather.read(), df)
+        
+        # Deletes Files
+        os.remove(f.directory)
+        os.remove(parquet.directory)
+        os.remove(feather.directory)
+        
+        # Compressed CSV Files Drop the Compression Suffix
+        f = file.CSV("data.csv.gz")
+        f.write(df)
+        parquet = f.toParquet()
+        self.assertEqual(os.path.basename(parquet.directory), "data.parquet")
+        pandas.testing.assert_frame_equal(parquet.read(), df)
+        os.remove(f.directory)
+        os.remove(parquet.directory)
+   
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+from unittest import TestCase
+import unittest
+from utils import folder
+import asyncio, os, shutil, sys, threading, time
+from unittest import mock
+
+class TestWatch(TestCase):
+
+    def check(self, backend):
+        # Create Test Folder
+        f = folder.Folder("watched")
+
+        with f.watch(extensions=["txt"], backend=backend, interval=0.05) as watcher:
+            self.assertEqual(watcher.backend, backend)
+
+            # Files in New Sub Folders are Seen, Others Filtered Out
+            os.makedirs(f.directory + "/sub")
+            with open(f.directory + "/sub/a.txt", "w") as handle:
+                handle.write("a")
+            with open(f.directory + "/b.csv", "w") as handle:
+                handle.write("b")
+
+            events = []
+            while not any(event.path.endswith("a.txt") for event in events):
+                batch = watcher.get(timeout=5)
+                self.assertTrue(batch)
+                events.extend(batch)
+            self.assertEqual({(event.type, os.path.basename(event.path)) for event in events}, {("created", "a.txt")})
+
+            # Async Iteration
+            async def first():
+                with open(f.directory + "/c.txt", "w") as handle:
+                    handle.write("c")
+                async for event in watcher:
+                    return event
+
+            event = asyncio.run(asyncio.wait_for(first(), 5))
+            self.assertEqual(os.path.basename(event.path), "c.txt")
+
+            # Closing Ends the Iterator
+            threading.Timer(0.2, watcher.close).start()
+            list(watcher)
+            self.assertTrue(watcher.closed)
+
+        # Deletes Folder
+        shutil.rmtree(f.directory)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux Only")
+    def test_inotify(self):
+        self.check("inotify")
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux Only")
+    def test_overflow(self):
+        # Create Test Folder
+        f = folder.Folder("watched")
+
+        # Lost Events are Reported on the Folder, whatever the Filters
+        from utils import watch
+        with f.watch(extensions=["txt"], backend="inotify") as watcher:
+            watcher._backend._handle(-1, watch._IN_Q_OVERFLOW, 0, "")
+            self.assertEqual(watcher.get(timeout=5), [watch.Event("overflow", f.directory, True)])
+
+        # Deletes Folder
+        shutil.rmtree(f.directory)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux Only")
+    def test_inotify_moves(self):
+        # Create Test Folder
+        f = folder.Folder("watched")
+        os.makedirs(f.directory + "/sub/deep")
+
+        from utils import watch
+        with f.watch(backend="inotify") as watcher:
+            # Folders Moved out of the Tree are Deleted, and their Watches Removed
+            os.rename(f.directory + "/sub", "outside")
+            self.assertEqual(watcher.get(timeout=5), [watch.Event("deleted", f.directory + "/sub", True)])
+            deadline = time.monotonic() + 5
+            while len(watcher._backend._paths) > 1 and time.monotonic() < deadline: time.sleep(0.01)
+            self.assertEqual(list(watcher._backend._paths.values()), [f.directory])
+
+            # Changes in the Moved Folder are not Reported
+            with open("outside/deep/a.txt", "w") as handle:
+                handle.write("a")
+            self.assertEqual(watcher.get(timeout=0.3), [])
+
+        # A Folder that cannot be Watched Falls Back to Another Backend
+        with self.assertRaises(OSError):
+            watch._Inotify(f.directory + "/missing", True, print)
+        with mock.patch.object(watch, "_IN_MASK", 0), f.watch(interval=0.05) as watcher:
+            self.assertNotEqual(watcher.backend, "inotify")
+
+        # Deletes Folders
+        shutil.rmtree("outside")
+        shutil.rmtree(f.directory)
+
+    def test_polling(self):
+        self.check("polling")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,37 @@
 
+
 # Package Documentation
 """
-Utilities Package: 
+Utilities Package:
     This package was designed by Nathan Yockey to help assist him with coding projects to be able to make the coding projects simpler and cleaner to make sure everything is built correctly
 """
 
 
 # Import Modules
-from . import  file, functions, math, folder
+import importlib
 
 __all__ = [
     "file"
     ,"functions"
     , "math"
-    , "folder" 
+    , "folder"
+    , "batch"
+    , "watch"
+    , "dataset"
 ]
 
+# Submodules are Imported on First Access, so `import utils` does not Load pandas or NumPy
+def __getattr__(name:str):
+    """Import a Submodule on First Access
 
+    :param name: Name of the Submodule
+    :type name: str
+    :raises AttributeError: No such Submodule
+    :return: Submodule
+    :rtype: module
+    """
+    if name in __all__: return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,118 @@
+# Module Documentation
+"""
+Batch Operations: Read, Write and Delete Many Files Concurrently on a Thread or Process Pool.
+"""
+
+# Imported Modules
+import os, time, collections
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Callable, Iterable
+from .file import fromPath
+from .utils import IO_WORKERS
+
+__all__ = [
+    "readMany"
+    , "writeMany"
+    , "deleteMany"
+]
+
+# Tasks Queued per Worker, Bounding the Memory Held by Pending Results
+QUEUE_DEPTH = 4
+
+# Workers are Top Level Functions so a Process Pool can Pickle them
+def _read(directory:str, options:dict):
+    return fromPath(directory).read(**options)
+
+def _write(directory:str, data, options:dict) -> None:
+    fromPath(directory, True).write(data, **options)
+
+def _delete(directory:str) -> None:
+    fromPath(directory).delete()
+
+def _run(function:Callable, tasks:Iterable[tuple], workers:int, processes:bool) -> dict:
+    """Run Tasks on a Pool, Keeping the Results in Order and the Errors by File
+
+    :param function: Worker Called with the Arguments of each Task
+    :type function: Callable
+    :param tasks: Arguments of each Task, the First being the Directory of the File
+    :type tasks: Iterable[tuple]
+    :param workers: Number of Threads or Processes, defaults to `IO_WORKERS` Threads or one Process per CPU
+    :type workers: int
+    :param processes: `True` runs on Processes, for Parsing Bound by the GIL
+    :type processes: bool
+    :raises ValueError: Number of Workers is not Positive
+    :return: Summary: `results` in Order, `None` for Failed Files, `errors` by Directory and `elapsed` seconds
+    :rtype: dict
+    """
+
+    if workers is not None and workers < 1: raise ValueError("Workers must be Positive")
+
+    start = time.perf_counter()
+    summary = {"results":[], "errors":{}, "elapsed":0.0}
+
+    if processes:
+        workers = workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        workers = workers or IO_WORKERS
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    def collect(directory:str, future) -> None:
+        try:
+            summary["results"].append(future.result())
+        except Exception as error:
+            summary["results"].append(None)
+            summary["errors"][directory] = error
+
+    with pool:
+        # Sliding Window of Pending Tasks, Collected in Submission Order
+        pending = collections.deque()
+        for task in tasks:
+            pending.append((task[0], pool.submit(function, *task)))
+            if len(pending) >= workers * QUEUE_DEPTH: collect(*pending.popleft())
+
+        while pending: collect(*pending.popleft())
+
+    summary["elapsed"] = time.perf_counter() - start
+
+    return summary
+
+def readMany(directories:Iterable[str], workers:int = None, processes:bool = False, **options) -> dict:
+    """Read Many Files Concurrently, each with the File Type Matching its Extension
+
+    :param directories: Directories of the Files
+    :type directories: Iterable[str]
+    :param workers: Number of Threads or Processes, defaults to None
+    :type workers: int, optional
+    :param processes: `True` reads on Processes so Parsing is not Bound by the GIL, defaults to False
+    :type processes: bool, optional
+    :return: Summary: `results` in Order, `None` for Failed Files, `errors` by Directory and `elapsed` seconds
+    :rtype: dict
+    """
+    return _run(_read, ((directory, options) for directory in directories), workers, processes)
+
+def writeMany(data:dict, workers:int = None, processes:bool = False, **options) -> dict:
+    """Write Many Files Concurrently, Creating Missing Files
+
+    :param data: Content by Directory of the File
+    :type data: dict
+    :param workers: Number of Threads or Processes, defaults to None
+    :type workers: int, optional
+    :param processes: `True` writes on Processes so Serialization is not Bound by the GIL, defaults to False
+    :type processes: bool, optional
+    :return: Summary: `results` in Order, `errors` by Directory and `elapsed` seconds
+    :rtype: dict
+    """
+    return _run(_write, ((directory, content, options) for directory, content in data.items()), workers, processes)
+
+def deleteMany(directories:Iterable[str], workers:int = None) -> dict:
+    """Delete Many Files Concurrently
+
+    :param directories: Directories of the Files
+    :type directories: Iterable[str]
+    :param workers: Number of Threads, defaults to None
+    :type workers: int, optional
+    :return: Summary: `results` in Order, `errors` by Directory and `elapsed` seconds
+    :rtype: dict
+    """
+    return _run(_delete, ((directory,) for directory in directories), workers, False)
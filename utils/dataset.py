@@ -0,0 +1,321 @@
+# Module Documentation
+"""
+Datasets: A Folder of CSV or Parquet Shards Read and Written as One Table, with Hive Style Partitions.
+"""
+
+# Imported Modules
+from __future__ import annotations
+import os, re, uuid, operator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Union
+from urllib.parse import quote, unquote
+from .file import CSV, Parquet, COMPRESSION_SUFFIXES
+from .folder import Folder
+from .utils import IO_WORKERS, LazyModule
+
+# pandas is Imported on First Use
+pandas = LazyModule("pandas")
+
+__all__ = [
+    "Dataset"
+    , "DATASET_FORMATS"
+]
+
+# Shard File Types by Format
+DATASET_FORMATS = {
+    "csv":CSV
+    , "parquet":Parquet
+}
+
+# Partition Value of Missing Keys, as Written by Hive and Spark
+DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# File Suffix of each Compression Codec
+_SUFFIXES = {codec:suffix for suffix, codec in COMPRESSION_SUFFIXES.items()}
+
+# Comparisons of the Partition Filters
+_OPERATORS = {
+    "==":operator.eq
+    , "=":operator.eq
+    , "!=":operator.ne
+    , "<":operator.lt
+    , "<=":operator.le
+    , ">":operator.gt
+    , ">=":operator.ge
+    , "in":lambda value, values: value in values
+    , "not in":lambda value, values: value not in values
+}
+
+# Plain Decimal Literals Read Back as Numbers; `nan`, `inf`, Exponents and Leading Zeros such as `007` Stay Strings
+_INT = re.compile(r"0|-?[1-9][0-9]*")
+_FLOAT = re.compile(r"-?(0|[1-9][0-9]*)\.[0-9]+")
+
+def _parseValue(raw:str):
+    """Partition Value of a Folder Name, as `int`, `float` or `str`
+
+    :param raw: Quoted Value after the `=`
+    :type raw: str
+    :return: Partition Value, `None` for the Default Partition
+    :rtype: Union[int, float, str, None]
+    """
+    if raw == DEFAULT_PARTITION: return None
+    value = unquote(raw)
+    if _INT.fullmatch(value): return int(value)
+    if _FLOAT.fullmatch(value): return float(value)
+    return value
+
+def _matches(value, op:str, target) -> bool:
+    """Check a Partition Value against a Filter
+
+    :param value: Partition Value, `None` for the Default Partition
+    :type value: Any
+    :param op: Operator from `_OPERATORS`
+    :type op: str
+    :param target: Value of the Filter
+    :type target: Any
+    :return: `True` the Value Passes the Filter; Missing Values only Pass an Explicit `None`
+    :rtype: bool
+    """
+    if value is None: return (op in ("==", "=") and target is None) or (op == "in" and None in target)
+    return _OPERATORS[op](value, target)
+
+def _formatValue(value) -> str:
+    """Folder Name of a Partition Value
+
+    :param value: Partition Value
+    :type value: Any
+    :return: Quoted Value, `DEFAULT_PARTITION` for Missing Values
+    :rtype: str
+    """
+    if value is None or (isinstance(value, float) and value != value): return DEFAULT_PARTITION
+    return quote(str(value), safe="")
+
+# Dataset Object
+class Dataset:
+    def __init__(self, directory:str = None, format:str = "csv", creation:bool = True, compression:str = None) -> None:
+        """Dataset Object, a Folder of Shards Read and Written as One Table
+
+        Shards may sit in Hive style partition folders such as `year=2024/month=5`, whose keys become columns of the table.
+
+        :param directory: Directory of the Dataset Folder, defaults to None
+        :type directory: str, optional
+        :param format: Shard Format from `DATASET_FORMATS`, defaults to "csv"
+        :type format: str, optional
+        :param creation: `True` creates the Folder if it does not Exist, defaults to True
+        :type creation: bool, optional
+        :param compression: Compression Codec of New CSV Shards, defaults to None
+        :type compression: str, optional
+        :raises ValueError: Unknown Format, or Compression of Parquet Shards
+        """
+
+        if format not in DATASET_FORMATS: raise ValueError(f"Unknown Dataset Format: {format}")
+        if compression is not None and format != "csv": raise ValueError("Only CSV Shards are Compressed")
+        if compression is not None and compression not in _SUFFIXES: raise ValueError(f"Unknown Compression Codec: {compression}")
+
+        self._folder = Folder(directory, creation)
+        self._format = format
+        self._compression = compression
+
+    @property
+    def directory(self) -> str:
+        return self._folder.directory
+
+    @property
+    def format(self) -> str:
+        return self._format
+
+    def shards(self, filters:list = None) -> list:
+        """Shards of the Dataset with their Partition Values, Pruned by the Filters
+
+        :param filters: Partition Filters such as `[("year", ">=", 2020)]`, all Required to Match; Shards without the Key or with a Missing Value are Pruned, defaults to None
+        :type filters: list, optional
+        :raises ValueError: No Directory, Unknown Filter Operator, or Filter on a Column that is not a Partition Key
+        :return: `(shard, partitions)` Pairs in Path Order
+        :rtype: list
+        """
+
+        filters = list(filters or [])
+        for _, op, _ in filters:
+            if op not in _OPERATORS: raise ValueError(f"Unknown Filter Operator: {op}")
+
+        shardType = DATASET_FORMATS[self._format]
+        shards = []
+
+        for item in self._folder.walk(folders=False):
+            if type(item) is not shardType: continue
+
+            # Shards under Hidden or Temporary Files and Folders are Skipped
+            names = os.path.relpath(item.directory, self.directory).split(os.sep)
+            if any(name[:1] in (".", "_") for name in names): continue
+
+            # Partition Values from the Folder Names between the Dataset and the Shard
+            partitions = {}
+            for name in names[:-1]:
+                key, sep, raw = name.partition("=")
+                if sep: partitions[key] = _parseValue(raw)
+
+            shards.append((item, partitions))
+
+        # Filters only Prune Partitions, Stored Columns are not Filtered Row by Row
+        keys = {key for _, partitions in shards for key in partitions}
+        unknown = sorted({key for key, _, _ in filters if key not in keys})
+        if shards and unknown: raise ValueError(f"Filters on Columns that are not Partition Keys: {unknown}")
+
+        shards = [(item, partitions) for item, partitions in shards if all(key in partitions and _matches(partitions[key], op, value) for key, op, value in filters)]
+
+        return sorted(shards, key=lambda shard: shard[0].directory)
+
+    def _load(self, shard, partitions:dict, columns:list = None) -> pandas.DataFrame:
+        """Read one Shard with its Partition Columns
+
+        :param shard: Shard File
+        :type shard: Union[CSV, Parquet]
+        :param partitions: Partition Values of the Shard
+        :type partitions: dict
+        :param columns: Columns to Read, defaults to None
+        :type columns: list, optional
+        :return: Shard Data
+        :rtype: pandas.DataFrame
+        """
+        stored = None if columns is None else [c for c in columns if c not in partitions]
+        df = shard.read(stored)
+        return self._withPartitions(df, partitions, columns)
+
+    def _withPartitions(self, df:pandas.DataFrame, partitions:dict, columns:list = None) -> pandas.DataFrame:
+        """Add the Partition Values of a Shard as Columns"""
+        # `assign` Returns a New Dataframe, so Cached Reads are not Modified
+        df = df.assign(**{key:value for key, value in partitions.items() if columns is None or key in columns})
+        return df if columns is None else df[[c for c in columns if c in df.columns]]
+
+    def read(self, columns:list = None, filters:list = None, workers:int = None) -> pandas.DataFrame:
+        """Read the Shards in Parallel into One Dataframe
+
+        :param columns: Columns to Read, Partition Keys Included, defaults to None
+        :type columns: list, optional
+        :param filters: Partition Filters such as `[("year", ">=", 2020)]`, defaults to None
+        :type filters: list, optional
+        :param workers: Number of Threads Reading Shards, defaults to IO_WORKERS
+        :type workers: int, optional
+        :raises ValueError: No Directory, Unknown Filter Operator, or Filter on a Column that is not a Partition Key
+        :return: Rows of every Matching Shard, Renumbered
+        :rtype: pandas.DataFrame
+        """
+
+        shards = self.shards(filters)
+        if not shards: return pandas.DataFrame(columns=columns)
+
+        with ThreadPoolExecutor(max_workers=workers or IO_WORKERS) as executor:
+            frames = list(executor.map(lambda shard: self._load(*shard, columns), shards))
+
+        return pandas.concat(frames, ignore_index=True)
+
+    def iterChunks(self, chunkSize:int = 100000, columns:list = None, filters:list = None) -> Iterator[pandas.DataFrame]:
+        """Lazy Chunks of the Dataset, Holding One Chunk in Memory at a Time
+
+        :param chunkSize: Most Rows per Chunk, defaults to 100000
+        :type chunkSize: int, optional
+        :param columns: Columns to Read, Partition Keys Included, defaults to None
+        :type columns: list, optional
+        :param filters: Partition Filters such as `[("year", ">=", 2020)]`, defaults to None
+        :type filters: list, optional
+        :raises ValueError: No Directory, Unknown Filter Operator, or Filter on a Column that is not a Partition Key
+        :return: Chunks of the Matching Shards, in Shard Order
+        :rtype: Iterator[pandas.DataFrame]
+        """
+
+        for shard, partitions in self.shards(filters):
+            stored = None if columns is None else [c for c in columns if c not in partitions]
+            for df in shard.iterChunks(chunkSize, stored):
+                if not df.empty: yield self._withPartitions(df, partitions, columns)
+
+    def write(self, df:pandas.DataFrame, partitionBy:Union[str, Iterable[str]] = None, maxRows:int = None, mode:str = "append", workers:int = None) -> list:
+        """Write a Dataframe as New Shards, Split by Partition Keys
+
+        :param df: Dataframe to Write
+        :type df: pandas.DataFrame
+        :param partitionBy: Columns Splitting the Rows into Partition Folders, defaults to None
+        :type partitionBy: Union[str, Iterable[str]], optional
+        :param maxRows: Most Rows per Shard, defaults to None
+        :type maxRows: int, optional
+        :param mode: `append` adds Shards, `overwrite` deletes the Previous Shards once the New Ones are Written, defaults to "append"
+        :type mode: str, optional
+        :param workers: Number of Threads Writing Shards, defaults to IO_WORKERS
+        :type workers: int, optional
+        :raises ValueError: Unknown Mode or Partition Column
+        :return: Directories of the New Shards
+        :rtype: list
+        """
+
+        if mode not in ("append", "overwrite"): raise ValueError(f"Unknown Write Mode: {mode}")
+
+        keys = [] if partitionBy is None else [partitionBy] if isinstance(partitionBy, str) else list(partitionBy)
+        missing = [key for key in keys if key not in df.columns]
+        if missing: raise ValueError(f"Unknown Partition Columns: {missing}")
+
+        # Previous Shards are Kept until every New Shard is Written
+        previous = self.shards() if mode == "overwrite" else []
+
+        # Rows of each Partition Folder
+        if keys:
+            groups = []
+            for values, group in df.groupby(keys, dropna=False, sort=False):
+                if not isinstance(values, tuple): values = (values,)
+                folder = "/".join(f"{key}={_formatValue(value)}" for key, value in zip(keys, values))
+                groups.append((folder, group.drop(columns=keys)))
+        else:
+            groups = [("", df)]
+
+        # Shards of at Most `maxRows` Rows
+        extension = self._format if self._compression is None else f"csv.{_SUFFIXES[self._compression]}"
+        tasks = []
+        for folder, group in groups:
+            step = maxRows or max(len(group), 1)
+            for start in range(0, max(len(group), 1), step):
+                directory = f"{self.directory}/{folder}" if folder else self.directory
+                tasks.append((f"{directory}/part-{uuid.uuid4().hex}.{extension}", group.iloc[start:start + step]))
+
+        def write(task:tuple) -> str:
+            directory, part = task
+            os.makedirs(os.path.dirname(directory), exist_ok=True)
+            DATASET_FORMATS[self._format](directory).write(part)
+            return directory
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers or IO_WORKERS) as executor:
+                paths = list(executor.map(write, tasks))
+
+        # A Failed Write Removes its New Shards and Leaves the Dataset as it was
+        except BaseException:
+            self._remove([directory for directory, _ in tasks])
+            raise
+
+        self._remove([shard.directory for shard, _ in previous])
+
+        return paths
+
+    def _remove(self, directories:list) -> None:
+        """Delete Shards and the Partition Folders they Leave Empty
+
+        :param directories: Directories of the Shards
+        :type directories: list
+        """
+        for directory in directories:
+            try:
+                os.remove(directory)
+            except FileNotFoundError:
+                pass
+            
+            # Only the Folders of the Shard, up to the Dataset, are Removed once Empty
+            folder = os.path.dirname(directory)
+            while folder != self.directory and folder.startswith(self.directory + "/"):
+                try:
+                    os.rmdir(folder)
+                except OSError:
+                    break
+                folder = os.path.dirname(folder)
+
+    def __len__(self) -> int:
+        return len(self.shards())
+
+    def __str__(self) -> str:
+        return f"Dataset({self.directory}, {self._format})"
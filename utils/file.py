@@ -1,39 +1,500 @@
 # Module Documentation
 """
-File Objects: Easy to manipulate Files: TXT, JSON, CSV, and Folder.
+File Objects: Easy to manipulate Files: TXT, JSON, JSONL, CSV, BIN, Parquet, Feather, and Folder.
 """
 
 # Imported Modules
-import os, json, pandas, abc
-from joblib import dump, load
+from __future__ import annotations
+import os, json, abc
+from .functions import timed
+from .utils import LazyModule, isInstalled, isPandas, offload
 import pathlib
 import shutil
+import errno
+import mmap
+import io
+import gzip
+import bz2
+import lzma
+import tempfile
+import contextlib
+import threading
+import copy
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, Union
+
+# pandas and joblib are Imported on First Use
+pandas = LazyModule("pandas")
+joblib = LazyModule("joblib")
 
 __all__ = [
     "File"
     , "TXT"
     , "JSON"
+    , "JSONL"
     , "CSV"
     , "BIN"
+    , "Parquet"
+    , "Feather"
     , "Folder"
+    , "copyFile"
+    , "atomicWrite"
+    , "openFile"
+    , "JSON_BACKENDS"
+    , "ReadCache"
+    , "READ_CACHE"
+    , "fromPath"
 ]
 
 # Local Directory Current Path
 LOCAL_DIRECTORY = pathlib.Path().resolve()
 
+# Buffer Size used when the Kernel cannot Copy the File
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Buffer Size of Appends and Line Writes
+APPEND_BUFFER_SIZE = 64 * 1024
+
+# Linux ioctl Request to Reflink (Clone) a File
+_FICLONE = 0x40049409
+
+# Compression Codecs by File Suffix
+COMPRESSION_SUFFIXES = {
+    "gz": "gzip"
+    , "bz2": "bz2"
+    , "xz": "xz"
+    , "zst": "zstd"
+    , "lz4": "lz4"
+}
+
+# Compression Level of each Codec when Writing
+COMPRESSION_LEVELS = {
+    "gzip": 6
+    , "bz2": 9
+    , "xz": 6
+    , "zstd": 3
+    , "lz4": 0
+}
+
+# Durability Levels of Writes: No fsync, fsync the File, fsync the File and its Folder
+DURABILITY_LEVELS = ("none", "file", "dir")
+
+# Errors meaning the Kernel Copy is not Supported for these Files
+_KERNEL_COPY_ERRORS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF, errno.EPERM)
+
+def _kernelCopy(src:int, dst:int, size:int):
+    """Copy a File inside the Kernel: Reflink, `copy_file_range` then `sendfile`
+
+    :param src: Source File Descriptor
+    :type src: int
+    :param dst: Destination File Descriptor
+    :type dst: int
+    :param size: Size of the Source File
+    :type size: int
+    :return: Bytes Copied, `None` if the Kernel could not Copy the File
+    :rtype: int
+    """
+    
+    # Reflink the File when the Filesystem Supports It
+    try:
+        import fcntl
+        fcntl.ioctl(dst, _FICLONE, src)
+        return size
+    except (ImportError, OSError):
+        pass
+    
+    # Copy through the Kernel without Userspace Buffers
+    for method in ("copy_file_range", "sendfile"):
+        if not hasattr(os, method): continue
+        
+        copied = 0
+        try:
+            while True:
+                if method == "copy_file_range":
+                    sent = os.copy_file_range(src, dst, COPY_BUFFER_SIZE * 8)
+                else:
+                    sent = os.sendfile(dst, src, copied, COPY_BUFFER_SIZE * 8)
+                if sent == 0: break
+                copied += sent
+        except OSError as error:
+            # Partially Copied Files cannot Fall Back
+            if copied or error.errno not in _KERNEL_COPY_ERRORS: raise
+            continue
+        
+        return copied
+    
+    return None
+
+def _fsync(directory:str) -> None:
+    """Flush a File or Folder to the Disk
+
+    :param directory: Directory of the File or Folder
+    :type directory: str
+    """
+    
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+@contextlib.contextmanager
+def atomicWrite(directory:str, atomic:bool = True, durability:str = "none") -> Iterator[str]:
+    """Write a File Atomically: Write a Temporary File in the Same Folder, then Replace the File
+
+    Readers and crashes see either the old or the new File, never a torn one.
+
+    :param directory: Directory of the File
+    :type directory: str
+    :param atomic: `False` writes the File in Place, defaults to True
+    :type atomic: bool, optional
+    :param durability: `none`, `file` fsyncs the File, `dir` also fsyncs the Folder, defaults to "none"
+    :type durability: str, optional
+    :raises ValueError: Unknown Durability Level
+    :return: Directory to Write the New Content to
+    :rtype: Iterator[str]
+    """
+    
+    if durability not in DURABILITY_LEVELS: raise ValueError(f"Unknown Durability Level: {durability}")
+    
+    # Write in Place
+    if not atomic:
+        yield directory
+        if durability != "none": _fsync(directory)
+        return
+    
+    # Write Through Symbolic Links, so the Target is Replaced and not the Link
+    directory = os.path.realpath(directory)
+    
+    # Temporary File Next to the File, so the Replace Stays on One Filesystem
+    folder = os.path.dirname(directory)
+    descriptor, temporary = tempfile.mkstemp(prefix=f".{os.path.basename(directory)}.", suffix=".tmp", dir=folder)
+    os.close(descriptor)
+    
+    try:
+        # Keep the Permissions of the File
+        if os.path.exists(directory): shutil.copymode(directory, temporary)
+        
+        yield temporary
+        
+        if durability != "none": _fsync(temporary)
+        os.replace(temporary, directory)
+        
+    except BaseException:
+        # Leave the File Untouched
+        with contextlib.suppress(OSError): os.remove(temporary)
+        raise
+    
+    # Persist the Replace
+    if durability == "dir": _fsync(folder)
+
+def openFile(directory:str, mode:str = "r", compression:str = None, buffering:int = -1) -> io.IOBase:
+    """Open a File, Compressing or Decompressing it as a Stream
+
+    Appends add a new compressed member, which every codec reads back as one stream.
+
+    :param directory: Directory of the File
+    :type directory: str
+    :param mode: `r`, `w`, `a` or `x`, with `b` for Binary, defaults to "r"
+    :type mode: str, optional
+    :param compression: Codec from `COMPRESSION_LEVELS`, `None` for No Compression, defaults to None
+    :type compression: str, optional
+    :param buffering: Buffer Size of Uncompressed Files, `-1` for the Default, defaults to -1
+    :type buffering: int, optional
+    :raises ValueError: Unknown Compression Codec
+    :return: File Object
+    :rtype: io.IOBase
+    """
+    
+    if compression is None: return open(directory, mode, buffering=buffering)
+    
+    if compression not in COMPRESSION_LEVELS: raise ValueError(f"Unknown Compression Codec: {compression}")
+    
+    # Binary Mode of the Codec, Text is Wrapped Around it
+    text = "b" not in mode
+    mode = mode.replace("b", "").replace("t", "")
+    level = COMPRESSION_LEVELS[compression]
+    
+    if compression == "gzip":
+        file = gzip.open(directory, mode + "b", compresslevel=level)
+    
+    elif compression == "bz2":
+        file = bz2.open(directory, mode + "b", compresslevel=level)
+    
+    elif compression == "xz":
+        file = lzma.open(directory, mode + "b", preset=None if mode == "r" else level)
+    
+    elif compression == "zstd":
+        import zstandard
+        
+        # Read every Frame, Appends Write One Frame Each
+        if mode == "r":
+            file = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(directory, "rb"), read_across_frames=True, closefd=True))
+        else:
+            file = zstandard.ZstdCompressor(level=level).stream_writer(open(directory, mode + "b"), closefd=True)
+    
+    else:
+        import lz4.frame
+        file = lz4.frame.open(directory, mode + "b", compression_level=level)
+    
+    return io.TextIOWrapper(file) if text else file
+
+@timed("copyFile")
+def copyFile(source:str, destination:str, metadata:bool = False, bufferSize:int = COPY_BUFFER_SIZE) -> int:
+    """Copy a File in Constant Memory, Binary Safe
+
+    Uses the Kernel (reflink, `copy_file_range`, `sendfile`) when it can and a fixed size buffer otherwise.
+
+    :param source: Directory of the File to Copy
+    :type source: str
+    :param destination: Directory of the New File
+    :type destination: str
+    :param metadata: `True` copies Permissions and Timestamps, defaults to False
+    :type metadata: bool, optional
+    :param bufferSize: Buffer Size of the Fallback Copy, defaults to COPY_BUFFER_SIZE
+    :type bufferSize: int, optional
+    :raises shutil.SameFileError: Source and Destination are the Same File, through a Link or a Hardlink
+    :return: Bytes Copied
+    :rtype: int
+    """
+    
+    # Opening the Destination would Truncate the Source
+    if os.path.exists(destination) and os.path.samefile(source, destination): raise shutil.SameFileError(f"{source} and {destination} are the same file")
+    
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        
+        # Files Reporting No Size (/proc, pipes) are Copied with the Buffer
+        size = os.fstat(src.fileno()).st_size
+        copied = _kernelCopy(src.fileno(), dst.fileno(), size) if size else None
+        
+        # Fixed Size Buffer Copy
+        if copied is None:
+            copied = 0
+            buffer = memoryview(bytearray(bufferSize))
+            while True:
+                read = src.readinto(buffer)
+                if not read: break
+                dst.write(buffer[:read])
+                copied += read
+    
+    # Copy Permissions and Timestamps
+    if metadata: shutil.copystat(source, destination)
+    
+    return copied
+
+# JSON Serializers: Name to (Encode to `bytes`, Decode from `bytes`)
+# Installed Serializers are Detected without being Imported, and Imported on First Use
+# Fast Serializers are Opt In: they Reject NaN, Infinity and Integers Wider than 64 Bits, which the Standard Library Accepts
+JSON_BACKENDS = {}
+
+if isInstalled("orjson"):
+    orjson = LazyModule("orjson")
+
+    def _orjsonEncode(data, compact:bool) -> bytes:
+        # NumPy Arrays and Non `str` Keys are Serialized like the Standard Library
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=options if compact else options | orjson.OPT_INDENT_2)
+
+    JSON_BACKENDS["orjson"] = (_orjsonEncode, lambda raw: orjson.loads(raw))
+
+if isInstalled("msgspec"):
+    msgspec = LazyModule("msgspec")
+    JSON_BACKENDS["msgspec"] = (
+        lambda data, compact: msgspec.json.encode(data) if compact else msgspec.json.format(msgspec.json.encode(data), indent=6)
+        , lambda raw: msgspec.json.decode(raw)
+    )
+
+if isInstalled("ujson"):
+    ujson = LazyModule("ujson")
+    JSON_BACKENDS["ujson"] = (
+        lambda data, compact: ujson.dumps(data, indent=0 if compact else 6).encode()
+        , lambda raw: ujson.loads(raw)
+    )
+
+JSON_BACKENDS["json"] = (
+    lambda data, compact: json.dumps(data, separators=(",", ":")).encode() if compact else json.dumps(data, indent=6).encode()
+    , json.loads
+)
+
+# Default JSON Serializer, Set to a Name of `JSON_BACKENDS` to Opt In to a Faster One
+JSON_BACKEND = "json"
+
+# Cache of Parsed Files
+class ReadCache:
+    def __init__(self, maxEntries:int = 128, maxBytes:int = 256 * 1024 * 1024, enabled:bool = False, copyOnRead:bool = True) -> None:
+        """Process-Wide LRU Cache of Parsed Files, Invalidated when the File Changes
+
+        Entries are checked against `(st_mtime_ns, st_size, st_ino)` of the File on every read, the size of an entry is the size of its File.
+
+        :param maxEntries: Most Files Kept, defaults to 128
+        :type maxEntries: int, optional
+        :param maxBytes: Most File Bytes Kept, defaults to 256 MiB
+        :type maxBytes: int, optional
+        :param enabled: `True` caches Reads, defaults to False
+        :type enabled: bool, optional
+        :param copyOnRead: `True` returns Copies so Callers cannot Change the Cache, defaults to True
+        :type copyOnRead: bool, optional
+        """
+        self.enabled = enabled
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.copyOnRead = copyOnRead
+        
+        # Key to (Signature, Size, Value)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+    
+    def configure(self, enabled:bool = None, maxEntries:int = None, maxBytes:int = None, copyOnRead:bool = None) -> None:
+        """Change the Cache Settings, `None` Keeps a Setting
+
+        :param enabled: `True` caches Reads, defaults to None
+        :type enabled: bool, optional
+        :param maxEntries: Most Files Kept, defaults to None
+        :type maxEntries: int, optional
+        :param maxBytes: Most File Bytes Kept, defaults to None
+        :type maxBytes: int, optional
+        :param copyOnRead: `True` returns Copies so Callers cannot Change the Cache, defaults to None
+        :type copyOnRead: bool, optional
+        """
+        if enabled is not None: self.enabled = enabled
+        if maxEntries is not None: self.maxEntries = maxEntries
+        if maxBytes is not None: self.maxBytes = maxBytes
+        if copyOnRead is not None: self.copyOnRead = copyOnRead
+        
+        with self._lock:
+            self._evict()
+    
+    def get(self, key:tuple, directory:str, loader:Callable):
+        """Cached Value of a File, Loaded when Missing or Changed
+
+        :param key: Key of the Value, the Directory and Read Options
+        :type key: tuple
+        :param directory: Directory of the File
+        :type directory: str
+        :param loader: Function Loading the Value from the File
+        :type loader: Callable
+        :return: Value of the File
+        :rtype: Any
+        """
+        
+        if not self.enabled: return loader()
+        
+        # Signature of the File before Loading it
+        status = os.stat(directory)
+        signature = (status.st_mtime_ns, status.st_size, status.st_ino)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._copy(entry[2])
+            
+            self._misses += 1
+        
+        value = loader()
+        
+        # Files Larger than the Cache are not Kept
+        if status.st_size <= self.maxBytes:
+            with self._lock:
+                previous = self._entries.pop(key, None)
+                if previous is not None: self._bytes -= previous[1]
+                
+                self._entries[key] = (signature, status.st_size, value)
+                self._bytes += status.st_size
+                self._evict()
+        
+        return self._copy(value)
+    
+    def invalidate(self, directory:str = None) -> None:
+        """Drop the Cached Values of a File
+
+        :param directory: Directory of the File, `None` Drops Everything, defaults to None
+        :type directory: str, optional
+        """
+        
+        with self._lock:
+            for key in [k for k in self._entries if directory is None or k[1] == directory]:
+                self._bytes -= self._entries.pop(key)[1]
+    
+    def clear(self) -> None:
+        """Drop Everything and Reset the Counters
+        """
+        
+        self.invalidate()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+    
+    @property
+    def stats(self) -> dict:
+        """Counters of the Cache
+
+        :return: `hits`, `misses`, `entries` and `bytes`
+        :rtype: dict
+        """
+        with self._lock:
+            return {"hits":self._hits, "misses":self._misses, "entries":len(self._entries), "bytes":self._bytes}
+    
+    def _evict(self) -> None:
+        """Drop the Least Recently Used Values until the Limits are Met, the Lock must be Held
+        """
+        
+        while self._entries and (len(self._entries) > self.maxEntries or self._bytes > self.maxBytes):
+            self._bytes -= self._entries.popitem(last=False)[1][1]
+    
+    def _copy(self, value):
+        """Copy of a Cached Value Returned to the Caller
+
+        :param value: Cached Value
+        :type value: Any
+        :return: Copy of the Value, the Value Itself when `copyOnRead` is `False`
+        :rtype: Any
+        """
+        
+        if not self.copyOnRead: return value
+        
+        if isPandas(value): return value.copy(deep=True)
+        
+        return copy.deepcopy(value)
+
+# Cache Shared by `JSON`, `CSV` and `BIN` Reads, Disabled by Default
+READ_CACHE = ReadCache()
+
 # Initial File Object to Base around Specific Files
 class File:
-    def __init__(self, directory:str = None, extIntent:str = "txt", creation:bool = True) -> None:
+    
+    # Extension Written by the File Type, Read from the Class without Creating a File; `None` for Generic Files
+    EXTENSION = None
+    
+    # Writes Replace the File through a Temporary File, `False` Truncates the File in Place
+    atomic = True
+    
+    # Durability of Writes and Appends: `none`, `file` or `dir`
+    durability = "none"
+    
+    def __init__(self, directory:str = None, extIntent:str = "txt", creation:bool = True, compression:str = None) -> None:
         """File Object
 
         :param directory: Directory of the File, defaults to None
         :type directory: str, optional
+        :param compression: Codec from `COMPRESSION_LEVELS`, defaults to the Codec of the Suffix (`gz`, `bz2`, `xz`, `zst`, `lz4`)
+        :type compression: str, optional
         :raises TypeError: Directory is not a `str`
+        :raises ValueError: Unknown Compression Codec
         """
         
         # Intended Extension
         self._extIntent = extIntent
         
+        # Compression Codec
+        if compression is not None and compression not in COMPRESSION_LEVELS: raise ValueError(f"Unknown Compression Codec: {compression}")
+        self._compression = compression
+        
         # Directory of File
         
         # Create a File if None
@@ -45,6 +506,9 @@ class File:
         # Initialize directory variable 
         self._directory = directory
         
+        # Cached `os.DirEntry` when Created from a Folder Walk
+        self._entry = None
+        
         # Create the File
         if creation is True and not self.exists():
             self.create()
@@ -83,9 +547,10 @@ class File:
         if self.exists(): raise FileExistsError("File Already Exists")
         
         # Creates the File
-        with open(self.directory,"x"):
+        with self._open("xb"):
             pass
      
+    @timed()
     def delete(self) -> None:
         """Delete File Object
 
@@ -102,24 +567,128 @@ class File:
         self._directory = None
               
     @abc.abstractmethod
-    def read(self) -> str:
+    @timed()
+    def read(self, mode:str = "text") -> Union[str, bytes, mmap.mmap, memoryview]:
         """Read the File Object
 
+        :param mode: `text` reads a `str`, `bytes` reads `bytes`, `mmap` maps the File without Copying, defaults to "text"
+        :type mode: str, optional
         :raises FileNotFoundError:
+        :raises ValueError: Unknown Read Mode
         :return: Value Read from File Object
-        :rtype: str
+        :rtype: Union[str, bytes, mmap.mmap, memoryview]
         """
         
         # Setup Directory to the Object's Directory
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
+        # Map the File instead of Reading it
+        if mode == "mmap": return self.mmap()
+        
+        if mode not in ("text", "bytes"): raise ValueError(f"Unknown Read Mode: {mode}")
+        
         # Reads the file
-        with open(self.directory) as file:
+        with self._open("r" if mode == "text" else "rb") as file:
             data = file.read()
             
         return data
+    
+    @contextlib.contextmanager
+    def _writing(self) -> Iterator[str]:
+        """Atomic Write of the File Object following its `atomic` and `durability` Settings
+
+        :return: Directory to Write the New Content to
+        :rtype: Iterator[str]
+        """
+        
+        with atomicWrite(self.directory, self.atomic, self.durability) as directory:
+            yield directory
+        
+        # Cached Reads and Status are Stale
+        READ_CACHE.invalidate(self.directory)
+        self._entry = None
+    
+    def _appended(self) -> None:
+        """Flush an Append to the Disk following the `durability` Setting
+        """
+        
+        if self.durability != "none": _fsync(self.directory)
+        
+        # Cached Reads and Status are Stale
+        READ_CACHE.invalidate(self.directory)
+        self._entry = None
+    
+    def _open(self, mode:str = "r", directory:str = None, buffering:int = -1) -> io.IOBase:
+        """Open the File Object with its Compression Codec
+
+        :param mode: `r`, `w`, `a` or `x`, with `b` for Binary, defaults to "r"
+        :type mode: str, optional
+        :param directory: Directory to Open Instead, such as a Temporary File, defaults to None
+        :type directory: str, optional
+        :param buffering: Buffer Size of Uncompressed Files, `-1` for the Default, defaults to -1
+        :type buffering: int, optional
+        :return: File Object
+        :rtype: io.IOBase
+        """
+        
+        return openFile(directory or self.directory, mode, self.compression, buffering)
+    
+    def _isEmpty(self) -> bool:
+        """Checks if the File has no Content, after Decompression
+
+        :return: `True` if the File is Empty
+        :rtype: bool
+        """
+        
+        if self.compression is None: return os.path.getsize(self.directory) == 0
+        
+        with self._open("rb") as file:
+            return not file.read(1)
+    
+    def _needsNewline(self) -> bool:
+        """Checks if the Last Line of the File is Missing its Line Ending
+
+        :return: `True` if the File is not Empty and does not End with a Line Ending
+        :rtype: bool
+        """
+        
+        # Compressed Files cannot be Read Backwards, the Stream is Decompressed to its Last Byte
+        if self.compression is not None:
+            last = b""
+            with openFile(self.directory, "rb", self.compression) as file:
+                for chunk in iter(lambda: file.read(COPY_BUFFER_SIZE), b""): last = chunk[-1:]
+            return last not in (b"", b"\n")
+        
+        with open(self.directory, "rb") as file:
+            if file.seek(0, os.SEEK_END) == 0: return False
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) != b"\n"
+    
+    def mmap(self) -> Union[mmap.mmap, memoryview]:
+        """Read-Only Memory Map of the File Object
+
+        The File is not copied into Python objects and the pages are shared between processes mapping the same File.
+
+        :raises FileNotFoundError:
+        :raises ValueError: File is Compressed
+        :return: Read-Only Map of the File, an Empty `memoryview` for Empty Files
+        :rtype: Union[mmap.mmap, memoryview]
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        if self.compression is not None: raise ValueError("Compressed Files cannot be Memory Mapped")
+        
+        with open(self.directory, "rb") as file:
+            
+            # Empty Files cannot be Mapped
+            if os.fstat(file.fileno()).st_size == 0: return memoryview(b"")
+            
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
 
     @abc.abstractmethod
+    @timed()
     def write(self, data:str) -> None:
         """Write to File Object
 
@@ -132,7 +701,7 @@ class File:
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
         # Writes to the file or input value into file
-        with open(self.directory,"w") as file:
+        with self._writing() as directory, self._open("w", directory) as file:
             file.write(data)
       
     def rename(self, name:str) -> None:
@@ -148,8 +717,8 @@ class File:
         
         directoryList = self.directory.split("/")
         
-        # File Type
-        newDirectory = "/".join(directoryList[:-1])+"/" + name + '.' +self.extension
+        # File Type, with the Compression Suffix
+        newDirectory = "/".join(directoryList[:-1])+"/" + name + directoryList[-1][len(self.name):]
         
         if newDirectory[0] == "/": newDirectory = newDirectory
         
@@ -159,9 +728,12 @@ class File:
         # Setup Directory to the Object's Directory
         self._directory = newDirectory
               
+    @timed()
     def move(self, newDirectory:str) -> None:
         """Move File Object to a new Location
 
+        Across devices the File is copied, checked, then deleted.
+
         :param newDirectory: New Directory in Location
         :type newDirectory: str
         :raises FileNotFoundError:
@@ -171,24 +743,93 @@ class File:
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
         # Rename the Directory
-        os.rename(self._directory, newDirectory)
+        try:
+            os.rename(self._directory, newDirectory)
+        except OSError as error:
+            if error.errno != errno.EXDEV: raise
+            
+            # Stream the File to the Other Device, then Delete it once the Copy is Checked
+            size = os.path.getsize(self._directory)
+            if copyFile(self._directory, newDirectory, True) != size or os.path.getsize(newDirectory) != size:
+                os.remove(newDirectory)
+                raise OSError(errno.EIO, "Copy Verification Failed", newDirectory)
+            os.remove(self._directory)
         
         # Setup Directory to the Object's Directory
         self._directory = newDirectory
     
-    def copy(self, newDirectory:str) -> str:
+    @timed()
+    def copy(self, newDirectory:str, metadata:bool = False) -> str:
         """Copy File
 
         :param newDirectory: Location for New File
         :type newDirectory: str
+        :param metadata: `True` copies Permissions and Timestamps, defaults to False
+        :type metadata: bool, optional
+        :raises FileNotFoundError:
         :return: Directory of File
         :rtype: str
         """
-        f = File(newDirectory,self.extension)
-        f.write(self.read())
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        # Stream the File to the New Location
+        f = File(newDirectory, self.extension, False)
+        copyFile(self.directory, f.directory, metadata)
         
         return newDirectory
         
+    async def aread(self, *args, **kwargs):
+        """Read the File on the Shared I/O Executor, Parsing Included, without Blocking the Event Loop
+
+        Takes the Arguments of `read`.
+
+        :return: Content of the File
+        :rtype: Any
+        """
+        return await offload(self.read, *args, **kwargs)
+
+    async def awrite(self, *args, **kwargs) -> None:
+        """Write the File on the Shared I/O Executor, Serialization Included, without Blocking the Event Loop
+
+        Takes the Arguments of `write`.
+        """
+        return await offload(self.write, *args, **kwargs)
+
+    async def acopy(self, newDirectory:str, metadata:bool = False) -> str:
+        """Copy the File on the Shared I/O Executor without Blocking the Event Loop
+
+        :param newDirectory: Location for New File
+        :type newDirectory: str
+        :param metadata: `True` copies Permissions and Timestamps, defaults to False
+        :type metadata: bool, optional
+        :return: Directory of File
+        :rtype: str
+        """
+        return await offload(self.copy, newDirectory, metadata)
+
+    async def adelete(self) -> None:
+        """Delete the File on the Shared I/O Executor without Blocking the Event Loop"""
+        return await offload(self.delete)
+
+    def stat(self) -> os.stat_result:
+        """Status of the File, Cached for the First Call when the File came from a Folder Walk
+
+        :raises FileNotFoundError:
+        :return: Status of the File
+        :rtype: os.stat_result
+        """
+        
+        # Reuse the Status Cached by `os.scandir` Once, for the Caller of the Walk; Later Calls and Moved Objects see Changes
+        entry, self._entry = self._entry, None
+        if entry is not None and entry.path == self._directory: return entry.stat()
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        return os.stat(self._directory)
+        
     @property
     def directory(self) -> str:
         """Directory of the File
@@ -206,8 +847,24 @@ class File:
         :rtype: str
         """
         
-        directoryList = self._directory.split("/")
-        return directoryList[-1].split(".")[-1]
+        suffixes = self._directory.split("/")[-1].split(".")
+        
+        # Extension before the Compression Suffix
+        if len(suffixes) > 2 and suffixes[-1] in COMPRESSION_SUFFIXES: return suffixes[-2]
+        
+        return suffixes[-1]
+    
+    @property
+    def compression(self) -> str:
+        """Compression Codec of the File Object
+
+        :return: Codec Given to the File or Matching its Suffix, `None` if Not Compressed
+        :rtype: str
+        """
+        
+        if self._compression is not None: return self._compression
+        
+        return COMPRESSION_SUFFIXES.get(self._directory.split("/")[-1].split(".")[-1])
     
     @property
     def name(self) -> str:
@@ -233,24 +890,96 @@ class File:
 
 # TXT File Object
 class TXT(File):
-    def __init__(self, directory:str = None, creation:bool = True) -> None:
+    EXTENSION = "txt"
+    
+    def __init__(self, directory:str = None, creation:bool = True, compression:str = None) -> None:
         """Text File Object
 
         :param directory: Text File Directory, defaults to None
         :type directory: str, optional
+        :param compression: Compression Codec, defaults to the Codec of the Suffix
+        :type compression: str, optional
         """
-        super().__init__(directory,"txt", creation) 
+        super().__init__(directory, self.EXTENSION, creation, compression) 
+    
+    def iterLines(self, keepEnds:bool = False) -> Iterator[str]:
+        """Lazy Lines of the Text File, Read with a Buffer
+
+        :param keepEnds: `True` keeps the Line Endings, defaults to False
+        :type keepEnds: bool, optional
+        :raises FileNotFoundError:
+        :return: Lines of the Text File
+        :rtype: Iterator[str]
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        with self._open("r") as file:
+            for line in file:
+                if not keepEnds and line.endswith("\n"): line = line[:-1]
+                yield line
+    
+    @timed()
+    def append(self, lines:Union[str, Iterable[str]]) -> None:
+        """Append Lines to the Text File without Rewriting it
+
+        :param lines: Line or Lines to Append, Line Endings are Added when Missing
+        :type lines: Union[str, Iterable[str]]
+        :raises FileNotFoundError:
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        # Single Line
+        if isinstance(lines, str): lines = [lines]
+        
+        # Close the Last Line before Appending
+        newline = self._needsNewline()
+        
+        with self._open("a", buffering=APPEND_BUFFER_SIZE) as file:
+            if newline: file.write("\n")
+            file.writelines(line if line.endswith("\n") else line + "\n" for line in lines)
+        
+        self._appended()
 
 # JSON File Object
 class JSON(File):
-    def __init__(self, directory:str = None, creation:bool = True) -> None:
+    EXTENSION = "json"
+    
+    def __init__(self, directory:str = None, creation:bool = True, backend:str = None, compact:bool = False, compression:str = None) -> None:
         """JSON File Object
 
         :param directory: JSON File Directory, defaults to None
         :type directory: str, optional
+        :param backend: JSON Serializer from `JSON_BACKENDS`, defaults to `JSON_BACKEND`
+        :type backend: str, optional
+        :param compact: `True` writes without Indentation or Spaces, defaults to False
+        :type compact: bool, optional
+        :param compression: Compression Codec, defaults to the Codec of the Suffix
+        :type compression: str, optional
+        :raises ValueError: Backend is not Installed
         """
         
-        super().__init__(directory,"json",creation)
+        # JSON Serializer
+        if backend is None: backend = JSON_BACKEND
+        if backend not in JSON_BACKENDS: raise ValueError(f"JSON Backend is not Installed: {backend}")
+        self._backend = backend
+        
+        # Write without Indentation
+        self.compact = compact
+        
+        super().__init__(directory, self.EXTENSION, creation, compression)
+    
+    @property
+    def backend(self) -> str:
+        """JSON Serializer used by the File
+
+        :return: Name of the JSON Serializer
+        :rtype: str
+        """
+        return self._backend
 
     def create(self) -> None:
         """Create JSON File
@@ -263,14 +992,31 @@ class JSON(File):
         # Setup Directory to the Object's Directory
         if self.exists(): raise FileExistsError("File Already Exists")
         
-        # Create a JSON File 
-        with open(self.directory,'x') as file:
-            file.close()
-            
-        # Make the JSON File Empty
-        with open(self.directory, "w") as file:
-            json.dump({}, file, indent = 6)
+        # Create a JSON File with an Empty Object
+        with self._open("xb") as file:
+            file.write(self.encode({}))
+    
+    def encode(self, data) -> bytes:
+        """Serialize Data with the File's JSON Backend
+
+        :param data: Data to Serialize
+        :type data: Any
+        :return: JSON Document
+        :rtype: bytes
+        """
+        return JSON_BACKENDS[self._backend][0](data, self.compact)
+    
+    def decode(self, raw:bytes):
+        """Parse Data with the File's JSON Backend
+
+        :param raw: JSON Document
+        :type raw: bytes
+        :return: Parsed Data
+        :rtype: Any
+        """
+        return JSON_BACKENDS[self._backend][1](raw)
 
+    @timed()
     def read(self) -> dict:
         """Read in JSON File
 
@@ -285,11 +1031,23 @@ class JSON(File):
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
         # Reading in the Data
-        with open(self.directory, "r") as file:
-            data = json.load(file)
-            
-        return data
+        return READ_CACHE.get(("JSON", self.directory, self._backend), self.directory, lambda: self.decode(self.readBytes()))
+    
+    def readBytes(self) -> bytes:
+        """Read in the JSON File without Parsing it
+
+        :raises FileNotFoundError:
+        :return: JSON Document
+        :rtype: bytes
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        with self._open("rb") as file:
+            return file.read()
 
+    @timed()
     def write(self, data:dict) -> None:
         """Write to JSON File
 
@@ -300,27 +1058,133 @@ class JSON(File):
         :raises TypeError: Directory is not a `str`
         """
         
+        # Serialize before Touching the File
+        self.writeBytes(self.encode(data))
+    
+    def writeBytes(self, raw:bytes) -> None:
+        """Write an Already Serialized JSON Document to the File
+
+        :param raw: JSON Document
+        :type raw: bytes
+        :raises FileNotFoundError:
+        """
+        
         # Setup Directory to the Object's Directory
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
         # Write to JSON File
-        with open(self.directory, "w") as file:
-            json.dump(data, file, indent = 6)
+        with self._writing() as directory, self._open("wb", directory) as file:
+            file.write(raw)
+
+# JSON Lines File Object
+class JSONL(File):
+    EXTENSION = "jsonl"
+    
+    def __init__(self, directory:str = None, creation:bool = True, compression:str = None) -> None:
+        """JSON Lines File Object, One Compact JSON Record per Line, Serialized with `JSON_BACKEND`
+
+        :param directory: JSON Lines File Directory, defaults to None
+        :type directory: str, optional
+        :param compression: Compression Codec, defaults to the Codec of the Suffix
+        :type compression: str, optional
+        """
+        
+        super().__init__(directory, self.EXTENSION, creation, compression)
+    
+    @timed()
+    def read(self) -> list:
+        """Read in JSON Lines File
+
+        :raises FileNotFoundError:
+        :return: Records of the JSON Lines File
+        :rtype: list
+        """
+        
+        return list(self.iterRecords())
+    
+    def iterRecords(self) -> Iterator:
+        """Lazy Records of the JSON Lines File
+
+        :raises FileNotFoundError:
+        :return: Records of the JSON Lines File
+        :rtype: Iterator
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        loads = JSON_BACKENDS[JSON_BACKEND][1]
+        
+        with self._open("rb") as file:
+            for line in file:
+                
+                # Skip Blank Lines
+                if line.strip(): yield loads(line)
+    
+    @timed()
+    def write(self, records:Iterable) -> None:
+        """Write Records to JSON Lines File
+
+        :param records: New JSON Lines File Records
+        :type records: Iterable
+        :raises FileNotFoundError:
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        dumps = JSON_BACKENDS[JSON_BACKEND][0]
+        
+        with self._writing() as directory, self._open("wb", directory, APPEND_BUFFER_SIZE) as file:
+            file.writelines(dumps(record, True) + b"\n" for record in records)
+    
+    @timed()
+    def append(self, record) -> None:
+        """Append a Record to the JSON Lines File without Rewriting it
+
+        :param record: Record to Append
+        :type record: Any
+        :raises FileNotFoundError:
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        # Close the Last Line before Appending
+        line = JSON_BACKENDS[JSON_BACKEND][0](record, True) + b"\n"
+        if self._needsNewline(): line = b"\n" + line
+        
+        with self._open("ab") as file:
+            file.write(line)
+        
+        self._appended()
 
 # CSV File Object
 class CSV(File):
-    def __init__(self, directory:str = None, creation:bool = True) -> None:
+    EXTENSION = "csv"
+    
+    def __init__(self, directory:str = None, creation:bool = True, compression:str = None) -> None:
         """CSV File Object
 
         :param directory: CSV File Directory, defaults to None
         :type directory: str, optional
+        :param compression: Compression Codec, defaults to the Codec of the Suffix
+        :type compression: str, optional
         """
         
-        super().__init__(directory, "csv",creation)
+        # Columns of the File Header, Checked Once by `append`
+        self._header = None
+        
+        super().__init__(directory, self.EXTENSION, creation, compression)
 
-    def read(self) -> pandas.DataFrame:
+    @timed()
+    def read(self, usecols:list = None, dtype:Union[type, dict] = None) -> pandas.DataFrame:
         """CSV Read File
 
+        :param usecols: Columns to Read, Names or Positions after the Index, defaults to None
+        :type usecols: list, optional
+        :param dtype: Data Type of the Columns, defaults to None
+        :type dtype: Union[type, dict], optional
         :raises ValueError: No Directory
         :raises TypeError: Directory is not a `str`
         :return: CSV File Data
@@ -331,15 +1195,123 @@ class CSV(File):
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
         # Get Dataframe
-        try:
-            df = pandas.read_csv(self.directory,index_col=0)
-            
-        except pandas.errors.EmptyDataError:
-            df = pandas.DataFrame()
+        def load() -> pandas.DataFrame:
+            try:
+                with self._readSource(usecols, dtype) as (source, options):
+                    return pandas.read_csv(source, **options)
+                
+            except pandas.errors.EmptyDataError:
+                return pandas.DataFrame()
         
         # Return Dataframe of the CSV Data
-        return df
+        return READ_CACHE.get(("CSV", self.directory, repr(usecols), repr(dtype)), self.directory, load)
+    
+    def iterChunks(self, chunkSize:int = 100000, usecols:list = None, dtype:Union[type, dict] = None) -> Iterator[pandas.DataFrame]:
+        """Lazy Chunks of the CSV File, Holding One Chunk in Memory at a Time
 
+        :param chunkSize: Number of Rows per Chunk, defaults to 100000
+        :type chunkSize: int, optional
+        :param usecols: Columns to Read, Names or Positions after the Index, defaults to None
+        :type usecols: list, optional
+        :param dtype: Data Type of the Columns, defaults to None
+        :type dtype: Union[type, dict], optional
+        :raises FileNotFoundError:
+        :return: Chunks of the CSV File Data, a Single Empty Dataframe for Empty Files
+        :rtype: Iterator[pandas.DataFrame]
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        with contextlib.ExitStack() as stack:
+            try:
+                source, options = stack.enter_context(self._readSource(usecols, dtype))
+                reader = pandas.read_csv(source, chunksize=chunkSize, **options)
+                
+            except pandas.errors.EmptyDataError:
+                yield pandas.DataFrame()
+                return
+            
+            with reader:
+                yield from reader
+    
+    def convert(self, fileType:type, directory:str = None) -> File:
+        """Convert the CSV File to another Dataframe File
+
+        :param fileType: File Object to Convert to, such as `Parquet` or `Feather`
+        :type fileType: type
+        :param directory: Directory of the New File, defaults to the CSV Directory with the New Extension
+        :type directory: str, optional
+        :raises FileNotFoundError:
+        :return: New File Object
+        :rtype: File
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        # Same Name with the New Extension, Dropping the Compression Suffix
+        if directory is None:
+            directory = os.path.join(os.path.dirname(self.directory), f"{self.name}.{fileType.EXTENSION}")
+        
+        f = fileType(directory)
+        f.write(self.read())
+        
+        return f
+    
+    def toParquet(self, directory:str = None) -> "Parquet":
+        """Convert the CSV File to a Parquet File
+
+        :param directory: Directory of the Parquet File, defaults to the CSV Directory with the `parquet` Extension
+        :type directory: str, optional
+        :raises FileNotFoundError:
+        :return: Parquet File Object
+        :rtype: Parquet
+        """
+        
+        return self.convert(Parquet, directory)
+    
+    @contextlib.contextmanager
+    def _readSource(self, usecols:list = None, dtype:Union[type, dict] = None) -> Iterator[tuple]:
+        """Source and Options of `pandas.read_csv` Shared by the Read Paths, Opening the File at Most Once
+
+        Plain Files are passed by Path so the C Parser reads them directly; Compressed Files and Column Selections are read from one Binary Stream.
+
+        :param usecols: Columns to Read, Names or Positions after the Index, defaults to None
+        :type usecols: list, optional
+        :param dtype: Data Type of the Columns, defaults to None
+        :type dtype: Union[type, dict], optional
+        :raises pandas.errors.EmptyDataError: Empty File
+        :return: Path or Binary File Object, and the Options of `pandas.read_csv`
+        :rtype: Iterator[tuple]
+        """
+        
+        # First Column is the Index
+        options = {"index_col":0}
+        
+        if dtype is not None: options["dtype"] = dtype
+        
+        if usecols is None and self.compression is None:
+            yield self.directory, options
+            return
+        
+        with contextlib.ExitStack() as stack:
+            file = stack.enter_context(self._open("rb"))
+            
+            if usecols is not None:
+                
+                # Header Names from the First Line, the Index Column is Always Read
+                header = list(pandas.read_csv(io.BytesIO(file.readline()), nrows=0).columns)
+                columns = [header[c + 1] if isinstance(c, int) else c for c in usecols]
+                options["usecols"] = [header[0]] + [c for c in columns if c != header[0]]
+                
+                # Rewind to the Header, Streams that cannot Seek are Opened Again
+                if file.seekable(): file.seek(0)
+                else: file = stack.enter_context(self._open("rb"))
+            
+            yield file, options
+
+    @timed()
     def write(self, df:pandas.DataFrame) -> None:
         """Write to CSV File Data
 
@@ -352,22 +1324,70 @@ class CSV(File):
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
         # Write to CSV
-        df.to_csv(self.directory, index=True)
+        with self._writing() as directory, self._open("w", directory) as file:
+            df.to_csv(file, index=True)
+        
+        # Header is Known after a Write
+        self._header = [str(c) for c in df.columns]
+    
+    @timed()
+    def append(self, df:pandas.DataFrame) -> None:
+        """Append Rows to the CSV File without Rewriting it
+
+        The header is written to empty files and checked once against the Dataframe, later appends only write rows.
+
+        :param df: Dataframe of the Rows to Append
+        :type df: pandas.DataFrame
+        :raises FileNotFoundError:
+        :raises ValueError: Columns do not Match the File Header
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        columns = [str(c) for c in df.columns]
+        
+        # Empty Files get the Header
+        if self._isEmpty():
+            with self._open("a") as file:
+                df.to_csv(file, index=True)
+            self._header = columns
+            self._appended()
+            return
+        
+        # Read the Header Once
+        if self._header is None:
+            with self._open("r") as file:
+                self._header = list(pandas.read_csv(file, nrows=0, index_col=0).columns)
+        
+        if columns != self._header: raise ValueError(f"Columns {columns} do not Match the File Header {self._header}")
+        
+        # Append the Rows Only
+        with self._open("a") as file:
+            df.to_csv(file, index=True, header=False)
+        self._appended()
 
 # Bin File Object
 class BIN(File):
-    def __init__(self, directory:str = None, creation:bool = True) -> None:
+    EXTENSION = "bin"
+    
+    def __init__(self, directory:str = None, creation:bool = True, compression:str = None) -> None:
         """BIN File Object
 
         :param directory: BIN File Directory, defaults to None
         :type directory: str, optional
+        :param compression: Compression Codec Used by `write`, defaults to the Codec of the Suffix
+        :type compression: str, optional
         """
         
-        super().__init__(directory, "bin", creation)
+        super().__init__(directory, self.EXTENSION, creation, compression)
 
-    def read(self):
+    @timed()
+    def read(self, mmapMode:str = None):
         """BIN Read File
 
+        :param mmapMode: Memory Map NumPy Arrays in the File instead of Loading them (`r`, `r+`, `w+`, `c`), the File must be Written without Compression, defaults to None
+        :type mmapMode: str, optional
         :raises ValueError: No Directory
         :raises TypeError: Directory is not a `str`
         :return: BIN File Data
@@ -377,20 +1397,211 @@ class BIN(File):
         # Setup Directory to the Object's Directory
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
-        return load(self.directory)
+        # Memory Mapped Arrays are not Cached
+        if mmapMode is not None: return joblib.load(self.directory, mmap_mode=mmapMode)
+        
+        return READ_CACHE.get(("BIN", self.directory), self.directory, lambda: joblib.load(self.directory))
     
-    def write(self, obj:object) -> None:
+    @timed()
+    def write(self, obj:object, compress:Union[bool, int, tuple] = True) -> None:
         """Write to BIN File Data
 
         :param obj: Class or Object that you want to save for later
         :type df: object
+        :param compress: `False`, `True`, a Level from 0 to 9 or a (Codec, Level) Pair such as `("lz4", 1)`, the Codec is the File `compression` or `zlib`, `False` lets `read` Memory Map the Arrays, defaults to True
+        :type compress: Union[bool, int, tuple], optional
         :raises ValueError: No Directory
+        :raises ValueError: Codec is not Supported by `joblib`
         """
         # Setup Directory to the Object's Directory
         if not self.exists(): raise FileExistsError("File Does Not Exists")
         
+        # Codec of the File with the Level Asked for
+        if self.compression is not None and compress is not False and not isinstance(compress, tuple):
+            if self.compression == "zstd": raise ValueError("BIN Files cannot be Compressed with zstd")
+            compress = (self.compression, COMPRESSION_LEVELS[self.compression] if compress is True else compress)
+        
         # Write to BIN
-        dump(obj, self.directory, True)
+        with self._writing() as directory:
+            joblib.dump(obj, directory, compress)
+
+# Parquet File Object
+class Parquet(File):
+    EXTENSION = "parquet"
+    
+    def __init__(self, directory:str = None, creation:bool = True) -> None:
+        """Parquet File Object, Columnar Dataframe Storage (Requires `pyarrow`)
+
+        :param directory: Parquet File Directory, defaults to None
+        :type directory: str, optional
+        """
+        
+        super().__init__(directory, self.EXTENSION, creation)
+    
+    def create(self) -> None:
+        """Create Parquet File with an Empty Dataframe
+
+        :raises FileExistsError: File Already Exists
+        """
+        
+        # Setup Directory to the Object's Directory
+        if self.exists(): raise FileExistsError("File Already Exists")
+        
+        pandas.DataFrame().to_parquet(self.directory)
+    
+    @timed()
+    def read(self, columns:list = None, filters:list = None) -> pandas.DataFrame:
+        """Parquet Read File, Skipping the Columns and Row Groups not Asked for
+
+        :param columns: Columns to Read, defaults to None
+        :type columns: list, optional
+        :param filters: Row Filters such as `[("year", ">=", 2020)]`, Row Groups Outside them are not Read, defaults to None
+        :type filters: list, optional
+        :raises FileNotFoundError:
+        :return: Parquet File Data
+        :rtype: pandas.DataFrame
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        return READ_CACHE.get(
+            ("Parquet", self.directory, repr(columns), repr(filters))
+            , self.directory
+            , lambda: pandas.read_parquet(self.directory, columns=columns, filters=filters)
+        )
+
+    def iterChunks(self, chunkSize:int = 100000, columns:list = None) -> Iterator[pandas.DataFrame]:
+        """Lazy Chunks of the Parquet File, Reading One Row Group at a Time
+
+        :param chunkSize: Most Rows per Chunk, defaults to 100000
+        :type chunkSize: int, optional
+        :param columns: Columns to Read, defaults to None
+        :type columns: list, optional
+        :raises FileNotFoundError:
+        :return: Chunks of the Parquet File Data
+        :rtype: Iterator[pandas.DataFrame]
+        """
+        import pyarrow.parquet
+
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+
+        with open(self.directory, "rb") as handle:
+            file = pyarrow.parquet.ParquetFile(handle)
+            for group in range(file.num_row_groups):
+                df = file.read_row_group(group, columns=columns, use_pandas_metadata=True).to_pandas()
+                for start in range(0, len(df), chunkSize):
+                    yield df.iloc[start:start + chunkSize]
+
+    @timed()
+    def write(self, df:pandas.DataFrame, rowGroupSize:int = None, compression:str = "snappy") -> None:
+        """Write to Parquet File Data
+
+        :param df: Dataframe to write Parquet
+        :type df: pandas.DataFrame
+        :param rowGroupSize: Rows per Row Group, Smaller Groups Filter Finer, defaults to None
+        :type rowGroupSize: int, optional
+        :param compression: Compression of the Columns, defaults to "snappy"
+        :type compression: str, optional
+        :raises FileNotFoundError:
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        # Write to Parquet
+        with self._writing() as directory:
+            df.to_parquet(directory, index=True, compression=compression, row_group_size=rowGroupSize)
+
+# Feather File Object
+class Feather(File):
+    EXTENSION = "feather"
+    
+    def __init__(self, directory:str = None, creation:bool = True) -> None:
+        """Feather File Object, Uncompressed Columnar Dataframe Storage (Requires `pyarrow`)
+
+        :param directory: Feather File Directory, defaults to None
+        :type directory: str, optional
+        """
+        
+        super().__init__(directory, self.EXTENSION, creation)
+    
+    def create(self) -> None:
+        """Create Feather File with an Empty Dataframe
+
+        :raises FileExistsError: File Already Exists
+        """
+        
+        # Setup Directory to the Object's Directory
+        if self.exists(): raise FileExistsError("File Already Exists")
+        
+        pandas.DataFrame().to_feather(self.directory)
+    
+    @timed()
+    def read(self, columns:list = None) -> pandas.DataFrame:
+        """Feather Read File, Skipping the Columns not Asked for
+
+        :param columns: Columns to Read, defaults to None
+        :type columns: list, optional
+        :raises FileNotFoundError:
+        :return: Feather File Data
+        :rtype: pandas.DataFrame
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        return READ_CACHE.get(
+            ("Feather", self.directory, repr(columns))
+            , self.directory
+            , lambda: pandas.read_feather(self.directory, columns=columns)
+        )
+    
+    @timed()
+    def write(self, df:pandas.DataFrame) -> None:
+        """Write to Feather File Data
+
+        :param df: Dataframe to write Feather
+        :type df: pandas.DataFrame
+        :raises FileNotFoundError:
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise FileExistsError("File Does Not Exists")
+        
+        # Write to Feather
+        with self._writing() as directory:
+            df.to_feather(directory)
+
+# File Objects by Extension
+FILE_TYPES = {
+    "txt": TXT
+    , "json": JSON
+    , "jsonl": JSONL
+    , "csv": CSV
+    , "bin": BIN
+    , "parquet": Parquet
+    , "feather": Feather
+}
+
+def fromPath(directory:str, creation:bool = False) -> File:
+    """File Object Matching the Extension of a Directory
+
+    :param directory: Directory of the File
+    :type directory: str
+    :param creation: `True` creates the File if it does not Exist, defaults to False
+    :type creation: bool, optional
+    :return: `TXT`, `JSON`, `CSV`, `BIN` or `File` Object
+    :rtype: File
+    """
+    
+    # Extension of the File, before any Compression Suffix
+    extension = File(directory, creation=False).extension
+    
+    if extension in FILE_TYPES: return FILE_TYPES[extension](directory, creation)
+    
+    return File(directory, extension, creation)
  
 # Folder Object
 class Folder:
@@ -521,16 +1732,30 @@ class Folder:
         
         return os.path.isfile(self.directory+"/"+name) 
     
-    def copy(self, newDirectory:str) -> str:
-        Folder(newDirectory)
+    def copy(self, newDirectory:str, metadata:bool = False, workers:int = None) -> str:
+        """Copy the Folder and its Content with `utils.folder.Folder.copy`
 
-        for x in self.content:
-            if os.path.isfile(x):
-                file = File(x)
-                file.copy(f"{newDirectory}/{file.name}.{file.extension}")
-            else:
-                folder = Folder(x)
-                folder.copy(f"{newDirectory}/{folder.name}")
+        :param newDirectory: Location for New Folder
+        :type newDirectory: str
+        :param metadata: `True` copies Permissions and Timestamps, defaults to False
+        :type metadata: bool, optional
+        :param workers: Number of Threads Copying Files, `None` copies one File at a Time, defaults to None
+        :type workers: int, optional
+        :raises ValueError: No Directory
+        :raises shutil.Error: Files could not be Copied
+        :return: Directory of the New Folder
+        :rtype: str
+        """
+        # Imported Here, as `utils.folder` Imports this Module
+        from .folder import Folder as _Folder
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise ValueError("Directory Does Not Exists")
+        
+        target = Folder(newDirectory, False)
+        _Folder(self.directory, False).copy(target.directory, metadata, workers)
+        
+        return target.directory
                 
     @property
     def name(self) -> str:
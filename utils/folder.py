@@ -1,7 +1,210 @@
 import os
 import shutil
-from .file import File
-from .utils import LOCAL_DIRECTORY
+import time
+import fnmatch
+import itertools
+import contextlib
+import hashlib
+import heapq
+import errno
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import AsyncIterator, Callable, Iterable, Iterator, Union
+from .file import File, copyFile, fromPath, atomicWrite, JSON_BACKENDS, COPY_BUFFER_SIZE
+from . import file as fileModule
+from .functions import timed
+from .utils import LOCAL_DIRECTORY, IO_WORKERS, LazyModule, isInstalled, offload
+
+# Content Index Kept at the Root of a Synced Folder, Left out of the Content, Walks, Copies and Statistics
+MANIFEST_NAME = ".utils-manifest.json"
+
+# Content Hash of the Manifest: xxHash when Installed, else BLAKE2b
+HASH_ALGORITHM = "xxh3_128" if isInstalled("xxhash") else "blake2b"
+xxhash = LazyModule("xxhash")
+
+def _hashFile(directory:str) -> str:
+    """Content Hash of a File, Read in Chunks
+
+    :param directory: Directory of the File
+    :type directory: str
+    :return: Hexadecimal Digest with `HASH_ALGORITHM`
+    :rtype: str
+    """
+    digest = xxhash.xxh3_128() if HASH_ALGORITHM == "xxh3_128" else hashlib.blake2b(digest_size=16)
+    with open(directory, "rb") as file:
+        while chunk := file.read(COPY_BUFFER_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Files Unlinked per Task of a Folder Delete
+DELETE_CHUNK_SIZE = 256
+
+def _deletePlan(directory:str) -> tuple:
+    """Files and Folders of a Tree, without Following Symbolic Links
+
+    :param directory: Directory of the Folder
+    :type directory: str
+    :return: Directories of the Files, and of the Folders Deepest First
+    :rtype: tuple
+    """
+    files = []
+    folders = []
+    stack = [directory]
+    while stack:
+        folder = stack.pop()
+        folders.append(folder)
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False): stack.append(entry.path)
+                else: files.append(entry.path)
+
+    # Every Folder was Listed before its Sub Folders
+    folders.reverse()
+    return files, folders
+
+def _unlinkMany(directories:list) -> tuple:
+    """Delete Files, Collecting the Errors
+
+    :param directories: Directories of the Files
+    :type directories: list
+    :return: Number of Files Deleted, and the Errors by Directory
+    :rtype: tuple
+    """
+    removed = 0
+    errors = {}
+    for directory in directories:
+        try:
+            os.unlink(directory)
+            removed += 1
+        except FileNotFoundError:
+            removed += 1
+        except OSError as error:
+            errors[directory] = error
+    return removed, errors
+
+def _raiseErrors(errors:dict) -> None:
+    """Raise the Errors of a Bulk Operation as One `shutil.Error`, like `shutil.copytree`
+
+    :param errors: Errors by Directory
+    :type errors: dict
+    :raises shutil.Error: `errors` is not Empty, Chained to the First Error
+    """
+    if not errors: return
+    raise shutil.Error([(directory, str(error)) for directory, error in errors.items()]) from next(iter(errors.values()))
+
+def _runJobs(function:Callable, jobs:list, summary:dict, counter:str = "files", workers:int = None, progress:Callable = None, total:int = None) -> dict:
+    """Run the Jobs of a Bulk Operation, on a Thread Pool when `workers` is Set, Adding their Results to its Summary
+
+    :param function: Called with the Arguments of each Job, Returns the Bytes Written
+    :type function: Callable
+    :param jobs: Arguments of each Job, the First one Keys its Error
+    :type jobs: list
+    :param summary: Summary of the Operation, with `bytes` and `errors`
+    :type summary: dict
+    :param counter: Entry of the Summary Counting the Jobs Done, defaults to "files"
+    :type counter: str, optional
+    :param workers: Number of Threads, `None` runs one Job at a Time, defaults to None
+    :type workers: int, optional
+    :param progress: Called with the Bytes Written and `total` after each Job, defaults to None
+    :type progress: Callable, optional
+    :param total: Total Bytes Given to `progress`, defaults to None
+    :type total: int, optional
+    :return: The Summary
+    :rtype: dict
+    """
+    
+    def collect(key:str, result:Callable) -> None:
+        try:
+            summary["bytes"] += result()
+            summary[counter] += 1
+        except OSError as error:
+            summary["errors"][key] = error
+        if progress is not None: progress(summary["bytes"], total)
+    
+    if workers is None:
+        for job in jobs: collect(job[0], lambda: function(*job))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(function, *job):job[0] for job in jobs}
+            for future in as_completed(futures): collect(futures[future], future.result)
+    
+    return summary
+
+def _copyEntry(source:str, destination:str, metadata:bool) -> int:
+    """Copy one Entry of a Folder Copy, Recreating Symbolic Links as Links
+
+    :param source: Directory of the Entry
+    :type source: str
+    :param destination: Directory of the Copy
+    :type destination: str
+    :param metadata: `True` copies Permissions and Timestamps
+    :type metadata: bool
+    :return: Bytes Copied
+    :rtype: int
+    """
+    if os.path.islink(source):
+        os.symlink(os.readlink(source), destination)
+        return 0
+    return copyFile(source, destination, metadata)
+
+def _device(directory:str) -> int:
+    """Device of a Directory, or of its Closest Existing Parent
+
+    :param directory: Directory, which may not Exist
+    :type directory: str
+    :return: Device Number
+    :rtype: int
+    """
+    directory = os.path.abspath(directory)
+    while not os.path.exists(directory): directory = os.path.dirname(directory)
+    return os.stat(directory).st_dev
+
+# Listings of Scanned Folders by (Directory, Follow Links), Valid while the Folder's `mtime_ns` is Unchanged
+_SCAN_CACHE = {}
+
+# Most Folders Kept in the Scan Cache before it is Cleared
+SCAN_CACHE_SIZE = 100_000
+
+def _scanFolder(directory:str, followLinks:bool, cache:bool) -> tuple:
+    """Status of the Files and Sub Folders Directly in a Folder
+
+    Adding, removing or renaming an entry changes the Folder's `mtime_ns`, so a cached listing is reused until then.
+
+    :param directory: Directory of the Folder
+    :type directory: str
+    :param followLinks: `True` lists Symbolic Links to Folders as Folders
+    :type followLinks: bool
+    :param cache: `True` reuses and stores the Listing in the Scan Cache
+    :type cache: bool
+    :return: `(name, size, disk size, device, inode, links)` of the Files and the Directories of the Sub Folders
+    :rtype: tuple
+    """
+
+    key = (directory, followLinks)
+    mtime = os.stat(directory).st_mtime_ns
+    if cache:
+        cached = _SCAN_CACHE.get(key)
+        if cached is not None and cached[0] == mtime: return cached[1]
+
+    files = []
+    folders = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Entries Removed during the Scan are Skipped
+            try:
+                if entry.is_dir(follow_symlinks=followLinks):
+                    folders.append(entry.path)
+                elif entry.name != MANIFEST_NAME:
+                    status = entry.stat(follow_symlinks=False)
+                    blocks = getattr(status, "st_blocks", None)
+                    files.append((entry.name, status.st_size, status.st_size if blocks is None else blocks * 512, status.st_dev, status.st_ino, status.st_nlink))
+            except FileNotFoundError:
+                continue
+
+    if cache:
+        if len(_SCAN_CACHE) >= SCAN_CACHE_SIZE: _SCAN_CACHE.clear()
+        _SCAN_CACHE[key] = (mtime, (files, folders))
+
+    return files, folders
 
 # Folder Object
 class Folder:
@@ -20,6 +223,9 @@ class Folder:
         # Set Directory Variable
         self._directory = directory
         
+        # Cached `os.DirEntry` when Created from a Folder Walk
+        self._entry = None
+        
         # Create the Directory
         if creation is True and not self.exists():
             self.create()
@@ -39,7 +245,109 @@ class Folder:
         # Setup Directory to the Object's Directory
         if not self.exists(): raise ValueError("Directory Does Not Exists")
         
-        return [f"{self.directory}/{f}" for f in os.listdir(self.directory)]
+        return [f"{self.directory}/{f}" for f in os.listdir(self.directory) if f != MANIFEST_NAME]
+    
+    def iterContent(self, pattern:str = None, extensions:Iterable[str] = None, files:bool = True, folders:bool = True) -> Iterator[Union[File, "Folder"]]:
+        """Lazy Content in the Folder, without Recursion
+
+        :param pattern: Glob Pattern the Names must Match, defaults to None
+        :type pattern: str, optional
+        :param extensions: File Extensions to Keep, defaults to None
+        :type extensions: Iterable[str], optional
+        :param files: `True` yields Files, defaults to True
+        :type files: bool, optional
+        :param folders: `True` yields Folders, defaults to True
+        :type folders: bool, optional
+        :return: File and Folder Objects in the Folder
+        :rtype: Iterator[Union[File, Folder]]
+        """
+        
+        return self.walk(False, pattern, extensions, files=files, folders=folders)
+    
+    def walk(self, recursive:bool = True, pattern:str = None, extensions:Iterable[str] = None, maxDepth:int = None, files:bool = True, folders:bool = True, followLinks:bool = False) -> Iterator[Union[File, "Folder"]]:
+        """Lazy Walk through the Folder with `os.scandir`
+
+        Entries are never listed in full and their type comes from the `os.DirEntry` cache, so no extra stat is made per entry.
+
+        :param recursive: `True` walks into Sub Folders, defaults to True
+        :type recursive: bool, optional
+        :param pattern: Glob Pattern the Names must Match, defaults to None
+        :type pattern: str, optional
+        :param extensions: File Extensions to Keep, defaults to None
+        :type extensions: Iterable[str], optional
+        :param maxDepth: Deepest Sub Folder Level to Walk, `0` is the Folder Itself, defaults to None
+        :type maxDepth: int, optional
+        :param files: `True` yields Files, defaults to True
+        :type files: bool, optional
+        :param folders: `True` yields Folders, defaults to True
+        :type folders: bool, optional
+        :param followLinks: `True` walks into Symbolic Links to Folders, defaults to False
+        :type followLinks: bool, optional
+        :raises ValueError: No Directory
+        :return: File and Folder Objects in the Folder
+        :rtype: Iterator[Union[File, Folder]]
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise ValueError("Directory Does Not Exists")
+        
+        # Extensions without the Leading Dot
+        if extensions is not None: extensions = {e.lstrip(".") for e in extensions}
+        
+        # Folders Left to Walk with their Depth
+        stack = [(self.directory, 0)]
+        
+        while stack:
+            directory, depth = stack.pop()
+            
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                # Sub Folders Removed or not Readable are Skipped, the Folder Itself must be Read
+                if directory == self.directory: raise
+                continue
+            
+            with entries:
+                for entry in entries:
+                    
+                    if entry.is_dir(follow_symlinks=followLinks):
+                        
+                        # Walk the Sub Folder Later
+                        if recursive and (maxDepth is None or depth < maxDepth):
+                            stack.append((entry.path, depth + 1))
+                        
+                        if not folders or extensions is not None: continue
+                        if pattern is not None and not fnmatch.fnmatch(entry.name, pattern): continue
+                        
+                        item = Folder(entry.path, False)
+                    
+                    else:
+                        if not files or entry.name == MANIFEST_NAME: continue
+                        if pattern is not None and not fnmatch.fnmatch(entry.name, pattern): continue
+                        if extensions is not None and entry.name.split(".")[-1] not in extensions: continue
+                        
+                        item = fromPath(entry.path)
+                        
+                    # Keep the Entry to Reuse its Cached Status
+                    item._entry = entry
+                    yield item
+    
+    def stat(self) -> os.stat_result:
+        """Status of the Folder, Cached for the First Call when the Folder came from a Folder Walk
+
+        :raises ValueError: No Directory
+        :return: Status of the Folder
+        :rtype: os.stat_result
+        """
+        
+        # Reuse the Status Cached by `os.scandir` Once, for the Caller of the Walk; Later Calls and Moved Objects see Changes
+        entry, self._entry = self._entry, None
+        if entry is not None and entry.path == self._directory: return entry.stat()
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise ValueError("Directory Does Not Exists")
+        
+        return os.stat(self._directory)
     
     def exists(self) -> bool:
         """Checks existence of the Folder
@@ -67,20 +375,65 @@ class Folder:
         except FileExistsError:
             pass
         
-    def delete(self) -> None:
-        """Delete Folder
+    @timed()
+    def delete(self, workers:int = None, progress:Callable = None, dryRun:bool = False, ignoreErrors:bool = False) -> dict:
+        """Delete Folder and its Content
 
+        Files are unlinked in chunks, on a thread pool when `workers` is set, then the emptied Folders are removed deepest first.
+
+        :param workers: Number of Threads Deleting Files, `None` Deletes one Chunk at a Time, defaults to None
+        :type workers: int, optional
+        :param progress: Called with the Entries Deleted and the Total Entries as the Delete Advances, defaults to None
+        :type progress: Callable, optional
+        :param dryRun: `True` only Counts what would be Deleted, defaults to False
+        :type dryRun: bool, optional
+        :param ignoreErrors: `True` Collects the Entries that could not be Deleted in `errors` instead of Raising, defaults to False
+        :type ignoreErrors: bool, optional
         :raises ValueError: No Directory
+        :raises shutil.Error: Entries could not be Deleted, unless `ignoreErrors`
+        :return: Summary of the Delete: `files`, `folders`, `errors`, `dryRun` and `elapsed` seconds
+        :rtype: dict
         """
         
         # Setup Directory to the Object's Directory
         if not self.exists(): raise ValueError("Directory Does Not Exists")
         
-        # Deletes the File
-        shutil.rmtree(self.directory)
+        start = time.perf_counter()
+        files, folders = _deletePlan(self.directory)
+        summary = {"files":0, "folders":0, "errors":{}, "dryRun":dryRun, "elapsed":0.0}
+        
+        if dryRun:
+            summary["files"], summary["folders"] = len(files), len(folders)
+            summary["elapsed"] = time.perf_counter() - start
+            return summary
+        
+        total = len(files) + len(folders)
+        chunks = [files[i:i + DELETE_CHUNK_SIZE] for i in range(0, len(files), DELETE_CHUNK_SIZE)]
+        
+        # Delete the Files
+        with contextlib.ExitStack() as stack:
+            executor = None if workers is None else stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            for removed, errors in (map if executor is None else executor.map)(_unlinkMany, chunks):
+                summary["files"] += removed
+                summary["errors"].update(errors)
+                if progress is not None: progress(summary["files"] + len(summary["errors"]), total)
+        
+        # Remove the Emptied Folders, Deepest First
+        for folder in folders:
+            try:
+                os.rmdir(folder)
+                summary["folders"] += 1
+            except OSError as error:
+                summary["errors"][folder] = error
+            if progress is not None: progress(summary["files"] + summary["folders"] + len(summary["errors"]), total)
+        
+        # Sets Directory to None once Everything is Deleted
+        if not summary["errors"]: self._directory = None
+        elif not ignoreErrors: _raiseErrors(summary["errors"])
         
-        # Sets Directory to None
-        self._directory = None
+        summary["elapsed"] = time.perf_counter() - start
+        
+        return summary
    
     def rename(self, name:str) -> str:
         """Rename the Folder
@@ -109,20 +462,96 @@ class Folder:
         return self._directory
         
              
-    def move(self, newDirectory:str) -> None:
-        """Move File to new location
+    @timed()
+    def move(self, newDirectory:str, workers:int = None, progress:Callable = None, dryRun:bool = False, verify:str = "size", ignoreErrors:bool = False) -> dict:
+        """Move Folder to a New Location
+
+        A rename when both locations are on one device; across devices the tree is streamed to the new location, checked, and only then deleted.
 
-        :param newDirectory: New Directory to move file too
+        :param newDirectory: New Directory of the Folder, Absent or Empty
         :type newDirectory: str
-        :raises ValueError: No Directory
+        :param workers: Number of Threads Copying and Deleting Files across Devices, defaults to None
+        :type workers: int, optional
+        :param progress: Called with the Bytes Copied and the Total Bytes across Devices, defaults to None
+        :type progress: Callable, optional
+        :param dryRun: `True` only Reports what would be Moved, defaults to False
+        :type dryRun: bool, optional
+        :param verify: Check of the Copies before the Delete: `size` or `hash`, defaults to "size"
+        :type verify: str, optional
+        :param ignoreErrors: `True` Collects the Entries that could not be Moved in `errors` instead of Raising, defaults to False
+        :type ignoreErrors: bool, optional
+        :raises ValueError: No Directory or Unknown Check
+        :raises OSError: New Directory is not Empty
+        :raises shutil.Error: Files could not be Copied or Deleted, unless `ignoreErrors`
+        :return: Summary of the Move: `crossDevice`, `files`, `bytes`, `errors`, `dryRun` and `elapsed` seconds; when a Copy Fails the Folder is Kept and the Partial Copy Removed
+        :rtype: dict
         """
         
         # Setup Directory to the Object's Directory
         if not self.exists(): raise ValueError("Directory Does Not Exists")
+        if verify not in ("size", "hash"): raise ValueError(f"Unknown Check: {verify}")
+        
+        start = time.perf_counter()
+        summary = {"crossDevice":False, "files":0, "bytes":0, "errors":{}, "dryRun":dryRun, "elapsed":0.0}
+        
+        # Rename on the Same Device
+        if dryRun:
+            summary["crossDevice"] = _device(self._directory) != _device(newDirectory)
+        else:
+            try:
+                os.rename(self._directory, newDirectory)
+            except OSError as error:
+                if error.errno != errno.EXDEV: raise
+                summary["crossDevice"] = True
+            else:
+                self._directory = newDirectory
+                summary["elapsed"] = time.perf_counter() - start
+                return summary
+        
+        existed = os.path.isdir(newDirectory)
+        if existed and os.listdir(newDirectory): raise OSError(errno.ENOTEMPTY, "Directory not Empty", newDirectory)
+        
+        # Symbolic Links are Moved as Links
+        folders, files = self._copyPlan(newDirectory, not dryRun)
+        sizes = {source:os.lstat(source).st_size for source, _ in files}
+        total = sum(sizes.values())
+        
+        if dryRun:
+            summary["files"], summary["bytes"] = len(files), total
+            summary["elapsed"] = time.perf_counter() - start
+            return summary
+        
+        def copy(source:str, destination:str) -> int:
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), destination)
+                return sizes[source]
+            
+            copied = copyFile(source, destination, True)
+            
+            # Check the Copy before the Source is Deleted
+            if copied != sizes[source] or os.path.getsize(destination) != copied or (verify == "hash" and _hashFile(source) != _hashFile(destination)):
+                raise OSError(errno.EIO, "Copy Verification Failed", destination)
+            return copied
+        
+        # Stream the Files to the Other Device
+        _runJobs(copy, files, summary, workers=workers, progress=progress, total=total)
+        
+        # Keep the Folder and Remove the Partial Copy when any File Failed
+        if summary["errors"]:
+            shutil.rmtree(newDirectory, ignore_errors=True)
+            if existed: os.makedirs(newDirectory, exist_ok=True)
+            summary["files"], summary["bytes"] = 0, 0
+            if not ignoreErrors: _raiseErrors(summary["errors"])
         
+        # The Folder Follows its Complete Copy before the Source is Deleted
+        else:
+            for source, destination in reversed(folders): shutil.copystat(source, destination)
+            source, self._directory = self._directory, newDirectory
+            summary["errors"].update(Folder(source, False).delete(workers, ignoreErrors=ignoreErrors)["errors"])
         
-        os.rename(self._directory, newDirectory)
-        self._directory = newDirectory
+        summary["elapsed"] = time.perf_counter() - start
+        
+        return summary
     
     def fileExist(self, name:str) -> bool:
         """Check File Exists in Folder
@@ -138,16 +567,423 @@ class Folder:
         
         return os.path.isfile(self.directory+"/"+name) 
     
-    def copy(self, newDirectory:str) -> str:
-        Folder(newDirectory)
+    @timed()
+    def copy(self, newDirectory:str, metadata:bool = False, workers:int = None, ignoreErrors:bool = False) -> dict:
+        """Copy the Folder and its Content
+
+        Directories are created in a first pass, then files are streamed in constant memory through `copyFile`. Symbolic Links to Folders are copied as Links.
+
+        :param newDirectory: Location for New Folder
+        :type newDirectory: str
+        :param metadata: `True` copies Permissions and Timestamps, defaults to False
+        :type metadata: bool, optional
+        :param workers: Number of Threads Copying Files, `None` copies one File at a Time, defaults to None
+        :type workers: int, optional
+        :param ignoreErrors: `True` Collects the Files that could not be Copied in `errors` instead of Raising, defaults to False
+        :type ignoreErrors: bool, optional
+        :raises ValueError: No Directory
+        :raises shutil.Error: Files could not be Copied, unless `ignoreErrors`
+        :return: Summary of the Copy: `files`, `bytes`, `errors` and `elapsed` seconds
+        :rtype: dict
+        """
+        
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise ValueError("Directory Does Not Exists")
+        
+        start = time.perf_counter()
+        target = Folder(newDirectory)
+        
+        # First Pass: Create the Directories and Collect the Files
+        folders, files = self._copyPlan(target.directory)
+        
+        summary = {"files":0, "bytes":0, "errors":{}, "elapsed":0.0}
+        
+        # Copy the Files, Concurrently when `workers` is Set
+        _runJobs(_copyEntry, [(source, destination, metadata) for source, destination in files], summary, workers=workers)
+        
+        # Copy Folder Permissions and Timestamps after their Content is Written
+        if metadata:
+            for source, destination in reversed(folders):
+                shutil.copystat(source, destination)
+        
+        if not ignoreErrors: _raiseErrors(summary["errors"])
+        
+        summary["elapsed"] = time.perf_counter() - start
+        
+        return summary
+    
+    async def awalk(self, *args, batchSize:int = 256, **kwargs) -> AsyncIterator[Union[File, "Folder"]]:
+        """Walk through the Folder without Blocking the Event Loop
+
+        Takes the Arguments of `walk`; entries are scanned on the shared I/O executor in batches.
+
+        :param batchSize: Entries Scanned per Trip to the Executor, defaults to 256
+        :type batchSize: int, optional
+        :raises ValueError: No Directory
+        :return: File and Folder Objects in the Folder
+        :rtype: AsyncIterator[Union[File, Folder]]
+        """
+
+        iterator = self.walk(*args, **kwargs)
+
+        while True:
+            batch = await offload(list, itertools.islice(iterator, batchSize))
+            if not batch: break
+            for item in batch: yield item
 
-        for x in self.content:
-            if os.path.isfile(x):
-                file = File(x)
-                file.copy(f"{newDirectory}/{file.name}.{file.extension}")
+    async def acopy(self, newDirectory:str, metadata:bool = False, concurrency:int = 16, ignoreErrors:bool = False) -> dict:
+        """Copy the Folder and its Content without Blocking the Event Loop
+
+        :param newDirectory: Location for New Folder
+        :type newDirectory: str
+        :param metadata: `True` copies Permissions and Timestamps, defaults to False
+        :type metadata: bool, optional
+        :param concurrency: Files Copied at Once, defaults to 16
+        :type concurrency: int, optional
+        :param ignoreErrors: `True` Collects the Files that could not be Copied in `errors` instead of Raising, defaults to False
+        :type ignoreErrors: bool, optional
+        :raises ValueError: No Directory
+        :raises shutil.Error: Files could not be Copied, unless `ignoreErrors`
+        :return: Summary of the Copy: `files`, `bytes`, `errors` and `elapsed` seconds
+        :rtype: dict
+        """
+        import asyncio
+
+        # Setup Directory to the Object's Directory
+        if not await offload(self.exists): raise ValueError("Directory Does Not Exists")
+
+        start = time.perf_counter()
+        target = await offload(Folder, newDirectory)
+
+        # First Pass: Create the Directories and Collect the Files
+        folders, files = await offload(self._copyPlan, target.directory)
+
+        summary = {"files":0, "bytes":0, "errors":{}, "elapsed":0.0}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def copy(source:str, destination:str) -> None:
+            async with semaphore:
+                # Await before Adding, so Concurrent Copies do not Overwrite the Total
+                try:
+                    copied = await offload(_copyEntry, source, destination, metadata)
+                except OSError as error:
+                    summary["errors"][source] = error
+                else:
+                    summary["bytes"] += copied
+                    summary["files"] += 1
+
+        await asyncio.gather(*(copy(source, destination) for source, destination in files))
+
+        # Copy Folder Permissions and Timestamps after their Content is Written
+        if metadata:
+            for source, destination in reversed(folders):
+                await offload(shutil.copystat, source, destination)
+
+        if not ignoreErrors: _raiseErrors(summary["errors"])
+
+        summary["elapsed"] = time.perf_counter() - start
+
+        return summary
+
+    def stats(self, top:int = 10, workers:int = None, cache:bool = False, followLinks:bool = False) -> dict:
+        """Disk Usage and Statistics of the Folder Tree
+
+        Folders are scanned in parallel with `os.scandir`, and Hardlinked Files are counted once.
+
+        :param top: Number of Largest Files Listed, defaults to 10
+        :type top: int, optional
+        :param workers: Number of Threads Scanning Folders, defaults to IO_WORKERS
+        :type workers: int, optional
+        :param cache: `True` reuses the Listing of Folders whose `mtime_ns` did not Change, Faster on Repeated Scans but Blind to Files Resized in Place until their Folder Changes, defaults to False
+        :type cache: bool, optional
+        :param followLinks: `True` walks into Symbolic Links to Folders, defaults to False
+        :type followLinks: bool, optional
+        :raises ValueError: No Directory
+        :return: `files`, `folders`, `bytes`, `diskBytes`, totals `byExtension` and `byDepth`, the `largest` Files, `errors` and `elapsed` seconds
+        :rtype: dict
+        """
+
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise ValueError("Directory Does Not Exists")
+
+        start = time.perf_counter()
+
+        summary = {"files":0, "folders":0, "bytes":0, "diskBytes":0, "byExtension":{}, "byDepth":{}, "largest":[], "errors":{}, "elapsed":0.0}
+
+        # Hardlinks Seen by (Device, Inode), Folders Seen by Real Path when Following Links
+        inodes = set()
+        visited = {os.path.realpath(self.directory)}
+        largest = []
+
+        with ThreadPoolExecutor(max_workers=workers or IO_WORKERS) as executor:
+            pending = {executor.submit(_scanFolder, self.directory, followLinks, cache):(self.directory, 0)}
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    directory, depth = pending.pop(future)
+                    try:
+                        files, folders = future.result()
+                    except OSError as error:
+                        summary["errors"][directory] = error
+                        continue
+
+                    # Scan the Sub Folders
+                    for folder in folders:
+                        if followLinks:
+                            real = os.path.realpath(folder)
+                            if real in visited: continue
+                            visited.add(real)
+                        summary["folders"] += 1
+                        pending[executor.submit(_scanFolder, folder, followLinks, cache)] = (folder, depth + 1)
+
+                    byDepth = summary["byDepth"].setdefault(depth, {"files":0, "bytes":0})
+
+                    for name, size, diskSize, device, inode, links in files:
+
+                        # Count every Hardlinked File Once
+                        if links > 1:
+                            if (device, inode) in inodes: continue
+                            inodes.add((device, inode))
+
+                        extension = name.rsplit(".", 1)[-1].lower() if "." in name.lstrip(".") else ""
+                        byExtension = summary["byExtension"].setdefault(extension, {"files":0, "bytes":0})
+
+                        summary["files"] += 1
+                        summary["bytes"] += size
+                        summary["diskBytes"] += diskSize
+                        byExtension["files"] += 1
+                        byExtension["bytes"] += size
+                        byDepth["files"] += 1
+                        byDepth["bytes"] += size
+
+                        # Largest Files in a Min-Heap of `top` Entries
+                        if top:
+                            if len(largest) < top: heapq.heappush(largest, (size, f"{directory}/{name}"))
+                            elif size > largest[0][0]: heapq.heapreplace(largest, (size, f"{directory}/{name}"))
+
+        summary["largest"] = [(path, size) for size, path in sorted(largest, reverse=True)]
+        summary["elapsed"] = time.perf_counter() - start
+
+        return summary
+
+    def du(self, apparent:bool = False, **options) -> int:
+        """Disk Usage of the Folder Tree, Hardlinked Files Counted Once
+
+        Takes the Arguments of `stats`.
+
+        :param apparent: `True` sums the File Sizes instead of the Disk Blocks, defaults to False
+        :type apparent: bool, optional
+        :raises ValueError: No Directory
+        :return: Bytes Used
+        :rtype: int
+        """
+        summary = self.stats(top=0, **options)
+        return summary["bytes"] if apparent else summary["diskBytes"]
+
+    def watch(self, recursive:bool = True, extensions:Iterable[str] = None, debounce:float = 0.05, backend:str = None, interval:float = 0.5) -> "Watcher":
+        """Watch the Folder for Created, Modified and Deleted Files
+
+        Events come from inotify on Linux, watchdog when installed, or polling, and are debounced into batches.
+
+        :param recursive: `True` watches the Sub Folders, defaults to True
+        :type recursive: bool, optional
+        :param extensions: File Extensions to Report; `overflow` Events of Lost Events are Always Reported, defaults to None
+        :type extensions: Iterable[str], optional
+        :param debounce: Quiet Seconds Ending a Batch of Events, defaults to 0.05
+        :type debounce: float, optional
+        :param backend: `inotify`, `watchdog` or `polling`, defaults to the First Available
+        :type backend: str, optional
+        :param interval: Seconds between Snapshots of the `polling` Backend, defaults to 0.5
+        :type interval: float, optional
+        :raises ValueError: No Directory or Unknown Backend
+        :return: Watcher, Iterated Synchronously or with `async for`, Closed with `close` or `with`
+        :rtype: Watcher
+        """
+        from .watch import Watcher
+
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise ValueError("Directory Does Not Exists")
+
+        return Watcher(self.directory, recursive, extensions, debounce, backend, interval)
+
+    def manifest(self, workers:int = None, save:bool = True) -> dict:
+        """Content Index of the Folder: Size, `mtime_ns` and Content Hash of every File
+
+        The index is kept in `MANIFEST_NAME` at the root of the Folder, and a File is only hashed again when its size or `mtime_ns` changed. Symbolic Links to Folders are not Walked.
+
+        :param workers: Number of Threads Hashing Files, defaults to None
+        :type workers: int, optional
+        :param save: `True` stores the Updated Index in the Folder, defaults to True
+        :type save: bool, optional
+        :raises ValueError: No Directory
+        :return: `[size, mtime_ns, hash]` by Path Relative to the Folder
+        :rtype: dict
+        """
+
+        # Setup Directory to the Object's Directory
+        if not self.exists(): raise ValueError("Directory Does Not Exists")
+
+        # Previous Index, Dropped when Hashed with Another Algorithm
+        previous = self._loadManifest()
+
+        entries = {}
+        stale = []
+        for root, _, names in os.walk(self.directory):
+            relative = os.path.relpath(root, self.directory)
+            for name in names:
+                if name == MANIFEST_NAME: continue
+                path = name if relative == "." else f"{relative}/{name}"
+
+                # Dangling Links and Files Removed during the Walk are Left Out
+                try:
+                    status = os.stat(f"{root}/{name}")
+                except FileNotFoundError:
+                    continue
+                entry = previous.get(path)
+
+                # Reuse the Hash when the File did not Change
+                if entry is not None and entry[0] == status.st_size and entry[1] == status.st_mtime_ns:
+                    entries[path] = entry
+                else:
+                    entries[path] = [status.st_size, status.st_mtime_ns, None]
+                    stale.append(path)
+
+        # Hash New and Changed Files
+        if workers is None:
+            for path in stale: entries[path][2] = _hashFile(f"{self.directory}/{path}")
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for path, digest in zip(stale, executor.map(_hashFile, (f"{self.directory}/{path}" for path in stale))):
+                    entries[path][2] = digest
+
+        if save and (stale or entries.keys() != previous.keys()): self._saveManifest(entries)
+
+        return entries
+
+    def _loadManifest(self) -> dict:
+        """Stored Content Index of the Folder
+
+        :return: `[size, mtime_ns, hash]` by Relative Path, Empty when Missing, Unreadable or Hashed with Another Algorithm
+        :rtype: dict
+        """
+        try:
+            with open(f"{self.directory}/{MANIFEST_NAME}", "rb") as file:
+                stored = JSON_BACKENDS[fileModule.JSON_BACKEND][1](file.read())
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(stored, dict) or stored.get("algorithm") != HASH_ALGORITHM: return {}
+
+        return stored.get("files", {})
+
+    def _saveManifest(self, entries:dict) -> None:
+        """Store the Content Index of the Folder
+
+        :param entries: `[size, mtime_ns, hash]` by Relative Path
+        :type entries: dict
+        """
+        raw = JSON_BACKENDS[fileModule.JSON_BACKEND][0]({"algorithm":HASH_ALGORITHM, "files":entries}, True)
+        with atomicWrite(f"{self.directory}/{MANIFEST_NAME}") as directory, open(directory, "wb") as file:
+            file.write(raw)
+
+    @timed()
+    def sync(self, newDirectory:str, deleteOrphans:bool = False, workers:int = None) -> dict:
+        """Mirror the Folder into a New Directory, Copying only New and Changed Files
+
+        Both Folders keep a manifest, so a sync costs time in proportion to what changed, not to the size of the tree.
+
+        :param newDirectory: Location of the Mirror
+        :type newDirectory: str
+        :param deleteOrphans: `True` deletes Files of the Mirror that are not in the Folder, defaults to False
+        :type deleteOrphans: bool, optional
+        :param workers: Number of Threads Hashing and Copying Files, defaults to None
+        :type workers: int, optional
+        :raises ValueError: No Directory
+        :return: Summary of the Sync: `copied`, `bytes`, `unchanged`, `deleted`, `errors` and `elapsed` seconds
+        :rtype: dict
+        """
+
+        start = time.perf_counter()
+
+        source = self.manifest(workers)
+        target = Folder(newDirectory)
+        mirror = target.manifest(workers, save=False)
+
+        summary = {"copied":0, "bytes":0, "unchanged":0, "deleted":0, "errors":{}, "elapsed":0.0}
+
+        # Files Missing from the Mirror or with Another Content
+        changed = []
+        for path, entry in source.items():
+            current = mirror.get(path)
+            if current is not None and current[0] == entry[0] and current[2] == entry[2]:
+                summary["unchanged"] += 1
             else:
-                folder = Folder(x)
-                folder.copy(f"{newDirectory}/{folder.name}")
+                changed.append(path)
+
+        def copy(path:str) -> int:
+            destination = f"{target.directory}/{path}"
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+            # Timestamps are Copied, so the Mirror's Manifest Matches on the Next Sync
+            copied = copyFile(f"{self.directory}/{path}", destination, True)
+            mirror[path] = [source[path][0], os.stat(destination).st_mtime_ns, source[path][2]]
+            return copied
+
+        # Copy the Changed Files
+        _runJobs(copy, [(path,) for path in changed], summary, "copied", workers)
+
+        # Delete Files of the Mirror that are not in the Folder
+        if deleteOrphans:
+            for path in [path for path in mirror if path not in source]:
+                try:
+                    os.remove(f"{target.directory}/{path}")
+                    del mirror[path]
+                    summary["deleted"] += 1
+                except OSError as error:
+                    summary["errors"][path] = error
+
+            # Remove Folders Left Empty, Deepest First
+            for root, _, _ in sorted(os.walk(target.directory), key=lambda walked: walked[0].count("/"), reverse=True):
+                if root != target.directory and not os.path.isdir(f"{self.directory}/{os.path.relpath(root, target.directory)}"):
+                    with contextlib.suppress(OSError): os.rmdir(root)
+
+        target._saveManifest(mirror)
+
+        summary["elapsed"] = time.perf_counter() - start
+
+        return summary
+
+    def _copyPlan(self, newDirectory:str, create:bool = True, followLinks:bool = False) -> tuple:
+        """Create the Directory Tree of the Folder under a New Directory
+
+        :param newDirectory: Location for New Folder
+        :type newDirectory: str
+        :param create: `False` only Plans the Copy, defaults to True
+        :type create: bool, optional
+        :param followLinks: `True` walks into Symbolic Links to Folders instead of Listing them with the Files, defaults to False
+        :type followLinks: bool, optional
+        :return: (Source, Destination) Pairs of the Folders and of the Files
+        :rtype: tuple
+        """
+        
+        folders = []
+        files = []
+        
+        for root, names, fileNames in os.walk(self.directory, followlinks=followLinks):
+            
+            # Matching Directory in the New Folder
+            relative = os.path.relpath(root, self.directory)
+            destination = newDirectory if relative == "." else f"{newDirectory}/{relative}"
+            if create: os.makedirs(destination, exist_ok=True)
+            
+            folders.append((root, destination))
+            files.extend((f"{root}/{name}", f"{destination}/{name}") for name in fileNames if name != MANIFEST_NAME)
+            if not followLinks:
+                files.extend((f"{root}/{name}", f"{destination}/{name}") for name in names if os.path.islink(f"{root}/{name}"))
+            
+        return folders, files
                 
     @property
     def name(self) -> str:
@@ -5,12 +5,19 @@ Basic Functions to be used various projects, but to simplify the process while w
 """
 
 # Import Modules
-import traceback, sys, time
+import traceback, sys, time, threading, functools, bisect, itertools, json, os, uuid, contextlib
+from collections import deque
+from typing import Callable
 
 __all__ = [
     "printSyntax"
     , "printTraceback"
     , "Duration"
+    , "timings"
+    , "resetTimings"
+    , "timed"
+    , "TimingRegistry"
+    , "REGISTRY"
 ]
     
 # Syntax Printer
@@ -37,12 +44,272 @@ def printTraceback() -> None:
     print(traceback.format_exc())
     sys.exit()
 
+# Samples Kept per Label for Percentiles
+SAMPLE_SIZE = 1024
+
+# Upper Bounds in Seconds of the Histogram Buckets
+HISTOGRAM_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+# Aggregate Timings of a Label
+class _Aggregate:
+    def __init__(self) -> None:
+        """
+        Count, Total, Min, Max and Histogram of the Timings of a Label, with the Latest Samples for Percentiles
+        """
+        self.count = 0
+        self.total = 0
+        self.cpu = 0
+        self.min = None
+        self.max = None
+        self.samples = deque(maxlen=SAMPLE_SIZE)
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    
+    def add(self, wall:int, cpu:int) -> None:
+        """Add a Timing
+
+        :param wall: Wall Time in Nanoseconds
+        :type wall: int
+        :param cpu: CPU Time in Nanoseconds
+        :type cpu: int
+        """
+        self.count += 1
+        self.total += wall
+        self.cpu += cpu
+        self.min = wall if self.min is None else min(self.min, wall)
+        self.max = wall if self.max is None else max(self.max, wall)
+        self.samples.append(wall)
+        self.buckets[bisect.bisect_left(HISTOGRAM_BUCKETS, wall / 1e9)] += 1
+    
+    def summary(self) -> dict:
+        """Summary of the Timings in Seconds
+
+        :return: `count`, `total`, `mean`, `min`, `max`, `p95`, `cpu` and the Cumulative `buckets` by Upper Bound
+        :rtype: dict
+        """
+        samples = sorted(self.samples)
+        p95 = samples[min(len(samples) - 1, int(0.95 * len(samples)))]
+        
+        return {
+            "count":self.count
+            , "total":self.total / 1e9
+            , "mean":self.total / self.count / 1e9
+            , "min":self.min / 1e9
+            , "max":self.max / 1e9
+            , "p95":p95 / 1e9
+            , "cpu":self.cpu / 1e9
+            , "buckets":dict(zip([str(b) for b in HISTOGRAM_BUCKETS] + ["+Inf"], itertools.accumulate(self.buckets)))
+        }
+
+# Registry of Timings
+class TimingRegistry:
+    def __init__(self) -> None:
+        """
+        Thread-Safe Registry of Timings by Label, Filled by Labelled Durations and Timed Functions
+        """
+        
+        # `False` Stops Recording
+        self.enabled = True
+        
+        self._aggregates = {}
+        self._lock = threading.Lock()
+    
+    def record(self, label:str, wall:int, cpu:int = 0) -> None:
+        """Add a Timing to the Aggregates of a Label
+
+        :param label: Label of the Timing
+        :type label: str
+        :param wall: Wall Time in Nanoseconds
+        :type wall: int
+        :param cpu: CPU Time in Nanoseconds, defaults to 0
+        :type cpu: int, optional
+        """
+        
+        if not self.enabled: return
+        
+        with self._lock:
+            aggregate = self._aggregates.get(label)
+            if aggregate is None: aggregate = self._aggregates[label] = _Aggregate()
+            aggregate.add(wall, cpu)
+    
+    def snapshot(self) -> dict:
+        """Summary of the Timings
+
+        :return: Summary by Label
+        :rtype: dict
+        """
+        
+        with self._lock:
+            return {label:aggregate.summary() for label, aggregate in self._aggregates.items()}
+    
+    def reset(self) -> None:
+        """
+        Clears the Timings
+        """
+        
+        with self._lock:
+            self._aggregates.clear()
+    
+    def toJSON(self) -> str:
+        """Summary of the Timings as JSON
+
+        :return: JSON Document
+        :rtype: str
+        """
+        
+        return json.dumps({"time":time.time(), "timings":self.snapshot()})
+    
+    def toPrometheus(self, prefix:str = "utils") -> str:
+        """Timings in the Prometheus Text Format, a Histogram and a CPU Counter by Label
+
+        :param prefix: Prefix of the Metric Names, defaults to "utils"
+        :type prefix: str, optional
+        :return: Prometheus Text Exposition
+        :rtype: str
+        """
+        
+        lines = [
+            f"# HELP {prefix}_duration_seconds Wall time of timed operations."
+            , f"# TYPE {prefix}_duration_seconds histogram"
+        ]
+        cpu = [
+            f"# HELP {prefix}_cpu_seconds_total CPU time of timed operations."
+            , f"# TYPE {prefix}_cpu_seconds_total counter"
+        ]
+        
+        for label, summary in sorted(self.snapshot().items()):
+            op = label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            
+            for bound, count in summary["buckets"].items():
+                lines.append(f'{prefix}_duration_seconds_bucket{{op="{op}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_duration_seconds_sum{{op="{op}"}} {summary["total"]}')
+            lines.append(f'{prefix}_duration_seconds_count{{op="{op}"}} {summary["count"]}')
+            cpu.append(f'{prefix}_cpu_seconds_total{{op="{op}"}} {summary["cpu"]}')
+        
+        return "\n".join(lines + cpu) + "\n"
+    
+    def export(self, directory:str, format:str = "json") -> None:
+        """Write the Timings to a File, Replacing it Atomically
+
+        :param directory: Directory of the File
+        :type directory: str
+        :param format: `json` or `prometheus`, defaults to "json"
+        :type format: str, optional
+        :raises ValueError: Unknown Format
+        """
+        
+        if format not in ("json", "prometheus"): raise ValueError(f"Unknown Format: {format}")
+        
+        content = self.toJSON() if format == "json" else self.toPrometheus()
+        
+        # Readers never see a Partial File, and Concurrent Exports each Write their Own Temporary File
+        temporary = f"{directory}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temporary, "w") as file:
+                file.write(content)
+            os.replace(temporary, directory)
+        except BaseException:
+            with contextlib.suppress(OSError): os.remove(temporary)
+            raise
+    
+    def exportEvery(self, directory:str, interval:float = 60.0, format:str = "json") -> threading.Event:
+        """Write the Timings to a File on an Interval from a Background Thread
+
+        :param directory: Directory of the File
+        :type directory: str
+        :param interval: Seconds between Writes, defaults to 60.0
+        :type interval: float, optional
+        :param format: `json` or `prometheus`, defaults to "json"
+        :type format: str, optional
+        :return: Event that Stops the Exports when Set, a Last Export is Written on Stop
+        :rtype: threading.Event
+        """
+        
+        stop = threading.Event()
+        
+        def run() -> None:
+            while not stop.wait(interval):
+                self.export(directory, format)
+            self.export(directory, format)
+        
+        threading.Thread(target=run, name="utils-timing-export", daemon=True).start()
+        
+        return stop
+
+# Registry of the Process
+REGISTRY = TimingRegistry()
+
+# Labels of the Durations Running in each Thread
+_ACTIVE = threading.local()
+
+def timings(label:str = None) -> dict:
+    """Aggregate Timings Recorded in the Registry
+
+    :param label: Label to Return, defaults to None
+    :type label: str, optional
+    :return: Summary by Label, or the Summary of the Label Asked for
+    :rtype: dict
+    """
+    
+    snapshot = REGISTRY.snapshot()
+    
+    return snapshot if label is None else snapshot[label]
+
+def resetTimings() -> None:
+    """
+    Clears the Aggregate Timings
+    """
+    
+    REGISTRY.reset()
+
+def timed(label:str = None) -> Callable:
+    """Decorator Recording every Call of a Function in the Registry, with Less Overhead than a Duration
+
+    :param label: Label of the Timings, defaults to `Class.method` for Methods and the Function Name Otherwise
+    :type label: str, optional
+    :return: Decorator
+    :rtype: Callable
+    """
+    
+    def decorator(func:Callable) -> Callable:
+        
+        # Methods are Labelled by the Class of the Object
+        scopes = func.__qualname__.split(".")
+        method = label is None and len(scopes) > 1 and scopes[-2] != "<locals>"
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not REGISTRY.enabled: return func(*args, **kwargs)
+            
+            c0 = time.thread_time_ns()
+            t0 = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                wall = time.perf_counter_ns() - t0
+                name = f"{type(args[0]).__name__}.{func.__name__}" if method and args else label or func.__qualname__
+                REGISTRY.record(name, wall, time.thread_time_ns() - c0)
+        
+        return wrapper
+    
+    return decorator
+
 # Check Duration of Code
 class Duration: 
-    def __init__(self) -> None:
+    def __init__(self, label:str = None, toPrint:bool = None) -> None:
         """
         Duration to find Length of time it takes to Run Code. Starts with the .start() function.
+        
+        Uses the monotonic `perf_counter_ns` clock and the CPU time of the thread. Labelled Durations add their timings to aggregates read with `timings()`;
+        they nest as `outer/inner` when used as context managers or decorators.
+
+        :param label: Label of the Aggregate Timings, defaults to None
+        :type label: str, optional
+        :param toPrint: `True` prints the Duration at the End, defaults to printing only Durations without a Label
+        :type toPrint: bool, optional
         """
+        self.label = label
+        self.toPrint = label is None if toPrint is None else toPrint
+        self._path = label
         self.start()
 
     def start(self) -> None:
@@ -50,21 +317,103 @@ class Duration:
         Grabs Start Time with Setting Final Time to None
         """
         
-        self._t0 = time.time()
+        self.laps = []
         self._t1 = None
+        self._result = None
+        self._c0 = time.thread_time_ns()
+        self._t0 = self._lap = time.perf_counter_ns()
+
+    def lap(self, name:str) -> float:
+        """Time since the Previous Lap or the Start
+
+        :param name: Name of the Lap, Aggregated as `label/name`
+        :type name: str
+        :return: Lap Time in Seconds
+        :rtype: float
+        """
+        
+        now = time.perf_counter_ns()
+        lapse = now - self._lap
+        self._lap = now
+        
+        self.laps.append((name, lapse / 1e9))
+        if self._path is not None: REGISTRY.record(f"{self._path}/{name}", lapse)
+        
+        return lapse / 1e9
 
     def end(self) -> dict:
         """
-        Sets the End Time and Prints the Time from .start() to .end()
+        Sets the End Time, Records the Label and Prints the Time from .start() to .end() when Asked; Once Ended, Returns the Same Result without Recording Again
         """
         
-        self._t1 = time.time()
-        time_lapse = self._t1 - self._t0
+        if self._result is not None: return self._result
+        
+        self._t1 = time.perf_counter_ns()
+        cpu = time.thread_time_ns() - self._c0
+        lapse = self._t1 - self._t0
+        
+        if self._path is not None: REGISTRY.record(self._path, lapse, cpu)
+        
+        time_lapse = lapse / 1e9
 
         minutes = int(time_lapse//60)
         seconds = int(time_lapse-(minutes *60))
-        milliseconds = round((time_lapse - seconds) * (1000),2)
+        milliseconds = round((time_lapse - minutes * 60 - seconds) * (1000),2)
+        
+        if self.toPrint: print("{} minutes, {} seconds, {} milliseconds".format(minutes,seconds,milliseconds))
+        
+        self._result = {"minutes":minutes, "seconds":seconds, "milliseconds":milliseconds, "wall":time_lapse, "cpu":cpu / 1e9, "laps":list(self.laps)}
+        
+        return self._result
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds from .start() to .end(), or to Now while Running
+
+        :return: Elapsed Seconds
+        :rtype: float
+        """
+        return ((self._t1 or time.perf_counter_ns()) - self._t0) / 1e9
+    
+    def __enter__(self) -> "Duration":
+        """
+        Starts the Duration, Nested under the Durations Running in the Thread
+        """
+        
+        stack = getattr(_ACTIVE, "stack", None)
+        if stack is None: stack = _ACTIVE.stack = []
+        
+        # Label Path of the Nested Duration
+        if self.label is not None:
+            self._path = "/".join(stack + [self.label])
+            stack.append(self.label)
+        
+        self.start()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        """
+        Ends the Duration
+        """
+        
+        self.end()
+        if self.label is not None: _ACTIVE.stack.pop()
+    
+    def __call__(self, func:Callable) -> Callable:
+        """Decorator Timing every Call of a Function under the Label, or the Function Name
+
+        :param func: Function to Time
+        :type func: Callable
+        :return: Timed Function
+        :rtype: Callable
+        """
+        
+        label = self.label or func.__qualname__
+        toPrint = self.toPrint if self.label is not None else False
         
-        print("{} minutes, {} seconds, {} milliseconds".format(minutes,seconds,milliseconds))
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            with Duration(label, toPrint):
+                return func(*args, **kwargs)
         
-        return {"minutes":minutes, "seconds":seconds, "milliseconds":milliseconds}
+        return timed
@@ -1,44 +1,566 @@
-import numpy as np
+from __future__ import annotations
 import math
-import pandas as pd
-from typing import Union
+from typing import Callable, Union
+from .utils import LazyModule, isInstalled, isPandas
+
+# NumPy and pandas are Imported on First Use
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+# Optional Accelerator of the Element-Wise Kernels
+numexpr = LazyModule("numexpr") if isInstalled("numexpr") else None
 
 __all__ = [
     "sigmoid"
+    , "logSigmoid"
+    , "tanh"
+    , "relu"
+    , "softmax"
+    , "logSumExp"
+    , "movingAverage"
+    , "normalize"
     , "average"
+    , "RunningStats"
+    , "ACCELERATOR"
 ]
 
+# Values Accepted by the Math Functions
+ArrayLike = Union["pd.DataFrame", "pd.Series", "np.ndarray", list, int, float]
+
+# Accelerator Used for Large Arrays, `None` when only NumPy is Available
+ACCELERATOR = "numexpr" if numexpr is not None else None
+
+# Smallest Array Handed to the Accelerator, Smaller Arrays are Faster in NumPy
+ACCELERATOR_THRESHOLD = 65536
+
+
+# Chunked Application of a Kernel
+def _chunked(kernel, x:np.ndarray, out:np.ndarray, chunkSize:int) -> np.ndarray:
+    """Apply an Element-Wise Kernel Chunk by Chunk along the First Axis
+
+    Only one chunk of temporaries is held in memory, so memory-mapped arrays larger than RAM can be processed.
+
+    :param kernel: Kernel Writing `kernel(x)` into `out`
+    :type kernel: Callable
+    :param x: Input Values
+    :type x: np.ndarray
+    :param out: Output Values, may be `x` Itself
+    :type out: np.ndarray
+    :param chunkSize: Rows per Chunk, `None` Processes Everything at Once
+    :type chunkSize: int
+    :return: Output Values
+    :rtype: np.ndarray
+    """
+
+    if chunkSize is None or x.ndim == 0: return kernel(x, out)
+
+    for start in range(0, x.shape[0], chunkSize):
+        kernel(x[start:start + chunkSize], out[start:start + chunkSize])
+
+    return out
+
+# Sigmoid Kernel
+def _sigmoid(x:np.ndarray, out:np.ndarray) -> np.ndarray:
+    """Numerically Stable Sigmoid, `exp` is only Taken of Non-Positive Values
+
+    :param x: Input Values
+    :type x: np.ndarray
+    :param out: Output Values, may be `x` Itself
+    :type out: np.ndarray
+    :return: Sigmoid Values
+    :rtype: np.ndarray
+    """
+
+    # exp(-|x|) never Overflows
+    positive = x >= 0
+    z = np.exp(-np.abs(x))
+
+    # 1 / (1 + exp(-x)) for x >= 0, exp(x) / (1 + exp(x)) for x < 0
+    return np.divide(np.where(positive, 1.0, z), 1.0 + z, out=out)
+
+# Element-Wise Function
+def _elementwise(kernel:Callable, expression:str, x:ArrayLike, out:np.ndarray, chunkSize:int) -> ArrayLike:
+    """Apply an Element-Wise Kernel to Pandas Objects, Arrays, Lists or Scalars
+
+    :param kernel: NumPy Kernel Writing `kernel(x)` into `out`
+    :type kernel: Callable
+    :param expression: Same Kernel as a `numexpr` Expression of `x`
+    :type expression: str
+    :param x: Input Value(s)
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list,int,float]
+    :param out: Array to Write the Result to, `x` Computes in Place
+    :type out: np.ndarray
+    :param chunkSize: Rows Computed at a Time
+    :type chunkSize: int
+    :raises TypeError: Wrong Type: Change Input Type
+    :return: Output Value(s), Pandas Objects Keep their Index
+    :rtype: Union[pd.DataFrame,pd.Series,np.ndarray,float]
+    """
+
+    # Pandas Objects Keep their Labels
+    if isPandas(x):
+        values = _elementwise(kernel, expression, x.to_numpy(dtype=float), None, chunkSize)
+
+        if isinstance(x, pd.Series): return pd.Series(values, index=x.index, name=x.name)
+        return pd.DataFrame(values, index=x.index, columns=x.columns)
+
+    if not isinstance(x,(np.ndarray,list,tuple,int,float,np.number)): raise TypeError(f"Wrong Type: {type(x).__name__}")
+
+    x = np.asarray(x)
+    if not np.issubdtype(x.dtype, np.floating): x = x.astype(float)
+
+    # Scalars Return a Float
+    if x.ndim == 0 and out is None: return float(kernel(x, None))
+
+    if out is None: out = np.empty_like(x)
+
+    # Large Contiguous Arrays go to the Accelerator
+    if numexpr is not None and x.size >= ACCELERATOR_THRESHOLD and out.dtype == x.dtype and out.flags.c_contiguous:
+        kernel = lambda values, target: numexpr.evaluate(expression, local_dict={"x":values}, out=target)
+
+    return _chunked(kernel, x, out, chunkSize)
 
 # Sigmoid Function
-def sigmoid(x:Union[pd.DataFrame,pd.Series,int,float]) -> Union[pd.DataFrame,pd.Series,int,float]:
+def sigmoid(x:ArrayLike, out:np.ndarray = None, chunkSize:int = None) -> ArrayLike:
     """Calculate the Sigmoid
 
     :param x: Value(s) to Calculate the Sigmoid from
-    :type x: Union[pd.DataFrame,pd.Series,int,float]
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list,int,float]
+    :param out: Array to Write the Result to, `x` Computes in Place, defaults to None
+    :type out: np.ndarray, optional
+    :param chunkSize: Rows Computed at a Time, for Memory-Mapped Arrays Larger than RAM, defaults to None
+    :type chunkSize: int, optional
     :raises TypeError: Wrong Type: Change Input Type
     :return: Sigmoid Value(s)
-    :rtype: Union[pd.DataFrame,pd.Series,int,float]
-    """
-    
-    
-    # Different Sigmoid X Types 
-    if isinstance(x,(pd.DataFrame,pd.Series)):
-        return 1.0 / (1.0 + np.exp(-x))
-    
-    elif isinstance(x,(int,float)):
-        return 1 / (1 + math.exp(-x))
-    
+    :rtype: Union[pd.DataFrame,pd.Series,np.ndarray,int,float]
+    """
+
+    # Different Sigmoid X Types
+    if isinstance(x,(int,float)) and out is None:
+        if x >= 0: return 1 / (1 + math.exp(-x))
+        z = math.exp(x)
+        return z / (1 + z)
+
+    return _elementwise(_sigmoid, "where(x >= 0, 1 / (1 + exp(-abs(x))), exp(-abs(x)) / (1 + exp(-abs(x))))", x, out, chunkSize)
+
+# Log Sigmoid Kernel
+def _logSigmoid(x:np.ndarray, out:np.ndarray) -> np.ndarray:
+    """Numerically Stable Log Sigmoid: min(x, 0) - log(1 + exp(-|x|))
+
+    :param x: Input Values
+    :type x: np.ndarray
+    :param out: Output Values, may be `x` Itself
+    :type out: np.ndarray
+    :return: Log Sigmoid Values
+    :rtype: np.ndarray
+    """
+
+    penalty = np.log1p(np.exp(-np.abs(x)))
+    return np.subtract(np.minimum(x, 0.0), penalty, out=out)
+
+# Log Sigmoid Function
+def logSigmoid(x:ArrayLike, out:np.ndarray = None, chunkSize:int = None) -> ArrayLike:
+    """Calculate the Log of the Sigmoid without Overflow or Underflow to `-inf`
+
+    :param x: Value(s) to Calculate the Log Sigmoid from
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list,int,float]
+    :param out: Array to Write the Result to, `x` Computes in Place, defaults to None
+    :type out: np.ndarray, optional
+    :param chunkSize: Rows Computed at a Time, defaults to None
+    :type chunkSize: int, optional
+    :raises TypeError: Wrong Type: Change Input Type
+    :return: Log Sigmoid Value(s)
+    :rtype: Union[pd.DataFrame,pd.Series,np.ndarray,float]
+    """
+
+    return _elementwise(_logSigmoid, "where(x < 0, x, 0) - log1p(exp(-abs(x)))", x, out, chunkSize)
+
+# Hyperbolic Tangent Function
+def tanh(x:ArrayLike, out:np.ndarray = None, chunkSize:int = None) -> ArrayLike:
+    """Calculate the Hyperbolic Tangent
+
+    :param x: Value(s) to Calculate the Hyperbolic Tangent from
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list,int,float]
+    :param out: Array to Write the Result to, `x` Computes in Place, defaults to None
+    :type out: np.ndarray, optional
+    :param chunkSize: Rows Computed at a Time, defaults to None
+    :type chunkSize: int, optional
+    :raises TypeError: Wrong Type: Change Input Type
+    :return: Hyperbolic Tangent Value(s)
+    :rtype: Union[pd.DataFrame,pd.Series,np.ndarray,float]
+    """
+
+    return _elementwise(lambda values, target: np.tanh(values, out=target), "tanh(x)", x, out, chunkSize)
+
+# Rectified Linear Unit Function
+def relu(x:ArrayLike, out:np.ndarray = None, chunkSize:int = None) -> ArrayLike:
+    """Calculate the Rectified Linear Unit: max(x, 0)
+
+    :param x: Value(s) to Calculate the Rectified Linear Unit from
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list,int,float]
+    :param out: Array to Write the Result to, `x` Computes in Place, defaults to None
+    :type out: np.ndarray, optional
+    :param chunkSize: Rows Computed at a Time, defaults to None
+    :type chunkSize: int, optional
+    :raises TypeError: Wrong Type: Change Input Type
+    :return: Rectified Linear Unit Value(s)
+    :rtype: Union[pd.DataFrame,pd.Series,np.ndarray,float]
+    """
+
+    return _elementwise(lambda values, target: np.maximum(values, 0.0, out=target), "where(x < 0, 0, x)", x, out, chunkSize)
+
+# Softmax Function
+def softmax(x:ArrayLike, axis:int = -1, out:np.ndarray = None) -> np.ndarray:
+    """Calculate the Softmax, Shifted by the Maximum so `exp` never Overflows
+
+    :param x: Values to Calculate the Softmax from
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list]
+    :param axis: Axis the Probabilities Sum to 1 along, defaults to -1
+    :type axis: int, optional
+    :param out: Array to Write the Result to, `x` Computes in Place, defaults to None
+    :type out: np.ndarray, optional
+    :return: Softmax Values
+    :rtype: np.ndarray
+    """
+
+    x = np.asarray(x, dtype=float)
+
+    if out is None: out = np.empty_like(x)
+
+    np.subtract(x, np.max(x, axis=axis, keepdims=True), out=out)
+    np.exp(out, out=out)
+    out /= np.sum(out, axis=axis, keepdims=True)
+
+    return out
+
+# Log Sum Exp Function
+def logSumExp(x:ArrayLike, axis:int = None) -> Union[float, np.ndarray]:
+    """Calculate log(sum(exp(x))) without Overflow
+
+    :param x: Values to Calculate the Log Sum Exp from
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list]
+    :param axis: Axis to Sum along, `None` Sums Everything, defaults to None
+    :type axis: int, optional
+    :return: Log Sum Exp Value(s)
+    :rtype: Union[float, np.ndarray]
+    """
+
+    x = np.asarray(x, dtype=float)
+
+    # Shift by the Maximum, Infinite Maximums are not Shifted
+    shift = np.max(x, axis=axis, keepdims=True)
+    shift[~np.isfinite(shift)] = 0.0
+
+    # Only `-inf` Values Sum to 0, whose Log is `-inf`
+    with np.errstate(divide="ignore"):
+        result = np.log(np.sum(np.exp(x - shift), axis=axis, keepdims=True)) + shift
+
+    return np.squeeze(result, axis=axis) if axis is not None else float(result.squeeze())
+
+# Moving Average Function
+def movingAverage(x:ArrayLike, window:int, out:np.ndarray = None) -> np.ndarray:
+    """Calculate the Moving Average of a Window along the First Axis in Linear Time
+
+    :param x: Values to Average
+    :type x: Union[pd.Series,np.ndarray,list]
+    :param window: Number of Values in each Average
+    :type window: int
+    :param out: Array of `len(x) - window + 1` Rows to Write the Result to, defaults to None
+    :type out: np.ndarray, optional
+    :raises ValueError: Window is not between 1 and the Number of Values
+    :return: Average of each Full Window
+    :rtype: np.ndarray
+    """
+
+    x = np.asarray(x, dtype=float)
+    if not 1 <= window <= x.shape[0]: raise ValueError(f"Window must be between 1 and {x.shape[0]}")
+
+    # Differences of the Running Sum are the Window Sums
+    total = np.cumsum(x, axis=0)
+    if out is None: out = np.empty((x.shape[0] - window + 1,) + x.shape[1:])
+
+    out[0] = total[window - 1]
+    np.subtract(total[window:], total[:-window], out=out[1:])
+    out /= window
+
+    return out
+
+# Normalize Function
+def normalize(x:ArrayLike, method:str = "zscore", axis:int = None, out:np.ndarray = None) -> np.ndarray:
+    """Normalize Values with a Z-Score or to the Range 0 to 1
+
+    :param x: Values to Normalize
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list]
+    :param method: `zscore` or `minmax`, defaults to "zscore"
+    :type method: str, optional
+    :param axis: Axis the Statistics are Taken along, `None` Uses Everything, defaults to None
+    :type axis: int, optional
+    :param out: Array to Write the Result to, `x` Computes in Place, defaults to None
+    :type out: np.ndarray, optional
+    :raises ValueError: Unknown Method
+    :return: Normalized Values, Constant Values become 0
+    :rtype: np.ndarray
+    """
+
+    x = np.asarray(x, dtype=float)
+
+    if method == "zscore":
+        center = np.mean(x, axis=axis, keepdims=True)
+        scale = np.std(x, axis=axis, keepdims=True)
+    elif method == "minmax":
+        center = np.min(x, axis=axis, keepdims=True)
+        scale = np.max(x, axis=axis, keepdims=True) - center
+    else:
+        raise ValueError(f"Unknown Method: {method}")
+
+    # Constant Values do not Divide by 0
+    scale[scale == 0] = 1.0
+
+    out = np.subtract(x, center, out=out)
+    out /= scale
+
+    return out
+
 # Average Function
-def average(x:list) -> Union[int,float]:
-    """Average Value of a List
+def average(x:ArrayLike, axis:int = None, weights:ArrayLike = None, skipna:bool = False, chunkSize:int = None) -> Union[float, np.ndarray]:
+    """Average Value of a List or Array
 
     :param x: Values to find the Average
-    :type x: list
+    :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list]
+    :param axis: Axis to Average along, `None` Averages Everything, defaults to None
+    :type axis: int, optional
+    :param weights: Weight of each Value, Shaped like `x` or along `axis`, defaults to None
+    :type weights: Union[np.ndarray,list], optional
+    :param skipna: `True` ignores NaN Values, defaults to False
+    :type skipna: bool, optional
+    :param chunkSize: Rows Summed at a Time along the First Axis, for Memory-Mapped Arrays Larger than RAM, defaults to None
+    :type chunkSize: int, optional
+    :raises ValueError: Chunks with an Axis other than `None` or `0`
     :return: Average Value
-    :rtype: Union[int,float]
+    :rtype: Union[float, np.ndarray]
     """
-    
+
+    x = np.asarray(x, dtype=float) if isPandas(x) or isinstance(x, (list, tuple)) else np.asarray(x)
+    if weights is not None: weights = np.asarray(weights, dtype=float)
+
     # Calculate Average
-    return sum(x)/len(x)
-    
-    
\ No newline at end of file
+    if chunkSize is None: return _average(x, axis, weights, skipna)
+
+    if axis not in (None, 0): raise ValueError("Chunked Averages are along Axis None or 0")
+
+    # Running Weighted Sum and Total Weight over the Chunks
+    total = 0.0
+    count = 0.0
+    for start in range(0, x.shape[0], chunkSize):
+        chunk = np.asarray(x[start:start + chunkSize], dtype=float)
+
+        if weights is None: w = np.ones_like(chunk)
+        elif weights.ndim == 1 and x.ndim > 1 and axis == 0: w = np.broadcast_to(weights[start:start + chunkSize].reshape((-1,) + (1,) * (x.ndim - 1)), chunk.shape)
+        else: w = np.broadcast_to(weights[start:start + chunkSize], chunk.shape)
+
+        # Missing Values Carry no Weight
+        if skipna:
+            missing = np.isnan(chunk)
+            chunk = np.where(missing, 0.0, chunk)
+            w = np.where(missing, 0.0, w)
+
+        total = total + np.sum(chunk * w, axis=axis)
+        count = count + np.sum(w, axis=axis)
+
+    return total / count
+
+# Average Kernel
+def _average(x:np.ndarray, axis:int, weights:np.ndarray, skipna:bool) -> Union[float, np.ndarray]:
+    """Average of an Array Held in Memory
+
+    :param x: Values to find the Average
+    :type x: np.ndarray
+    :param axis: Axis to Average along
+    :type axis: int
+    :param weights: Weight of each Value
+    :type weights: np.ndarray
+    :param skipna: `True` ignores NaN Values
+    :type skipna: bool
+    :return: Average Value
+    :rtype: Union[float, np.ndarray]
+    """
+
+    if not skipna: return np.average(x, axis=axis, weights=weights)
+
+    if weights is None: return np.nanmean(x, axis=axis)
+
+    # Masked Values Carry no Weight
+    return np.ma.filled(np.ma.average(np.ma.masked_invalid(x), axis=axis, weights=weights), np.nan)
+
+# Online Statistics
+class RunningStats:
+    def __init__(self, compression:int = 200) -> None:
+        """Mergeable One-Pass Statistics: Count, Mean, Variance, Min, Max and Approximate Quantiles
+
+        Mean and variance follow Welford/Chan updates, quantiles come from a merging t-digest of at most about `compression` centroids, so memory stays constant whatever the number of values.
+        Accumulators are not locked: give each thread or process its own and `merge` them.
+
+        :param compression: Size of the Quantile Digest, Larger is more Accurate, defaults to 200
+        :type compression: int, optional
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._m2 = 0.0
+        self._compression = compression
+
+        # Centroids of the Digest and (Means, Weights) Pairs Waiting to be Merged into it
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer = []
+        self._buffered = 0
+
+    def update(self, x:ArrayLike) -> "RunningStats":
+        """Add a Value or a Batch of Values, NaN Values are Ignored
+
+        :param x: Value(s) to Add
+        :type x: Union[pd.DataFrame,pd.Series,np.ndarray,list,int,float]
+        :return: The Accumulator
+        :rtype: RunningStats
+        """
+
+        values = np.asarray(x, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0: return self
+
+        # Statistics of the Batch
+        mean = float(values.mean())
+        self._combine(values.size, mean, float(np.square(values - mean).sum()), values.min(), values.max())
+
+        # Every Value is a Centroid of Weight 1 until the Digest is Compressed
+        self._push(values, np.ones(values.size))
+
+        return self
+
+    def merge(self, other:"RunningStats") -> "RunningStats":
+        """Add the Values of another Accumulator, such as one from another Thread or Process
+
+        :param other: Accumulator to Merge
+        :type other: RunningStats
+        :return: The Accumulator
+        :rtype: RunningStats
+        """
+
+        if other.count == 0: return self
+
+        self._combine(other.count, other.mean, other._m2, other.min, other.max)
+
+        other._compress()
+        self._push(other._means, other._weights)
+
+        return self
+
+    def quantile(self, q:Union[float, list, np.ndarray]) -> Union[float, np.ndarray]:
+        """Approximate Quantile(s) of the Values
+
+        :param q: Quantile(s) between 0 and 1
+        :type q: Union[float, list, np.ndarray]
+        :return: Quantile Value(s), NaN when there are no Values
+        :rtype: Union[float, np.ndarray]
+        """
+
+        self._compress()
+        if self.count == 0: return np.interp(q, [0, 1], [np.nan, np.nan])
+
+        # Centroids sit at the Middle of their Weight, the Extremes are Exact
+        centers = (np.cumsum(self._weights) - self._weights / 2) / self.count
+        return np.interp(q, np.concatenate(([0.0], centers, [1.0])), np.concatenate(([self.min], self._means, [self.max])))
+
+    @property
+    def variance(self) -> float:
+        """Population Variance of the Values
+
+        :return: Variance, NaN when there are no Values
+        :rtype: float
+        """
+        return self._m2 / self.count if self.count else math.nan
+
+    @property
+    def std(self) -> float:
+        """Population Standard Deviation of the Values
+
+        :return: Standard Deviation, NaN when there are no Values
+        :rtype: float
+        """
+        return math.sqrt(self.variance)
+
+    def summary(self) -> dict:
+        """Statistics of the Values
+
+        :return: `count`, `mean`, `std`, `min`, `p50`, `p95`, `p99` and `max`
+        :rtype: dict
+        """
+        if self.count == 0: return {"count":0, "mean":math.nan, "std":math.nan, "min":math.nan, "p50":math.nan, "p95":math.nan, "p99":math.nan, "max":math.nan}
+
+        p50, p95, p99 = self.quantile([0.5, 0.95, 0.99])
+        return {"count":self.count, "mean":self.mean, "std":self.std, "min":self.min, "p50":float(p50), "p95":float(p95), "p99":float(p99), "max":self.max}
+
+    def _combine(self, count:int, mean:float, m2:float, low:float, high:float) -> None:
+        """Chan's Parallel Update of Count, Mean, Variance, Min and Max
+
+        :param count: Number of Values Added
+        :type count: int
+        :param mean: Mean of the Values Added
+        :type mean: float
+        :param m2: Sum of Squared Deviations of the Values Added
+        :type m2: float
+        :param low: Minimum of the Values Added
+        :type low: float
+        :param high: Maximum of the Values Added
+        :type high: float
+        """
+
+        total = self.count + count
+        delta = mean - self.mean
+
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = min(self.min, float(low))
+        self.max = max(self.max, float(high))
+
+    def _push(self, means:np.ndarray, weights:np.ndarray) -> None:
+        """Queue Centroids for the Digest, Compressing when the Queue is Full
+
+        :param means: Means of the Centroids
+        :type means: np.ndarray
+        :param weights: Weights of the Centroids
+        :type weights: np.ndarray
+        """
+
+        self._buffer.append((means, weights))
+        self._buffered += means.size
+
+        if self._buffered > 10 * self._compression: self._compress()
+
+    def _compress(self) -> None:
+        """Merge the Queued Centroids into the Digest
+
+        Sorted centroids are grouped by the integer part of the t-digest scale k(q) = compression / 2π · asin(2q - 1), which keeps centroids small near the tails.
+        """
+
+        if not self._buffer: return
+
+        means = np.concatenate([self._means] + [m for m, _ in self._buffer])
+        weights = np.concatenate([self._weights] + [w for _, w in self._buffer])
+        self._buffer = []
+        self._buffered = 0
+
+        order = np.argsort(means, kind="stable")
+        means = means[order]
+        weights = weights[order]
+
+        # Scale of each Centroid
+        q = (np.cumsum(weights) - weights / 2) / weights.sum()
+        k = np.floor(self._compression / (2 * math.pi) * np.arcsin(2 * q - 1))
+
+        # Centroids with the Same Integer Scale are Merged
+        starts = np.flatnonzero(np.concatenate(([True], k[1:] != k[:-1])))
+        self._weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / self._weights
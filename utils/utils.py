@@ -1,9 +1,109 @@
-import pathlib
+import pathlib, sys, os, types, functools, threading, importlib, importlib.util
 
 __all__ = [
     "LOCAL_DIRECTORY"
+    , "LazyModule"
+    , "isInstalled"
+    , "isPandas"
+    , "IO_WORKERS"
+    , "ioExecutor"
+    , "offload"
 ]
 
 
 # Local Directory Current Path
-LOCAL_DIRECTORY = pathlib.Path().resolve()
\ No newline at end of file
+LOCAL_DIRECTORY = pathlib.Path().resolve()
+
+# Module Imported on First Use
+class LazyModule(types.ModuleType):
+    def __init__(self, name:str) -> None:
+        """Stand-in for a Module that is only Imported when one of its Attributes is First Used
+
+        Heavy dependencies (pandas, numpy, joblib) are bound to a `LazyModule` so `import utils` stays cheap.
+
+        :param name: Full Name of the Module
+        :type name: str
+        """
+        super().__init__(name)
+
+    def __getattr__(self, attr:str):
+        """Import the Module and Copy its Namespace, so Later Lookups Skip this Method
+
+        :param attr: Attribute of the Module
+        :type attr: str
+        :raises AttributeError: Module has no such Attribute
+        :return: Attribute of the Module
+        """
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+def isInstalled(name:str) -> bool:
+    """Check a Module can be Imported, without Importing it
+
+    :param name: Full Name of the Module
+    :type name: str
+    :return: `True` when the Module is Importable
+    :rtype: bool
+    """
+    if name in sys.modules: return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def isPandas(value) -> bool:
+    """Check for a pandas DataFrame or Series, without Importing pandas
+
+    :param value: Any Value
+    :type value: Any
+    :return: `True` for a DataFrame or Series
+    :rtype: bool
+    """
+    # No pandas Object can Exist before pandas is Imported
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(value, (pandas.DataFrame, pandas.Series))
+
+# Threads of the Shared Executor Running Blocking I/O for the `async` Methods
+IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Shared Executor and the Number of Threads it was Created with
+_EXECUTOR = None
+_EXECUTOR_WORKERS = None
+_EXECUTOR_LOCK = threading.Lock()
+
+def ioExecutor(workers:int = None) -> "ThreadPoolExecutor":
+    """Shared Executor Bounding the Blocking I/O Offloaded from the Event Loop
+
+    :param workers: Number of Threads, Replaces the Executor when it Differs, defaults to IO_WORKERS
+    :type workers: int, optional
+    :raises ValueError: Number of Threads is not Positive
+    :return: Shared Executor
+    :rtype: ThreadPoolExecutor
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    from concurrent.futures import ThreadPoolExecutor
+
+    if workers is not None and workers < 1: raise ValueError("Workers must be Positive")
+
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or (workers is not None and workers != _EXECUTOR_WORKERS):
+            # Running Tasks of a Replaced Executor Finish in the Background
+            if _EXECUTOR is not None: _EXECUTOR.shutdown(wait=False)
+            _EXECUTOR_WORKERS = workers or IO_WORKERS
+            _EXECUTOR = ThreadPoolExecutor(max_workers=_EXECUTOR_WORKERS, thread_name_prefix="utils-io")
+        return _EXECUTOR
+
+async def offload(function, *args, **kwargs):
+    """Run a Blocking Function on the Shared Executor without Blocking the Event Loop
+
+    :param function: Blocking Function
+    :type function: Callable
+    :return: Result of the Function
+    :rtype: Any
+    """
+    import asyncio
+    return await asyncio.get_running_loop().run_in_executor(ioExecutor(), functools.partial(function, *args, **kwargs))
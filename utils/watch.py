@@ -0,0 +1,536 @@
+# Module Documentation
+"""
+Folder Watcher: Debounced File System Events from inotify, watchdog or Polling.
+"""
+
+# Imported Modules
+import os, sys, time, queue, select, struct, threading, collections, contextlib
+from typing import Iterable, Iterator, AsyncIterator
+from .utils import isInstalled
+
+__all__ = [
+    "Event"
+    , "Watcher"
+    , "WATCH_BACKENDS"
+]
+
+# File System Event: `created`, `modified` or `deleted`, the Directory, and `True` for a Folder
+# An `overflow` Event on the Watched Folder Reports Lost Events, the Folder may have Changed Anywhere
+Event = collections.namedtuple("Event", ["type", "path", "isFolder"])
+
+# Backends by Preference: Kernel Events on Linux, watchdog on Other Systems, then Polling
+WATCH_BACKENDS = ("inotify", "watchdog", "polling")
+
+# Longest Delay of a Batch under a Continuous Stream of Events, in Debounce Periods
+MAX_DELAY_FACTOR = 10
+
+# Sentinel Queued when the Watcher Closes
+_CLOSED = object()
+
+# inotify Event Masks, from `<sys/inotify.h>`
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_MOVE_SELF | _IN_ONLYDIR
+
+# Header of an inotify Event: Watch, Mask, Cookie and Name Length
+_IN_HEADER = struct.Struct("iIII")
+
+class _Coalescer:
+    def __init__(self) -> None:
+        """Events of a Batch Grouped by Path
+
+        Repeated events collapse into one and a `modified` after a `created` is dropped, but a `created` then `deleted` pair is kept, so short-lived files are still seen.
+        """
+        self._events = collections.OrderedDict()
+
+    def add(self, event:Event) -> None:
+        """Add an Event to the Batch, Dropping it when it Repeats the Last Event of its Path
+
+        :param event: Event from the Backend
+        :type event: Event
+        """
+        events = self._events.setdefault(event.path, [])
+        if events:
+            last = events[-1].type
+            if last == event.type or (last == "created" and event.type == "modified"): return
+        events.append(event)
+
+    def drain(self) -> list:
+        """Take the Events of the Batch and Start a New One
+
+        :return: Events Grouped by Path, Paths in the Order they were First Seen
+        :rtype: list[Event]
+        """
+        events = [event for events in self._events.values() for event in events]
+        self._events.clear()
+        return events
+
+    def __bool__(self) -> bool:
+        """Checks the Batch has Events
+
+        :return: `True` when Events are Waiting to be Drained
+        :rtype: bool
+        """
+        return bool(self._events)
+
+class _Inotify:
+    def __init__(self, directory:str, recursive:bool, push) -> None:
+        """Linux Kernel Events through a ctypes Binding of inotify
+
+        :param directory: Directory of the Watched Folder
+        :type directory: str
+        :param recursive: `True` watches every Sub Folder, including New Ones
+        :type recursive: bool
+        :param push: Called with each Event
+        :type push: Callable
+        :raises OSError: inotify is not Available or the Folder cannot be Watched
+        """
+        import ctypes, ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        self._directory = directory
+        self._recursive = recursive
+        self._push = push
+
+        # Folder of each Watch, and Folders Moved Away Waiting for their Destination
+        self._paths = {}
+        self._moves = {}
+
+        # Pipe Waking the Reader Thread on Close
+        self._wake, self._waker = os.pipe()
+
+        try:
+            self._watch(directory, False)
+        except OSError:
+            for fd in (self._fd, self._wake, self._waker): os.close(fd)
+            raise
+        self._thread = threading.Thread(target=self._run, name="utils-watch", daemon=True)
+        self._thread.start()
+
+    def _watch(self, directory:str, report:bool) -> None:
+        """Watch a Folder, and its Sub Folders when Recursive
+
+        :param directory: Directory of the Folder
+        :type directory: str
+        :param report: `True` reports the Content Found, Created before the Watch was Added
+        :type report: bool
+        :raises OSError: The Watched Folder itself could not be Watched
+        """
+        import ctypes
+
+        stack = [directory]
+        while stack:
+            folder = stack.pop()
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), _IN_MASK)
+            if wd < 0:
+                # Sub Folders Removed before their Watch are Skipped, the Watched Folder must be Watched
+                if folder != self._directory: continue
+                error = ctypes.get_errno()
+                raise OSError(error, os.strerror(error), folder)
+            self._paths[wd] = folder
+            if not self._recursive and not report: continue
+
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        isFolder = entry.is_dir(follow_symlinks=False)
+                        if report: self._push("created", entry.path, isFolder)
+                        if isFolder and self._recursive: stack.append(entry.path)
+            except OSError:
+                continue
+
+    def _run(self) -> None:
+        """Read Events until Closed, Sleeping in `select` while Idle"""
+        while True:
+            readable, _, _ = select.select([self._fd, self._wake], [], [])
+            if self._wake in readable: return
+
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = _IN_HEADER.unpack_from(data, offset)
+                name = data[offset + _IN_HEADER.size:offset + _IN_HEADER.size + length].rstrip(b"\0")
+                offset += _IN_HEADER.size + length
+                self._handle(wd, mask, cookie, os.fsdecode(name))
+
+            # Folders Moved Away without a Destination in the Batch Left the Tree
+            for moved in self._moves.values():
+                for key, value in list(self._paths.items()):
+                    if value == moved or value.startswith(moved + "/"):
+                        self._libc.inotify_rm_watch(self._fd, key)
+                        del self._paths[key]
+            self._moves.clear()
+
+    def _handle(self, wd:int, mask:int, cookie:int, name:str) -> None:
+        """Turn one inotify Event into Events of the Watcher"""
+
+        if mask & _IN_Q_OVERFLOW:
+            # The Kernel Queue was Full and Events were Lost
+            self._push("overflow", self._directory, True)
+            return
+
+        if mask & _IN_IGNORED:
+            self._paths.pop(wd, None)
+            return
+
+        folder = self._paths.get(wd)
+        if folder is None: return
+        path = f"{folder}/{name}" if name else folder
+        isFolder = bool(mask & _IN_ISDIR)
+
+        if mask & _IN_MOVE_SELF:
+            # Folder Moved out of the Tree
+            if not os.path.isdir(folder): self._libc.inotify_rm_watch(self._fd, wd)
+
+        elif mask & (_IN_CREATE | _IN_MOVED_TO):
+            moved = self._moves.pop(cookie, None) if mask & _IN_MOVED_TO else None
+            self._push("created", path, isFolder)
+
+            if isFolder and self._recursive:
+                # Watches of a Folder Moved inside the Tree Follow its New Path
+                if moved is not None:
+                    for key, value in list(self._paths.items()):
+                        if value == moved or value.startswith(moved + "/"): self._paths[key] = path + value[len(moved):]
+                else:
+                    self._watch(path, True)
+
+        elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+            if mask & _IN_MOVED_FROM and isFolder: self._moves[cookie] = path
+            self._push("deleted", path, isFolder)
+
+        elif mask & (_IN_MODIFY | _IN_CLOSE_WRITE):
+            self._push("modified", path, isFolder)
+
+    def close(self) -> None:
+        """Wake and Join the Reader Thread, then Close the inotify Instance and the Pipe"""
+        os.write(self._waker, b"\0")
+        self._thread.join()
+        for fd in (self._fd, self._wake, self._waker): os.close(fd)
+
+class _Watchdog:
+    def __init__(self, directory:str, recursive:bool, push) -> None:
+        """Events of the watchdog Package, for Systems without inotify
+
+        Moves are reported as a `deleted` Event of the Source and a `created` Event of the Destination.
+
+        :param directory: Directory of the Watched Folder
+        :type directory: str
+        :param recursive: `True` watches every Sub Folder
+        :type recursive: bool
+        :param push: Called with each Event
+        :type push: Callable
+        :raises OSError: The Observer could not Start
+        """
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                if event.event_type == "moved":
+                    push("deleted", os.fsdecode(event.src_path), event.is_directory)
+                    push("created", os.fsdecode(event.dest_path), event.is_directory)
+                elif event.event_type in ("created", "modified", "deleted"):
+                    push(event.event_type, os.fsdecode(event.src_path), event.is_directory)
+
+        self._observer = Observer()
+        self._observer.schedule(Handler(), directory, recursive=recursive)
+        self._observer.start()
+
+    def close(self) -> None:
+        """Stop and Join the Observer Thread"""
+        self._observer.stop()
+        self._observer.join()
+
+class _Polling:
+    def __init__(self, directory:str, recursive:bool, push, interval:float) -> None:
+        """Events Found by Comparing Snapshots of the Folder, where no Event Source Exists
+
+        Files Created and Deleted between two Snapshots are not Seen.
+
+        :param directory: Directory of the Watched Folder
+        :type directory: str
+        :param recursive: `True` watches every Sub Folder
+        :type recursive: bool
+        :param push: Called with each Event
+        :type push: Callable
+        :param interval: Seconds between Snapshots
+        :type interval: float
+        """
+        self._directory = directory
+        self._recursive = recursive
+        self._push = push
+        self._interval = interval
+        self._stop = threading.Event()
+        self._snapshot = self._scan()
+        self._thread = threading.Thread(target=self._run, name="utils-watch", daemon=True)
+        self._thread.start()
+
+    def _scan(self) -> dict:
+        """Snapshot of the Folder, Entries Removed during the Scan are Skipped
+
+        :return: `(isFolder, mtime_ns, size)` by Directory
+        :rtype: dict
+        """
+        snapshot = {}
+        stack = [self._directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            status = entry.stat(follow_symlinks=False)
+                        except FileNotFoundError:
+                            continue
+                        isFolder = entry.is_dir(follow_symlinks=False)
+                        snapshot[entry.path] = (isFolder, status.st_mtime_ns, status.st_size)
+                        if isFolder and self._recursive: stack.append(entry.path)
+            except OSError:
+                continue
+        return snapshot
+
+    def _run(self) -> None:
+        """Compare a New Snapshot with the Previous One every Interval until Closed"""
+        while not self._stop.wait(self._interval):
+            snapshot = self._scan()
+            for path, (isFolder, mtime, size) in snapshot.items():
+                previous = self._snapshot.get(path)
+                if previous is None: self._push("created", path, isFolder)
+                elif not isFolder and previous[1:] != (mtime, size): self._push("modified", path, isFolder)
+            for path, (isFolder, _, _) in self._snapshot.items():
+                if path not in snapshot: self._push("deleted", path, isFolder)
+            self._snapshot = snapshot
+
+    def close(self) -> None:
+        """Stop and Join the Snapshot Thread"""
+        self._stop.set()
+        self._thread.join()
+
+# Watcher of a Folder
+class Watcher:
+    def __init__(self, directory:str, recursive:bool = True, extensions:Iterable[str] = None, debounce:float = 0.05, backend:str = None, interval:float = 0.5) -> None:
+        """Debounced File System Events of a Folder
+
+        Events arriving within `debounce` seconds of each other are coalesced into one batch.
+
+        :param directory: Directory of the Watched Folder
+        :type directory: str
+        :param recursive: `True` watches the Sub Folders, defaults to True
+        :type recursive: bool, optional
+        :param extensions: File Extensions to Report, Folders are not Reported when Set; `overflow` Events are Always Reported, defaults to None
+        :type extensions: Iterable[str], optional
+        :param debounce: Quiet Seconds Ending a Batch of Events, defaults to 0.05
+        :type debounce: float, optional
+        :param backend: Backend from `WATCH_BACKENDS`, defaults to the First Available
+        :type backend: str, optional
+        :param interval: Seconds between Snapshots of the `polling` Backend, defaults to 0.5
+        :type interval: float, optional
+        :raises ValueError: Unknown Backend or No Directory
+        """
+
+        if backend is not None and backend not in WATCH_BACKENDS: raise ValueError(f"Unknown Watch Backend: {backend}")
+        if not os.path.isdir(directory): raise ValueError("Directory Does Not Exists")
+
+        self.directory = directory.rstrip("/") or "/"
+        self.debounce = debounce
+        self._extensions = None if extensions is None else {e.lstrip(".") for e in extensions}
+        self._queue = queue.Queue()
+        self._waiters = []
+        self._closed = False
+
+        # First Backend that Starts
+        for name in (WATCH_BACKENDS if backend is None else (backend,)):
+            try:
+                if name == "inotify":
+                    if not sys.platform.startswith("linux"): continue
+                    self._backend = _Inotify(self.directory, recursive, self._push)
+                elif name == "watchdog":
+                    if not isInstalled("watchdog"): continue
+                    self._backend = _Watchdog(self.directory, recursive, self._push)
+                else:
+                    self._backend = _Polling(self.directory, recursive, self._push, interval)
+            except (OSError, AttributeError):
+                # The Requested Backend must Start
+                if backend is not None: raise
+                continue
+            self.backend = name
+            break
+        else:
+            raise ValueError(f"Watch Backend is not Available: {backend}")
+
+    def _push(self, kind:str, path:str, isFolder:bool) -> None:
+        """Queue an Event from the Backend Thread, Waking the Async Readers
+
+        :param kind: `created`, `modified`, `deleted` or `overflow`
+        :type kind: str
+        :param path: Directory of the Changed Entry
+        :type path: str
+        :param isFolder: `True` for a Folder
+        :type isFolder: bool
+        """
+
+        # Lost Events are Reported whatever the Filters
+        if kind != "overflow" and self._extensions is not None and (isFolder or path.rsplit(".", 1)[-1] not in self._extensions): return
+
+        self._queue.put(Event(kind, path, isFolder))
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wake the Async Readers, whose Loops may have Closed"""
+        for loop, ready in list(self._waiters):
+            with contextlib.suppress(RuntimeError): loop.call_soon_threadsafe(ready.set)
+
+    def get(self, timeout:float = None) -> list:
+        """Next Batch of Coalesced Events
+
+        :param timeout: Seconds to Wait for a First Event, `None` Waits until one Arrives, defaults to None
+        :type timeout: float, optional
+        :return: Events of the Batch, Empty on Timeout or once Closed
+        :rtype: list[Event]
+        """
+
+        coalescer = _Coalescer()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        first = None
+
+        while True:
+            now = time.monotonic()
+
+            # Wait for a First Event, then for a Quiet Period
+            if first is None:
+                wait = None if deadline is None else max(deadline - now, 0)
+            else:
+                wait = max(min(self.debounce, first + self.debounce * MAX_DELAY_FACTOR - now), 0)
+
+            try:
+                event = self._queue.get(timeout=wait)
+            except queue.Empty:
+                return coalescer.drain()
+
+            if event is _CLOSED:
+                # Other Readers are Woken Too
+                self._queue.put(_CLOSED)
+                return coalescer.drain()
+
+            coalescer.add(event)
+            if first is None: first = time.monotonic()
+
+    async def aget(self, timeout:float = None) -> list:
+        """Next Batch of Coalesced Events, Awaited without Blocking the Event Loop
+
+        :param timeout: Seconds to Wait for a First Event, `None` Waits until one Arrives, defaults to None
+        :type timeout: float, optional
+        :return: Events of the Batch, Empty on Timeout or once Closed
+        :rtype: list[Event]
+        """
+        import asyncio
+
+        ready = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), ready)
+        self._waiters.append(waiter)
+
+        coalescer = _Coalescer()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        first = last = None
+
+        try:
+            while True:
+                ready.clear()
+
+                # Take the Queued Events without Waiting
+                while True:
+                    try:
+                        event = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if event is _CLOSED:
+                        self._queue.put(_CLOSED)
+                        return coalescer.drain()
+                    coalescer.add(event)
+                    last = time.monotonic()
+                    if first is None: first = last
+
+                now = time.monotonic()
+                if first is None:
+                    wait = None if deadline is None else deadline - now
+                else:
+                    wait = min(last + self.debounce, first + self.debounce * MAX_DELAY_FACTOR) - now
+                if wait is not None and wait <= 0: return coalescer.drain()
+
+                try:
+                    await asyncio.wait_for(ready.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiters.remove(waiter)
+
+    def __iter__(self) -> Iterator[Event]:
+        """Events One at a Time, Blocking between Batches until the Watcher is Closed
+
+        :return: Coalesced Events
+        :rtype: Iterator[Event]
+        """
+        while True:
+            batch = self.get()
+            if not batch and self._closed: return
+            yield from batch
+
+    async def __aiter__(self) -> AsyncIterator[Event]:
+        """Events One at a Time, Awaited without Blocking the Event Loop until the Watcher is Closed
+
+        :return: Coalesced Events
+        :rtype: AsyncIterator[Event]
+        """
+        while True:
+            batch = await self.aget()
+            if not batch and self._closed: return
+            for event in batch: yield event
+
+    @property
+    def closed(self) -> bool:
+        """Checks the Watcher was Closed
+
+        :return: `True` once `close` was Called
+        :rtype: bool
+        """
+        return self._closed
+
+    def close(self) -> None:
+        """Stop the Backend and End the Iterators
+
+        Readers Waiting in `get` or `aget` Return the Events of their Batch; Closing Twice does Nothing.
+        """
+        if self._closed: return
+        self._closed = True
+        self._backend.close()
+        self._queue.put(_CLOSED)
+        self._wake()
+
+    def __enter__(self) -> "Watcher":
+        """
+        Returns the Started Watcher
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Closes the Watcher
+        """
+        self.close()